@@ -0,0 +1,7 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           benchmarks/__init__.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
@@ -0,0 +1,300 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           benchmarks/run.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+"""
+Run the benchmark workloads, and report import time, build time, HTML time, peak RSS and HTML bytes.
+
+Each run of a workload happens in a fresh interpreter, so that peak RSS is not shared between
+workloads, and the best of the repeated runs is reported.
+
+    python -m benchmarks.run
+    python -m benchmarks.run scatter polyline --scale 0.1
+    python -m benchmarks.run --json > baseline.json
+    python -m benchmarks.run --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Optional
+
+######################################################################################################################################################
+
+# Relative increase over the baseline reported as a regression
+DEFAULT_THRESHOLD: float = 0.2
+
+# Time differences below this are regarded as noise, in seconds
+MIN_TIME_DELTA: float = 0.01
+
+METRICS: list[str] = [
+    "import_time",
+    "build_time",
+    "html_time",
+    "peak_rss",
+    "html_bytes",
+]
+
+######################################################################################################################################################
+
+
+def measure(name: str, size: int) -> dict:
+
+    """
+    Run the workload in this process, and return its measurements.
+    """
+
+    # first import of cesiumpy in this interpreter
+    start: float = time.perf_counter()
+    import cesiumpy  # noqa
+    import_time: float = time.perf_counter() - start
+
+    from benchmarks.workloads import WORKLOADS
+
+    workload = WORKLOADS[name]
+
+    if (workload.requires is not None) and (
+        importlib.util.find_spec(workload.requires) is None
+    ):
+        return {"name": name, "size": size, "skipped": f"{workload.requires} missing"}
+
+    inputs: dict = workload.setup(size)
+
+    start = time.perf_counter()
+    viewer = workload.build(inputs)
+    build_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    html: str = viewer.to_html()
+    html_time: float = time.perf_counter() - start
+
+    return {
+        "name": name,
+        "size": size,
+        "import_time": import_time,
+        "build_time": build_time,
+        "html_time": html_time,
+        "peak_rss": _peak_rss(),
+        "html_bytes": len(html.encode("utf-8")),
+    }
+
+
+def run(name: str, size: int, repeat: int = 3) -> dict:
+
+    """
+    Run the workload repeat times in subprocesses, and return the best measurements.
+    """
+
+    results: list[dict] = []
+
+    for _ in range(repeat):
+
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--worker", name, str(size)],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+
+        result: dict = json.loads(output.stdout.splitlines()[-1])
+
+        if "skipped" in result:
+            return result
+
+        results.append(result)
+
+    return {
+        "name": name,
+        "size": size,
+        **{metric: min(result[metric] for result in results) for metric in METRICS},
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+
+    """
+    Return descriptions of the metrics increased by more than threshold over the baseline.
+    """
+
+    references: dict[tuple[str, int], dict] = {
+        (result["name"], result["size"]): result for result in baseline
+    }
+
+    regressions: list[str] = []
+
+    for result in results:
+
+        reference: Optional[dict] = references.get((result["name"], result["size"]))
+
+        if (reference is None) or ("skipped" in result) or ("skipped" in reference):
+            continue
+
+        for metric in METRICS:
+            if metric.endswith("_time") and (
+                result[metric] - reference[metric] < MIN_TIME_DELTA
+            ):
+                continue
+            if result[metric] > reference[metric] * (1.0 + threshold):
+                regressions.append(
+                    "{name}: {metric} {value} > {reference}".format(
+                        name=result["name"],
+                        metric=metric,
+                        value=_format(metric, result[metric]),
+                        reference=_format(metric, reference[metric]),
+                    )
+                )
+
+    return regressions
+
+
+def format_table(results: list[dict]) -> str:
+
+    header: list[str] = ["workload", "size", "import", "build", "html", "peak rss", "html size"]
+
+    rows: list[list[str]] = [header]
+
+    for result in results:
+        if "skipped" in result:
+            rows.append(
+                [result["name"], str(result["size"]), f"skipped ({result['skipped']})"]
+            )
+        else:
+            rows.append(
+                [result["name"], str(result["size"])]
+                + [_format(metric, result[metric]) for metric in METRICS]
+            )
+
+    widths: list[int] = [
+        max(len(row[index]) for row in rows if index < len(row))
+        for index in range(len(header))
+    ]
+
+    buffer = io.StringIO()
+
+    for row in rows:
+        buffer.write(
+            "  ".join(cell.ljust(width) for (cell, width) in zip(row, widths)).rstrip()
+        )
+        buffer.write("\n")
+
+    return buffer.getvalue()
+
+
+######################################################################################################################################################
+
+
+def _peak_rss() -> int:
+
+    """
+    Return peak resident set size of this process, in bytes.
+    """
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _format(metric: str, value: float) -> str:
+
+    if metric.endswith("_time"):
+        return f"{value:.3f} s"
+
+    return f"{value / 2 ** 20:.1f} MB"
+
+
+######################################################################################################################################################
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Run cesiumpy benchmarks.",
+    )
+    parser.add_argument(
+        "workloads",
+        nargs="*",
+        help="workloads to run, all by default",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="factor applied to workload sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per workload")
+    parser.add_argument(
+        "--json", action="store_true", help="write results as JSON to stdout"
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH", help="JSON results to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative increase reported as a regression",
+    )
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        print(json.dumps(measure(args.worker[0], int(args.worker[1]))))
+        return 0
+
+    # imported after the worker branch, so that workers measure the first import of cesiumpy
+    from benchmarks.workloads import WORKLOADS
+
+    for name in args.workloads:
+        if name not in WORKLOADS:
+            parser.error(
+                "unknown workload: {name}, choose from {names}".format(
+                    name=name, names=", ".join(WORKLOADS)
+                )
+            )
+
+    results: list[dict] = []
+
+    for name in args.workloads or list(WORKLOADS):
+
+        size: int = max(1, int(WORKLOADS[name].size * args.scale))
+
+        results.append(run(name, size, repeat=args.repeat))
+
+        if not args.json:
+            print(f"{name}: done", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results), end="")
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as f:
+        regressions: list[str] = compare(results, json.load(f), args.threshold)
+
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+######################################################################################################################################################
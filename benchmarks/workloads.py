@@ -0,0 +1,331 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           benchmarks/workloads.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import tempfile
+from typing import Callable, Optional
+
+import numpy as np
+
+import cesiumpy
+
+######################################################################################################################################################
+
+# Fixed seed, so that every run builds the very same scenes
+SEED: int = 0
+
+EPOCH: datetime = datetime(2022, 1, 1, 0, 0, 0, 0, timezone.utc)
+
+######################################################################################################################################################
+
+
+class Workload:
+
+    """
+    Synthetic benchmark workload.
+
+    setup: Build the inputs of size n, not measured.
+    build: Build the viewer from the inputs, measured as build time.
+    """
+
+    # Constructor
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        build: Callable[..., cesiumpy.Viewer],
+        setup: Optional[Callable[[int], dict]] = None,
+        requires: Optional[str] = None,
+    ) -> None:
+
+        self._name: str = name
+        self._size: int = size
+        self._build: Callable[..., cesiumpy.Viewer] = build
+        self._setup: Optional[Callable[[int], dict]] = setup
+        self._requires: Optional[str] = requires
+
+    # Properties
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def requires(self) -> Optional[str]:
+        return self._requires
+
+    # Methods
+
+    def setup(self, size: int) -> dict:
+        return self._setup(size) if self._setup is not None else {"size": size}
+
+    def build(self, inputs: dict) -> cesiumpy.Viewer:
+        return self._build(**inputs)
+
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+def workload(
+    name: str,
+    size: int,
+    setup: Optional[Callable[[int], dict]] = None,
+    requires: Optional[str] = None,
+) -> Callable:
+
+    """
+    Register the decorated build function as a workload.
+    """
+
+    def register(build: Callable[..., cesiumpy.Viewer]) -> Callable:
+        WORKLOADS[name] = Workload(name, size, build, setup=setup, requires=requires)
+        return build
+
+    return register
+
+
+######################################################################################################################################################
+
+
+def _random_lonlat(size: int) -> dict:
+
+    random = np.random.default_rng(SEED)
+
+    return {
+        "x": random.uniform(-180.0, 180.0, size),
+        "y": random.uniform(-85.0, 85.0, size),
+    }
+
+
+def _track(size: int) -> dict:
+
+    """
+    Return a circular orbit sampled every 10 seconds, as (time offsets, longitude, latitude, height).
+    """
+
+    offsets = np.arange(size, dtype=np.float64) * 10.0
+
+    # ~95 minutes period, 51.6 degrees inclination
+    phase = 2.0 * np.pi * offsets / 5700.0
+    latitude = np.degrees(np.arcsin(np.sin(np.radians(51.6)) * np.sin(phase)))
+    longitude = (np.degrees(phase) - offsets / 240.0 + 180.0) % 360.0 - 180.0
+
+    return {
+        "offsets": offsets,
+        "positions": np.column_stack([longitude, latitude, np.full(size, 500e3)]),
+    }
+
+
+def _geojson(size: int, geometry: str = "Polygon") -> dict:
+
+    """
+    Write a FeatureCollection of size country-like polygons, or their outlines as
+    line strings, to a temporary file.
+    """
+
+    random = np.random.default_rng(SEED)
+
+    features: list[dict] = []
+
+    centers = zip(random.uniform(-170.0, 170.0, size), random.uniform(-80.0, 80.0, size))
+
+    for (x, y) in centers:
+
+        angles = np.linspace(0.0, 2.0 * np.pi, 200)
+        radii = random.uniform(1.0, 5.0, 200)
+        ring = np.column_stack(
+            [
+                np.clip(x + radii * np.cos(angles), -180.0, 180.0),
+                np.clip(y + radii * np.sin(angles), -90.0, 90.0),
+            ]
+        )
+        ring[-1] = ring[0]
+
+        features.append(
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": geometry,
+                    "coordinates": (
+                        [ring.tolist()] if geometry == "Polygon" else ring.tolist()
+                    ),
+                },
+            }
+        )
+
+    (fd, path) = tempfile.mkstemp(suffix=".geo.json")
+
+    with os.fdopen(fd, "w") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f)
+
+    return {"path": path}
+
+
+def _geojson_lines(size: int) -> dict:
+    return _geojson(size, geometry="LineString")
+
+
+######################################################################################################################################################
+
+
+@workload("empty", size=1)
+def empty(size: int) -> cesiumpy.Viewer:
+
+    # small jobs, dominated by import and lazy loading of the package
+    return cesiumpy.Viewer()
+
+
+@workload("scatter", size=100_000, setup=_random_lonlat)
+def scatter(x: np.ndarray, y: np.ndarray) -> cesiumpy.Viewer:
+
+    viewer = cesiumpy.Viewer()
+    viewer.plot.scatter(x, y, color=cesiumpy.color.RED)
+
+    return viewer
+
+
+@workload("scatter_entities", size=5_000, setup=_random_lonlat)
+def scatter_entities(x: np.ndarray, y: np.ndarray) -> cesiumpy.Viewer:
+
+    viewer = cesiumpy.Viewer()
+    viewer.plot.scatter(x, y, color=cesiumpy.color.RED, batch=False)
+
+    return viewer
+
+
+@workload("sampled_track", size=100_000, setup=_track)
+def sampled_track(offsets: np.ndarray, positions: np.ndarray) -> cesiumpy.Viewer:
+
+    position = cesiumpy.SampledPositionProperty()
+    position.add_samples(offsets, positions, epoch=EPOCH, degrees=True)
+
+    viewer = cesiumpy.Viewer()
+    viewer.entities.add(cesiumpy.Point(position=position, pixel_size=5))
+
+    return viewer
+
+
+@workload("satellite", size=2_000, setup=_track)
+def satellite(offsets: np.ndarray, positions: np.ndarray) -> cesiumpy.Viewer:
+
+    position = cesiumpy.SampledPositionProperty()
+    position.add_samples(offsets, positions, epoch=EPOCH, degrees=True)
+
+    # nadir pointing, rotated about the along-track axis
+    orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+    for (offset, roll) in zip(offsets, np.linspace(0.0, np.pi, len(offsets))):
+        orientation.add_sample(
+            EPOCH + timedelta(seconds=float(offset)),
+            cesiumpy.Quaternion.from_heading_pitch_roll(
+                cesiumpy.HeadingPitchRoll(heading=0.0, pitch=np.pi, roll=roll)
+            ),
+        )
+
+    sensors = [
+        cesiumpy.ConicSensor(
+            direction=direction,
+            half_angle=cesiumpy.math.to_radians(10.0),
+            length=500e3,
+            material=color,
+        )
+        for (direction, color) in [
+            (cesiumpy.Cartesian3(+1.0, 0.0, 0.0), cesiumpy.color.RED),
+            (cesiumpy.Cartesian3(0.0, +1.0, 0.0), cesiumpy.color.GREEN),
+            (cesiumpy.Cartesian3(0.0, 0.0, +1.0), cesiumpy.color.BLUE),
+        ]
+    ]
+    sensors.append(
+        cesiumpy.RectangularSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, +1.0),
+            radius=600e3,
+            x_half_angle=cesiumpy.math.to_radians(20.0),
+            y_half_angle=cesiumpy.math.to_radians(10.0),
+            material=cesiumpy.color.ORANGE.with_alpha(0.3),
+        )
+    )
+
+    viewer = cesiumpy.Viewer()
+
+    cesiumpy.Satellite(
+        position=position,
+        orientation=orientation,
+        model=cesiumpy.IonResource(asset_id=1),
+        sensors=sensors,
+    ).render(viewer)
+
+    return viewer
+
+
+@workload("polyline", size=1_000_000, setup=_track)
+def polyline(offsets: np.ndarray, positions: np.ndarray) -> cesiumpy.Viewer:
+
+    viewer = cesiumpy.Viewer()
+    viewer.entities.add(
+        cesiumpy.Polyline(
+            positions=cesiumpy.entities.cartesian.Cartesian3Array(positions),
+            width=1,
+            material=cesiumpy.color.YELLOW,
+        )
+    )
+
+    return viewer
+
+
+@workload("read_geojson", size=200, setup=_geojson, requires="shapely")
+def read_geojson(path: str) -> cesiumpy.Viewer:
+
+    try:
+        entities = cesiumpy.extension.io.read_geojson(path)
+    finally:
+        os.remove(path)
+
+    viewer = cesiumpy.Viewer()
+    for entity in entities:
+        viewer.entities.add(entity)
+
+    return viewer
+
+
+@workload("read_geojson_1_worker", size=2000, setup=_geojson_lines)
+def read_geojson_1_worker(path: str) -> cesiumpy.Viewer:
+
+    # reference of read_geojson_workers, with the same overhead of the pool
+    return _read_geojson_workers(path, 1)
+
+
+@workload("read_geojson_workers", size=2000, setup=_geojson_lines)
+def read_geojson_workers(path: str) -> cesiumpy.Viewer:
+
+    # features are decoded and converted to arrays by a process per core
+    return _read_geojson_workers(path, os.cpu_count())
+
+
+def _read_geojson_workers(path: str, workers: int) -> cesiumpy.Viewer:
+
+    try:
+        chunks = cesiumpy.io.iter_geojson(path, chunk_size=100, workers=workers)
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(chunks)
+    finally:
+        os.remove(path)
+
+    return viewer
+
+
+######################################################################################################################################################
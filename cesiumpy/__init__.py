@@ -1,111 +1,157 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-# data
-import cesiumpy.data.country  # noqa
+# Public names are imported on first access (PEP 562), so that "import cesiumpy" does not
+# import every entity, provider and extension, nor optional dependencies such as geopy.
 
-countries = cesiumpy.data.country.CountryLoader()  # noqa
-
-# entities
-import cesiumpy.entities as entities  # noqa
-import cesiumpy.entities.color  # noqa
-
-color = cesiumpy.entities.color.ColorFactory()  # noqa
-
-from cesiumpy.entities.cartesian import Cartesian2, Cartesian3, Cartesian4  # noqa
-from cesiumpy.entities.graphics import (
-    Point,
-    Label,
-    Billboard,
-    Ellipse,  # noqa
-    Ellipsoid,
-    Corridor,
-    Cylinder,  # noqa
-    Polyline,
-    PolylineArrowMaterialProperty,
-    PolylineVolume,
-    Wall,  # noqa
-    Rectangle,
-    ShadowMode,
-    Box,
-    Polygon,
-    Model,
-    IonResource,
-)  # noqa
-
-# from cesiumpy.entities.model import Model                                       # noqa
-from cesiumpy.entities.pinbuilder import Pin  # noqa
-from cesiumpy.entities.transform import Transforms  # noqa
-
-# extension
-import cesiumpy.extension as extension  # noqa
-from cesiumpy.extension import geocode  # noqa
-from cesiumpy.extension import io  # noqa
-from cesiumpy.extension import spatial  # noqa
-
-from cesiumpy.camera import Camera  # noqa
-from cesiumpy.constants import (
-    VerticalOrigin,
-    HorizontalOrigin,  # noqa
-    CornerType,
-    Math,
-    HeightReference,
-    ArcType,
-)  # noqa
-
-
-from cesiumpy.datasource import (
-    CzmlDataSource,  # noqa
-    GeoJsonDataSource,  # noqa
-    KmlDataSource,
-)  # noqa
-
-from cesiumpy.provider import (
-    TerrainProvider,  # noqa
-    ArcGisImageServerTerrainProvider,  # noqa
-    CesiumTerrainProvider,  # noqa
-    EllipsoidTerrainProvider,  # noqa
-    VRTheWorldTerrainProvider,  # noqa
-    ImageryProvider,  # noqa
-    ArcGisMapServerImageryProvider,  # noqa
-    BingMapsImageryProvider,  # noqa
-    GoogleEarthImageryProvider,  # noqa
-    GridImageryProvider,  # noqa
-    MapboxImageryProvider,  # noqa
-    OpenStreetMapImageryProvider,  # noqa
-    SingleTileImageryProvider,  # noqa
-    TileCoordinatesImageryProvider,  # noqa
-    TileMapServiceImageryProvider,  # noqa
-    UrlTemplateImageryProvider,  # noqa
-    WebMapServiceImageryProvider,  # noqa
-    WebMapTileServiceImageryProvider,
-)  # noqa
-
-from cesiumpy.clock import ClockViewModel  # noqa
-from cesiumpy.clock import Clock  # noqa
-
-from cesiumpy.path_graphics import PathGraphics
-
-from cesiumpy.time import TimeInterval
-from cesiumpy.time import TimeIntervalCollection
-
-from cesiumpy.property import Property
-from cesiumpy.property import SampledProperty
-from cesiumpy.position import SampledPositionProperty
-from cesiumpy.orientation import Quaternion
-from cesiumpy.orientation import HeadingPitchRoll
-from cesiumpy.spherical import Spherical
-
-from cesiumpy.viewer import Viewer  # noqa
-from cesiumpy.widget import CesiumWidget  # noqa
+import importlib
 
 from cesiumpy.version import version as __version__  # noqa
 
-from cesiumpy.satellite import Satellite  # noqa
-from cesiumpy.sensor import Sensor  # noqa
-from cesiumpy.sensor import CustomPatternSensor  # noqa
-from cesiumpy.sensor import RectangularSensor  # noqa
-from cesiumpy.sensor import CylindricalSensor  # noqa
-from cesiumpy.sensor import ConicSensor  # noqa
-
-from cesiumpy import math  # noqa
+# name: (module, attribute), attribute being None for modules
+_LAZY_ATTRIBUTES = {
+    # entities
+    "entities": ("cesiumpy.entities", None),
+    "Cartesian2": ("cesiumpy.entities.cartesian", "Cartesian2"),
+    "Cartesian3": ("cesiumpy.entities.cartesian", "Cartesian3"),
+    "Cartesian4": ("cesiumpy.entities.cartesian", "Cartesian4"),
+    "Point": ("cesiumpy.entities.graphics", "Point"),
+    "Label": ("cesiumpy.entities.graphics", "Label"),
+    "Billboard": ("cesiumpy.entities.graphics", "Billboard"),
+    "Ellipse": ("cesiumpy.entities.graphics", "Ellipse"),
+    "Ellipsoid": ("cesiumpy.entities.graphics", "Ellipsoid"),
+    "Corridor": ("cesiumpy.entities.graphics", "Corridor"),
+    "Cylinder": ("cesiumpy.entities.graphics", "Cylinder"),
+    "Polyline": ("cesiumpy.entities.graphics", "Polyline"),
+    "PolylineArrowMaterialProperty": (
+        "cesiumpy.entities.graphics",
+        "PolylineArrowMaterialProperty",
+    ),
+    "PolylineVolume": ("cesiumpy.entities.graphics", "PolylineVolume"),
+    "Wall": ("cesiumpy.entities.graphics", "Wall"),
+    "Rectangle": ("cesiumpy.entities.graphics", "Rectangle"),
+    "ShadowMode": ("cesiumpy.entities.graphics", "ShadowMode"),
+    "Box": ("cesiumpy.entities.graphics", "Box"),
+    "Polygon": ("cesiumpy.entities.graphics", "Polygon"),
+    "Model": ("cesiumpy.entities.graphics", "Model"),
+    "IonResource": ("cesiumpy.entities.graphics", "IonResource"),
+    "EntityBatch": ("cesiumpy.entities.batch", "EntityBatch"),
+    "PointBatch": ("cesiumpy.entities.batch", "PointBatch"),
+    "CylinderBatch": ("cesiumpy.entities.batch", "CylinderBatch"),
+    "LabelBatch": ("cesiumpy.entities.batch", "LabelBatch"),
+    "Pin": ("cesiumpy.entities.pinbuilder", "Pin"),
+    "Transforms": ("cesiumpy.entities.transform", "Transforms"),
+    # extension
+    "extension": ("cesiumpy.extension", None),
+    "geocode": ("cesiumpy.extension.geocode", None),
+    "io": ("cesiumpy.extension.io", None),
+    "spatial": ("cesiumpy.extension.spatial", None),
+    "tiling": ("cesiumpy.extension.tiling", None),
+    "Camera": ("cesiumpy.camera", "Camera"),
+    "VerticalOrigin": ("cesiumpy.constants", "VerticalOrigin"),
+    "HorizontalOrigin": ("cesiumpy.constants", "HorizontalOrigin"),
+    "CornerType": ("cesiumpy.constants", "CornerType"),
+    "Math": ("cesiumpy.constants", "Math"),
+    "HeightReference": ("cesiumpy.constants", "HeightReference"),
+    "ArcType": ("cesiumpy.constants", "ArcType"),
+    "CzmlDataSource": ("cesiumpy.datasource", "CzmlDataSource"),
+    "GeoJsonDataSource": ("cesiumpy.datasource", "GeoJsonDataSource"),
+    "KmlDataSource": ("cesiumpy.datasource", "KmlDataSource"),
+    "TerrainProvider": ("cesiumpy.provider", "TerrainProvider"),
+    "ArcGisImageServerTerrainProvider": (
+        "cesiumpy.provider",
+        "ArcGisImageServerTerrainProvider",
+    ),
+    "CesiumTerrainProvider": ("cesiumpy.provider", "CesiumTerrainProvider"),
+    "EllipsoidTerrainProvider": ("cesiumpy.provider", "EllipsoidTerrainProvider"),
+    "VRTheWorldTerrainProvider": ("cesiumpy.provider", "VRTheWorldTerrainProvider"),
+    "ImageryProvider": ("cesiumpy.provider", "ImageryProvider"),
+    "ArcGisMapServerImageryProvider": (
+        "cesiumpy.provider",
+        "ArcGisMapServerImageryProvider",
+    ),
+    "BingMapsImageryProvider": ("cesiumpy.provider", "BingMapsImageryProvider"),
+    "GoogleEarthImageryProvider": ("cesiumpy.provider", "GoogleEarthImageryProvider"),
+    "GridImageryProvider": ("cesiumpy.provider", "GridImageryProvider"),
+    "MapboxImageryProvider": ("cesiumpy.provider", "MapboxImageryProvider"),
+    "OpenStreetMapImageryProvider": (
+        "cesiumpy.provider",
+        "OpenStreetMapImageryProvider",
+    ),
+    "SingleTileImageryProvider": ("cesiumpy.provider", "SingleTileImageryProvider"),
+    "TileCoordinatesImageryProvider": (
+        "cesiumpy.provider",
+        "TileCoordinatesImageryProvider",
+    ),
+    "TileMapServiceImageryProvider": (
+        "cesiumpy.provider",
+        "TileMapServiceImageryProvider",
+    ),
+    "UrlTemplateImageryProvider": ("cesiumpy.provider", "UrlTemplateImageryProvider"),
+    "WebMapServiceImageryProvider": (
+        "cesiumpy.provider",
+        "WebMapServiceImageryProvider",
+    ),
+    "WebMapTileServiceImageryProvider": (
+        "cesiumpy.provider",
+        "WebMapTileServiceImageryProvider",
+    ),
+    "ClockViewModel": ("cesiumpy.clock", "ClockViewModel"),
+    "Clock": ("cesiumpy.clock", "Clock"),
+    "PathGraphics": ("cesiumpy.path_graphics", "PathGraphics"),
+    "TimeInterval": ("cesiumpy.time", "TimeInterval"),
+    "TimeIntervalCollection": ("cesiumpy.time", "TimeIntervalCollection"),
+    "Property": ("cesiumpy.property", "Property"),
+    "SampledProperty": ("cesiumpy.property", "SampledProperty"),
+    "InterpolationAlgorithm": ("cesiumpy.property", "InterpolationAlgorithm"),
+    "SampledPositionProperty": ("cesiumpy.position", "SampledPositionProperty"),
+    "Quaternion": ("cesiumpy.orientation", "Quaternion"),
+    "HeadingPitchRoll": ("cesiumpy.orientation", "HeadingPitchRoll"),
+    "Spherical": ("cesiumpy.spherical", "Spherical"),
+    "PointPrimitiveCollection": ("cesiumpy.primitives", "PointPrimitiveCollection"),
+    "BillboardCollection": ("cesiumpy.primitives", "BillboardCollection"),
+    "LabelCollection": ("cesiumpy.primitives", "LabelCollection"),
+    "PolylineCollection": ("cesiumpy.primitives", "PolylineCollection"),
+    "Viewer": ("cesiumpy.viewer", "Viewer"),
+    "CesiumWidget": ("cesiumpy.widget", "CesiumWidget"),
+    "Satellite": ("cesiumpy.satellite", "Satellite"),
+    "Sensor": ("cesiumpy.sensor", "Sensor"),
+    "CustomPatternSensor": ("cesiumpy.sensor", "CustomPatternSensor"),
+    "RectangularSensor": ("cesiumpy.sensor", "RectangularSensor"),
+    "CylindricalSensor": ("cesiumpy.sensor", "CylindricalSensor"),
+    "ConicSensor": ("cesiumpy.sensor", "ConicSensor"),
+    "math": ("cesiumpy.math", None),
+}
+
+# name: (module, factory), instantiated on first access
+_LAZY_INSTANCES = {
+    "countries": ("cesiumpy.data.country", "CountryLoader"),
+    "color": ("cesiumpy.entities.color", "ColorFactory"),
+}
+
+__all__ = sorted(list(_LAZY_ATTRIBUTES) + list(_LAZY_INSTANCES))
+
+
+def __getattr__(name):
+
+    if name in _LAZY_ATTRIBUTES:
+        (module_name, attribute) = _LAZY_ATTRIBUTES[name]
+        value = importlib.import_module(module_name)
+        if attribute is not None:
+            value = getattr(value, attribute)
+
+    elif name in _LAZY_INSTANCES:
+        (module_name, factory) = _LAZY_INSTANCES[name]
+        value = getattr(importlib.import_module(module_name), factory)()
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache, so that next accesses do not go through __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
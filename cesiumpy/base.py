@@ -3,9 +3,10 @@
 
 from __future__ import unicode_literals
 
-import functools
-import operator
-from typing import List, Dict, Optional
+import collections.abc
+import io
+import os
+from typing import IO, Iterable, Iterator, List, Dict, Optional, Set, Union
 
 import six
 import traitlets
@@ -150,10 +151,11 @@ class _CesiumBase(_CesiumObject):
         self._scene = Scene(self)
 
         from cesiumpy.entities.entity import _CesiumEntity
+        from cesiumpy.entities.batch import EntityBatch
 
-        self._entities = RestrictedList(
+        self._entities = EntityCollection(
             self,
-            allowed=_CesiumEntity,
+            allowed=(_CesiumEntity, EntityBatch),
             propertyname="entities",
         )
 
@@ -171,7 +173,15 @@ class _CesiumBase(_CesiumObject):
             propertyname="script",
         )
 
+        # Scripts of registered properties, not yet emitted
         self._property_map: Dict[str, List[str]] = {}
+        self._registered_properties: Set[str] = set()
+
+        # Properties referenced while generating a cached script
+        self._property_references: Optional[list] = None
+
+        # Whether scripts generated by the current export are kept for the next ones
+        self._cache_scripts: bool = True
 
     # Properties
 
@@ -181,23 +191,7 @@ class _CesiumBase(_CesiumObject):
 
     @property
     def script(self):
-
-        self._property_map = {}
-
-        entities_scripts = self._entities.generate_script(widget=self)
-        data_sources_scripts = self._data_sources.generate_script(widget=self)
-        scene_scripts = self._scene.generate_script(widget=self)
-
-        return (
-            self._setup_scripts
-            + self._widget_scripts
-            + self._property_scripts
-            + entities_scripts
-            + data_sources_scripts
-            + self._camera_scripts
-            + scene_scripts
-            + self.scripts._items
-        )
+        return list(self.iter_scripts())
 
     @property
     def camera(self):
@@ -207,6 +201,65 @@ class _CesiumBase(_CesiumObject):
 
     def register_property(self, property: str, scripts: List[str]) -> None:
         self._property_map[property] = scripts
+        self._registered_properties.add(property)
+
+    def has_property(self, property: str) -> bool:
+        return property in self._registered_properties
+
+    def reference_property(self, property) -> None:
+
+        """
+        Record that the script being generated uses property, so it can be registered again when the script is reused from cache.
+        """
+
+        if self._property_references is not None:
+            self._property_references.append(property)
+
+    def iter_scripts(
+        self, viewport=None, margin: float = 0.0, cache: bool = True
+    ) -> Iterator[str]:
+
+        """
+        Yield scripts one at a time.
+
+        Scripts of properties used by an object are yielded right before the object script.
+
+        Entities are culled to viewport if passed, "camera" for the destination rectangle of
+        the camera, a Rectangle in degrees or a list-like of west, south, east, north in
+        degrees, enlarged by margin degrees on each side.
+
+        Scripts of entities are kept for the next calls if cache, otherwise previous scripts
+        are reused but new ones are not kept.
+        """
+
+        if viewport is not None:
+            from cesiumpy.entities.culling import Viewport
+
+            viewport = Viewport.maybe(viewport, margin=margin, camera=self.camera)
+
+        self._property_map = {}
+        self._registered_properties = set()
+        self._cache_scripts = cache
+
+        yield from self._setup_scripts
+        yield from self._widget_scripts
+
+        yield from self._with_property_scripts(
+            self._entities.iter_scripts(
+                widget=self, viewport=viewport, cache=cache
+            )
+        )
+        yield from self._with_property_scripts(
+            self._data_sources.iter_scripts(widget=self, cache=cache)
+        )
+
+        yield from self._camera_scripts
+
+        yield from self._with_property_scripts(
+            self._scene.iter_scripts(widget=self, cache=cache)
+        )
+
+        yield from self.scripts._items
 
     # Private properties
 
@@ -288,21 +341,104 @@ class _CesiumBase(_CesiumObject):
     def scripts(self):
         return self._scripts
 
-    @property
-    def _property_scripts(self) -> List[str]:
-        return functools.reduce(operator.iconcat, self._property_map.values(), [])
-
     # Methods
 
-    def to_html(self) -> str:
-        headers = self._load_scripts
-        container = self.container
-        scripts = html._wrap_scripts(self.script)
+    def to_html(self, viewport=None, margin: float = 0.0) -> str:
 
-        return html._build_html(headers, container, scripts)
+        """
+        Return HTML, entities being culled to viewport if passed, as in iter_scripts.
+        """
+
+        return html._build_html(*self._get_html_parts(viewport, margin))
+
+    def write_html(
+        self,
+        fileobj_or_path: Union[str, os.PathLike, IO[str]],
+        viewport=None,
+        margin: float = 0.0,
+    ) -> None:
+
+        """
+        Write HTML to a path or a writable text file object (e.g. socket.makefile("w")).
+
+        Scripts are generated and written one at a time, so memory use does not grow with the scene size:
+        scripts cached by to_html are reused, but new ones are not cached.
+        Entities are culled to viewport if passed, as in iter_scripts.
+        """
+
+        parts: list = self._get_html_parts(viewport, margin, cache=False)
+
+        if isinstance(fileobj_or_path, (str, os.PathLike)):
+            with open(fileobj_or_path, "w", encoding="utf-8") as fileobj:
+                html._write_html(fileobj, *parts)
+        else:
+            html._write_html(fileobj_or_path, *parts)
+
+    def to_czml(self) -> str:
+
+        """
+        Return entities and clock as a CZML document.
+        """
+
+        fileobj = io.StringIO()
+        self.write_czml(fileobj)
+
+        return fileobj.getvalue()
+
+    def write_czml(self, fileobj_or_path: Union[str, os.PathLike, IO[str]]) -> None:
+
+        """
+        Write entities and clock as a CZML document to a path or a writable text file object.
+
+        Packets are generated and written one at a time, sampled properties as packed arrays of
+        time offsets from their epoch.
+        """
+
+        from cesiumpy import czml
+
+        if isinstance(fileobj_or_path, (str, os.PathLike)):
+            with open(fileobj_or_path, "w", encoding="utf-8") as fileobj:
+                czml.write_packets(fileobj, czml.iter_packets(self))
+        else:
+            czml.write_packets(fileobj_or_path, czml.iter_packets(self))
+
+    # Private properties
+
+    @property
+    def _html_parts(self) -> list:
+        return self._get_html_parts()
 
     # Private methods
 
+    def _get_html_parts(
+        self, viewport=None, margin: float = 0.0, cache: bool = True
+    ) -> list:
+        return [
+            self._load_scripts,
+            self.container,
+            html._iter_wrap_scripts(
+                self.iter_scripts(viewport=viewport, margin=margin, cache=cache)
+            ),
+        ]
+
+    def _with_property_scripts(self, scripts: Iterable[str]) -> Iterator[str]:
+
+        """
+        Yield pending property scripts before each script.
+        """
+
+        for script in scripts:
+            yield from self._pop_property_scripts()
+            yield script
+
+        yield from self._pop_property_scripts()
+
+    def _pop_property_scripts(self) -> Iterator[str]:
+
+        while self._property_map:
+            name = next(iter(self._property_map))
+            yield from self._property_map.pop(name)
+
     def _repr_html_(self) -> str:
         return self.to_html()
 
@@ -318,14 +454,18 @@ class RestrictedList(_CesiumObject):
         self._allowed = allowed
         self._propertyname = propertyname
 
+        # id(item) -> (item, (varname, version), script, referenced properties)
+        self._script_cache = {}
+
     def add(self, item, **kwargs):
-        if com.is_listlike(item):
+        # iterators such as generators are consumed one item at a time
+        if com.is_listlike(item) or isinstance(item, collections.abc.Iterator):
             for i in item:
                 self.add(i, **kwargs)
         elif isinstance(item, self._allowed):
             for key, value in six.iteritems(kwargs):
                 setattr(item, key, value)
-            self._items.append(item)
+            self._append(item)
         else:
             msg = "item must be {allowed} instance: {item}"
 
@@ -338,6 +478,10 @@ class RestrictedList(_CesiumObject):
 
     def clear(self):
         self._items = []
+        self._script_cache = {}
+
+    def _append(self, item):
+        self._items.append(item)
 
     def __len__(self):
         return len(self._items)
@@ -352,12 +496,151 @@ class RestrictedList(_CesiumObject):
         each script may be a list of commands also
         """
 
-        results = []
+        return list(self.iter_scripts(widget=widget))
+
+    def iter_scripts(self, widget=None, cache=True):
+
+        """
+        Yield scripts built from entities one at a time, kept for the next calls if cache
+        """
+
+        widget = widget or self.widget
         for item in self._items:
-            script = "{varname}.{propertyname}.add({item});".format(
-                varname=(widget or self.widget)._varname,
-                propertyname=self._propertyname,
-                item=item.generate_script(widget=(widget or self.widget)),
+            yield self._generate_item_script(item, widget, cache=cache)
+
+    def _generate_item_script(self, item, widget, cache=True):
+
+        """
+        Return script of item, reusing the previous one if item did not change since.
+        New scripts are kept only if cache, so that streaming writes do not hold them.
+        """
+
+        key = (widget._varname, item._script_version)
+
+        cached = self._script_cache.get(id(item))
+        if cached is not None and cached[0] is item and cached[1] == key:
+            for prop in cached[3]:
+                # register properties again, their scripts are cached too
+                prop.generate_script(widget=widget)
+            return cached[2]
+
+        (script, references) = self._build_item_script(item, widget)
+
+        if cache:
+            item._watch_script()
+            self._script_cache[id(item)] = (item, key, script, references)
+        elif cached is not None:
+            # stale, released instead of being replaced
+            del self._script_cache[id(item)]
+        return script
+
+    def _build_item_script(self, item, widget):
+
+        """
+        Return script of item, and the properties it references
+        """
+
+        references = []
+        widget._property_references = references
+        try:
+            if getattr(item, "_is_batch", False):
+                # batches add their items by themselves
+                script = item.generate_script(widget=widget)
+            else:
+                script = "{varname}.{propertyname}.add({item});".format(
+                    varname=widget._varname,
+                    propertyname=self._propertyname,
+                    item=item.generate_script(widget=widget),
+                )
+        finally:
+            widget._property_references = None
+
+        return (script, references)
+
+
+class EntityCollection(RestrictedList):
+
+    """
+    Entities of a widget, with a spatial index of their degrees positions for
+    query_bbox, query_radius and nearest.
+
+    The index is built at the first query and updated as entities are added. Entities
+    whose positions changed after they were added require reindex().
+    """
+
+    def __init__(self, widget, allowed, propertyname):
+        super(EntityCollection, self).__init__(widget, allowed, propertyname)
+        self._index = None
+
+    @property
+    def index(self):
+        """
+        Return the SpatialIndex of entities, building it on first access
+        """
+        if self._index is None:
+            from cesiumpy.entities.index import SpatialIndex
+
+            self._index = SpatialIndex()
+            for item in self._items:
+                self._index.insert(item)
+
+        return self._index
+
+    def reindex(self):
+        """
+        Build the spatial index again, for entities whose positions changed
+        """
+        self._index = None
+
+    def query_bbox(self, west, south, east, north):
+        """
+        Return entities intersecting the rectangle in degrees, in order of addition.
+        west may be greater than east for rectangles crossing the antimeridian.
+        Batches are returned if any of their positions is in the rectangle.
+        """
+        index = self.index
+        # records are sorted, and indexed in order of addition
+        return index.items(index.query_bbox(west, south, east, north))
+
+    def query_radius(self, longitude, latitude, radius):
+        """
+        Return entities within radius meters of the point in degrees, nearest first.
+        """
+        index = self.index
+        return index.items(index.query_radius(longitude, latitude, radius))
+
+    def nearest(self, longitude, latitude, k=1):
+        """
+        Return the k entities nearest to the point in degrees, nearest first.
+        """
+        return self.index.nearest_items(longitude, latitude, k=k)
+
+    def iter_scripts(self, widget=None, viewport=None, cache=True):
+        """
+        Yield scripts built from entities one at a time, culled to viewport if passed,
+        a cesiumpy.entities.culling.Viewport
+        """
+        if viewport is None:
+            yield from super(EntityCollection, self).iter_scripts(
+                widget=widget, cache=cache
             )
-            results.append(script)
-        return results
+            return
+
+        widget = widget or self.widget
+        added = {id(item) for item in self._items}
+
+        for item in viewport.cull(self._items, index=self.index):
+            if id(item) in added:
+                yield self._generate_item_script(item, widget, cache=cache)
+            else:
+                # parts of entities are not cached, they are built again by each export
+                yield self._build_item_script(item, widget)[0]
+
+    def clear(self):
+        super(EntityCollection, self).clear()
+        self._index = None
+
+    def _append(self, item):
+        super(EntityCollection, self)._append(item)
+        if self._index is not None:
+            self._index.insert(item)
@@ -0,0 +1,627 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/czml.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+import warnings
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from cesiumpy.base import _CesiumEnum, _CesiumObject
+from cesiumpy.clock import Clock
+from cesiumpy.entities.batch import EntityBatch
+from cesiumpy.entities.cartesian import (
+    Cartesian2,
+    Cartesian3,
+    Cartesian3Array,
+    Rectangle,
+)
+from cesiumpy.entities.color import Color
+from cesiumpy.entities.entity import _CesiumEntity
+from cesiumpy.entities.graphics.model import Model
+from cesiumpy.entities.graphics.polyline import PolylineArrowMaterialProperty
+from cesiumpy.entities.material import ImageMaterialProperty
+from cesiumpy.entities.pinbuilder import Icon
+from cesiumpy.math import geodetic_to_cartesian
+from cesiumpy.orientation import Quaternion, multiply_packed, rotate_packed
+from cesiumpy.path_graphics import PathGraphics
+from cesiumpy.property import SampledProperty, _to_offsets
+from cesiumpy.satellite import Satellite
+from cesiumpy.spherical import Spherical
+from cesiumpy.time import TimeInterval, TimeIntervalCollection
+import cesiumpy.util.common as com
+
+######################################################################################################################################################
+
+CZML_VERSION: str = "1.0"
+
+# CZML names of the graphics, when they differ from the camelCase entity property
+GRAPHICS_KEYS: dict[str, str] = {
+    "conic_sensor": "agi_conicSensor",
+    "custom_pattern_sensor": "agi_customPatternSensor",
+    "rectangular_sensor": "agi_rectangularSensor",
+}
+
+# CZML names of graphics properties, when they differ from the camelCase entity property
+PROPERTY_KEYS: dict[tuple[str, str], str] = {
+    ("model", "uri"): "gltf",
+    ("polygon", "hierarchy"): "positions",
+}
+
+# Properties of MaterialProperty type, colors being wrapped as solid color materials
+MATERIAL_KEYS: set[str] = {"material", "lateralSurfaceMaterial"}
+
+# Entity properties emitted at the packet level, not in the graphics
+PACKET_PROPS: set[str] = {"availability", "path"}
+
+# Color property of the batch graphics
+BATCH_COLOR_KEYS: dict[str, str] = {
+    "point": "color",
+    "cylinder": "material",
+    "label": "fillColor",
+}
+
+# CZML bounds of unbounded time intervals
+MINIMUM_TIME: str = "0000-01-01T00:00:00Z"
+MAXIMUM_TIME: str = "9999-12-31T24:00:00Z"
+
+# Chunk of samples: times, (N, 3) positions, and optional (N, 4) packed (x, y, z, w) orientations
+Chunk = Tuple[Any, Any, Optional[Any]]
+
+######################################################################################################################################################
+
+
+class _Unsupported(Exception):
+
+    """
+    Raised by value converters, when a value has no CZML representation.
+    """
+
+
+######################################################################################################################################################
+
+
+def iter_packets(widget) -> Iterator[dict]:
+
+    """
+    Yield CZML packets of the widget, one at a time.
+
+    The document packet comes first, carrying the clock of the widget, followed by one
+    packet per entity, entity batches being expanded into one packet per item.
+    Values which cannot be represented in CZML (e.g. Ion resources) are skipped with
+    a warning.
+    """
+
+    yield document_packet(widget)
+
+    ids: set[str] = set()
+
+    for (index, entity) in enumerate(widget.entities):
+
+        if isinstance(entity, EntityBatch):
+            yield from batch_packets(entity, prefix=f"batch{index}")
+            continue
+
+        entity_id: str = entity.name
+        if (entity_id is None) or (entity_id in ids):
+            entity_id = f"entity{index}"
+        ids.add(entity_id)
+
+        yield entity_packet(entity, entity_id)
+
+
+def stream_packets(
+    tracks: Iterable[tuple[Satellite, Iterable[Chunk]]],
+    clock: Optional[Clock] = None,
+    epoch: Optional[datetime] = None,
+    degrees: bool = False,
+) -> Iterator[dict]:
+
+    """
+    Yield CZML packets of satellites whose samples are read from iterators of chunks.
+
+    Each track is a satellite, along with an iterable of (times, positions, orientations)
+    chunks, which replaces the samples of satellite.position and satellite.orientation.
+    Chunks are consumed lazily and in turn across the tracks, so that memory is bounded
+    by the chunk size, and each chunk becomes one packet per satellite and sensor.
+
+    epoch: Reference time of float times, when chunk times are second offsets.
+    degrees: Whether positions are (longitude, latitude, height) in degrees.
+    """
+
+    tracks = list(tracks)
+
+    yield _document(clock)
+
+    for (satellite, _) in tracks:
+        yield from satellite_packets(satellite)
+
+    iterators = [(satellite, iter(chunks)) for (satellite, chunks) in tracks]
+
+    while iterators:
+
+        remaining: list = []
+
+        for (satellite, chunks) in iterators:
+
+            chunk: Optional[Chunk] = next(chunks, None)
+
+            if chunk is None:
+                continue
+
+            yield from sample_packets(satellite, chunk, epoch=epoch, degrees=degrees)
+
+            remaining.append((satellite, chunks))
+
+        iterators = remaining
+
+
+def satellite_packets(satellite: Satellite) -> Iterator[dict]:
+
+    """
+    Yield packets defining the satellite and its sensors, without their samples.
+
+    Sensors without offset are positioned by reference to the position of the satellite.
+    """
+
+    if satellite.model is not None:
+        yield entity_packet(
+            Model(uri=satellite.model, availability=satellite.availability),
+            satellite.name,
+        )
+    else:
+        packet: dict = {"id": satellite.name, "name": satellite.name}
+        _set(packet, "availability", satellite.availability)
+        yield packet
+
+    for sensor in satellite.sensors:
+
+        packet = entity_packet(
+            sensor._to_entity(
+                position=None,
+                orientation=None,
+                availability=satellite.availability,
+            ),
+            sensor.name,
+        )
+        if sensor.offset is None:
+            packet["position"] = {"reference": f"{satellite.name}#position"}
+
+        yield packet
+
+
+def sample_packets(
+    satellite: Satellite,
+    chunk: Chunk,
+    epoch: Optional[datetime] = None,
+    degrees: bool = False,
+) -> Iterator[dict]:
+
+    """
+    Yield packets appending a chunk of samples to the satellite and its sensors.
+
+    Sensor orientations are the satellite orientations rotated by the sensor mounting,
+    and sensors with an offset get their own positions, in the fixed frame.
+    """
+
+    (times, positions, orientations) = chunk
+
+    (epoch, offsets) = _to_offsets(times, epoch)
+
+    if len(offsets) == 0:
+        return
+
+    positions = _to_samples(positions, len(offsets), 3)
+
+    packet: dict = {
+        "id": satellite.name,
+        "position": {
+            "epoch": _to_iso8601(epoch),
+            "cartographicDegrees" if degrees else "cartesian": _pack(offsets, positions),
+        },
+    }
+
+    if orientations is not None:
+        orientations = _to_samples(orientations, len(offsets), 4)
+        packet["orientation"] = {
+            "epoch": _to_iso8601(epoch),
+            "unitQuaternion": _pack(offsets, orientations),
+        }
+
+    yield packet
+
+    for sensor in satellite.sensors:
+
+        if orientations is None:
+            if sensor.offset is not None:
+                raise ValueError("Sensor offset requires satellite orientations")
+            continue
+
+        mount: Optional[np.ndarray] = sensor._mount_quaternion()
+
+        packet = {
+            "id": sensor.name,
+            "orientation": {
+                "epoch": _to_iso8601(epoch),
+                "unitQuaternion": _pack(
+                    offsets,
+                    multiply_packed(orientations, mount)
+                    if mount is not None
+                    else orientations,
+                ),
+            },
+        }
+
+        if sensor.offset is not None:
+            # r_S_ECEF = r_B_ECEF + q_B_ECEF * r_S_B
+            cartesian: np.ndarray = (
+                geodetic_to_cartesian(positions[:, 0], positions[:, 1], positions[:, 2])
+                if degrees
+                else positions
+            ) + rotate_packed(
+                orientations, [sensor.offset.x, sensor.offset.y, sensor.offset.z]
+            )
+            packet["position"] = {
+                "epoch": _to_iso8601(epoch),
+                "cartesian": _pack(offsets, cartesian),
+            }
+
+        yield packet
+
+
+def write_packets(fileobj: IO[str], packets: Iterable[dict]) -> None:
+
+    """
+    Write packets as a CZML document, one packet at a time.
+
+    fileobj: Text file object, or connected socket.
+    """
+
+    if hasattr(fileobj, "sendall"):
+        with fileobj.makefile("w", encoding="utf-8") as f:
+            write_packets(f, packets)
+        return
+
+    fileobj.write("[")
+
+    for (index, packet) in enumerate(packets):
+        if index > 0:
+            fileobj.write(",")
+        fileobj.write("\n")
+        fileobj.write(_dumps(packet))
+
+    fileobj.write("\n]\n")
+
+
+def document_packet(widget) -> dict:
+
+    clock_view_model = widget.clock_view_model
+
+    return _document(
+        clock_view_model.clock if clock_view_model is not None else None
+    )
+
+
+def clock_packet(clock: Clock) -> dict:
+
+    packet: dict = {}
+
+    if (clock.start_time is not None) and (clock.stop_time is not None):
+        packet["interval"] = _to_interval(clock.start_time, clock.stop_time)
+
+    if clock.current_time is not None:
+        packet["currentTime"] = _to_iso8601(clock.current_time)
+
+    if clock.multiplier is not None:
+        packet["multiplier"] = clock.multiplier
+
+    if clock.clock_range is not None:
+        packet["range"] = _to_enum(clock.clock_range)
+
+    if clock.clock_step is not None:
+        packet["step"] = _to_enum(clock.clock_step)
+
+    return packet
+
+
+def entity_packet(entity: _CesiumEntity, entity_id: str) -> dict:
+
+    packet: dict = {"id": entity_id}
+
+    if entity.name is not None:
+        packet["name"] = entity.name
+
+    _set(packet, "availability", entity.availability)
+    _set(packet, "position", entity.position)
+    _set(packet, "orientation", entity.orientation)
+    _set(packet, "path", entity.path)
+
+    klass: str = entity._klass
+    graphics: dict = {}
+
+    for prop in dict.fromkeys(entity._props + entity._common_props):
+        if prop not in PACKET_PROPS:
+            key: str = com._to_jskey(prop)
+            _set(graphics, PROPERTY_KEYS.get((klass, key), key), getattr(entity, prop))
+
+    packet[GRAPHICS_KEYS.get(klass, com._to_jskey(klass))] = graphics
+
+    return packet
+
+
+def batch_packets(batch: EntityBatch, prefix: str) -> Iterator[dict]:
+
+    """
+    Yield one packet per item of the batch.
+    """
+
+    klass: str = batch._klass
+    color_key: str = BATCH_COLOR_KEYS[klass]
+
+    columns: dict[str, Any] = {}
+    for (key, value) in batch.columns.items():
+        if key == "radius":
+            columns["topRadius"] = columns["bottomRadius"] = value
+        else:
+            columns[com._to_jskey(key)] = value
+
+    palette: Optional[list] = None
+    if batch._palette is not None:
+        palette = [_to_value(color_key, color) for color in batch._palette]
+
+    texts: Optional[list[str]] = getattr(batch, "text", None)
+
+    for (index, position) in enumerate(batch.positions.tolist()):
+
+        graphics: dict = {
+            key: value if isinstance(value, float) else float(value[index])
+            for (key, value) in columns.items()
+        }
+
+        if texts is not None:
+            graphics["text"] = texts[index]
+
+        if batch._color_values is None:
+            if palette is not None:
+                graphics[color_key] = palette[0]
+        elif palette is not None:
+            graphics[color_key] = palette[int(batch._color_values[index])]
+        else:
+            graphics[color_key] = _to_color(color_key, batch._color_values[index])
+
+        yield {
+            "id": f"{prefix}-{index}",
+            "position": {"cartographicDegrees": position},
+            klass: graphics,
+        }
+
+
+######################################################################################################################################################
+
+
+def _document(clock: Optional[Clock]) -> dict:
+
+    packet: dict = {"id": "document", "version": CZML_VERSION}
+
+    if clock is not None:
+        clock_properties: dict = clock_packet(clock)
+        if clock_properties:
+            packet["clock"] = clock_properties
+
+    return packet
+
+
+def _set(packet: dict, key: str, value: Any) -> None:
+
+    """
+    Set the CZML representation of value, None and unsupported values being skipped.
+    """
+
+    if value is None:
+        return
+
+    try:
+        packet[key] = _to_value(key, value)
+    except _Unsupported:
+        msg = "{key} cannot be exported to CZML, skipped: {value!r}"
+        warnings.warn(msg.format(key=key, value=value))
+
+
+def _to_value(key: str, value: Any) -> Any:
+
+    if isinstance(value, (bool, str)):
+        return value
+
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+
+    if isinstance(value, datetime):
+        return _to_iso8601(value)
+
+    if isinstance(value, _CesiumEnum):
+        return _to_enum(value)
+
+    if isinstance(value, Color):
+        return _to_color(key, value.rgba)
+
+    if isinstance(value, PolylineArrowMaterialProperty):
+        return {"polylineArrow": {"color": _to_color("color", value.color.rgba)}}
+
+    if isinstance(value, ImageMaterialProperty):
+        return {"image": {"image": value.image}}
+
+    if isinstance(value, Icon):
+        return value.image
+
+    if isinstance(value, SampledProperty):
+        return _to_sampled(value)
+
+    if isinstance(value, Quaternion):
+        return {"unitQuaternion": list(value._pack())}
+
+    if isinstance(value, Cartesian3Array):
+        return {"cartographicDegrees": value.values.ravel().tolist()}
+
+    if isinstance(value, Cartesian3):
+        if value._is_degrees:
+            return {"cartographicDegrees": [value.x, value.y, value.z]}
+        return {"cartesian": [value.x, value.y, value.z]}
+
+    if isinstance(value, Cartesian2):
+        return {"cartesian2": [value.x, value.y]}
+
+    if isinstance(value, Rectangle):
+        bounds = [value.west, value.south, value.east, value.north]
+        return {"wsenDegrees" if value._is_degrees else "wsen": bounds}
+
+    if isinstance(value, TimeIntervalCollection):
+        intervals = [_to_interval(i.start, i.stop) for i in value.intervals]
+        return intervals[0] if len(intervals) == 1 else intervals
+
+    if isinstance(value, TimeInterval):
+        return _to_interval(value.start, value.stop)
+
+    if isinstance(value, PathGraphics):
+        return _to_object(value)
+
+    if isinstance(value, list) and value:
+        if all(isinstance(v, Spherical) for v in value):
+            return {
+                "unitSpherical": [c for v in value for c in (v.clock, v.cone)],
+            }
+        if all(isinstance(v, Cartesian2) for v in value):
+            return {"cartesian2": [c for v in value for c in (v.x, v.y)]}
+
+    raise _Unsupported
+
+
+def _to_object(value: _CesiumObject) -> dict:
+
+    packet: dict = {}
+
+    for prop in value._props:
+        _set(packet, com._to_jskey(prop), getattr(value, prop))
+
+    return packet
+
+
+def _to_color(key: str, rgba) -> dict:
+
+    color: dict = {"rgbaf": [float(c) for c in rgba]}
+
+    if len(color["rgbaf"]) == 3:
+        color["rgbaf"].append(1.0)
+
+    if key in MATERIAL_KEYS:
+        return {"solidColor": {"color": color}}
+
+    return color
+
+
+def _to_sampled(value: SampledProperty) -> dict:
+
+    """
+    Return samples as a single packed array of time offsets from epoch and values.
+    """
+
+    store = value._store
+
+    if len(store) == 0:
+        raise _Unsupported
+
+    if store.is_columnar:
+        (values, degrees) = (store.values, store.degrees)
+    else:
+        objects = [store.value_at(index) for index in range(len(store))]
+        if any(getattr(type(o), "_packed_length", None) is None for o in objects):
+            raise _Unsupported
+        values = np.array([o._pack() for o in objects], dtype=np.float64)
+        degrees = {bool(getattr(o, "_is_degrees", False)) for o in objects}
+        if len(degrees) != 1:
+            raise _Unsupported
+        degrees = degrees.pop()
+
+    if issubclass(value._type, Cartesian3):
+        key = "cartographicDegrees" if degrees else "cartesian"
+    elif issubclass(value._type, Quaternion):
+        key = "unitQuaternion"
+    else:
+        raise _Unsupported
+
+    packet: dict = {
+        "epoch": _to_iso8601(store.epoch),
+        key: _pack(store.times, values),
+    }
+
+    if value.interpolation_algorithm is not None:
+        # "Cesium.LagrangePolynomialApproximation" -> "LAGRANGE"
+        packet["interpolationAlgorithm"] = value.interpolation_algorithm.name
+
+    if value.interpolation_degree is not None:
+        packet["interpolationDegree"] = value.interpolation_degree
+
+    reference_frame = getattr(value, "reference_frame", None)
+    if reference_frame is not None:
+        packet["referenceFrame"] = _to_enum(reference_frame)
+
+    return packet
+
+
+def _to_samples(values, size: int, length: int) -> np.ndarray:
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if values.shape != (size, length):
+        raise ValueError(
+            f"values must be of shape ({size}, {length}): {values.shape}"
+        )
+
+    return values
+
+
+def _pack(offsets: np.ndarray, values: np.ndarray) -> list[float]:
+
+    # [t0, v0..., t1, v1..., ...]
+    return np.column_stack([offsets, values]).ravel().tolist()
+
+
+def _to_enum(value: _CesiumEnum) -> str:
+
+    # "Cesium.ClockRange.CLAMPED" -> "CLAMPED"
+    return value.value.rsplit(".", 1)[-1]
+
+
+def _to_interval(start: Optional[datetime], stop: Optional[datetime]) -> str:
+
+    return "{start}/{stop}".format(
+        start=_to_iso8601(start) if start is not None else MINIMUM_TIME,
+        stop=_to_iso8601(stop) if stop is not None else MAXIMUM_TIME,
+    )
+
+
+def _to_iso8601(time: datetime) -> str:
+
+    """
+    Return time as an ISO 8601 UTC string, naive datetimes being regarded as UTC.
+    """
+
+    if time.tzinfo is not None:
+        time = time.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return time.isoformat() + "Z"
+
+
+def _dumps(packet: dict) -> str:
+
+    return json.dumps(packet, separators=(",", ":"), allow_nan=False)
+
+
+######################################################################################################################################################
@@ -9,10 +9,25 @@ import json
 current_dir = os.path.dirname(__file__)
 data_path = os.path.join(current_dir, "countries")
 
+# compiled store, built from data_path by build_country_store
+store_path = os.path.join(data_path, "countries.store")
+
 
 class CountryLoader(object):
     def __init__(self):
         self._countries = None
+        self._store = None
+
+    @property
+    def store(self):
+        """
+        Compiled CountryStore, memory-mapped on first use, None if it is not built
+        """
+        if (self._store is None) and os.path.exists(store_path):
+            from cesiumpy.data.store import CountryStore
+
+            self._store = CountryStore(store_path)
+        return self._store
 
     @property
     def countries(self):
@@ -30,21 +45,129 @@ class CountryLoader(object):
             self._countries = countries
         return self._countries
 
-    def get(self, name):
+    def get(self, name, tolerance=None, zoom=None, algorithm="douglas_peucker"):
+        """
+        Return entities of the country outline, simplified if tolerance (in degrees)
+        or zoom is passed.
+        """
+        if self.store is not None:
+            import cesiumpy
+            from cesiumpy.entities.cartesian import Cartesian3Array
+
+            outlines = self.outlines(
+                name, tolerance=tolerance, zoom=zoom, algorithm=algorithm
+            )
+            return [
+                cesiumpy.Polygon(hierarchy=Cartesian3Array(outline))
+                for outline in outlines
+            ]
+
         fname = name.lower()
         fname = self.countries.get(fname, fname)
         path = os.path.join(data_path, "data", "{0}.geo.json".format(fname))
         if os.path.exists(path):
             from cesiumpy.extension.io import read_geojson
 
-            return read_geojson(path)
+            return read_geojson(
+                path, tolerance=tolerance, zoom=zoom, algorithm=algorithm
+            )
         else:
             msg = "Unable to load country data, file not found: '{name}'"
             raise ValueError(msg.format(name=name))
 
+    def outlines(self, name, tolerance=None, zoom=None, algorithm="douglas_peucker"):
+        """
+        Return outlines of the country from the compiled store, as (N, 2) float32
+        longitude, latitude arrays.
+
+        The coarsest pre-simplified level within tolerance is sliced from the
+        memory-mapped store without copy, and simplified further with algorithm if
+        tolerance is larger than its own.
+        """
+        store = self.store
+        if store is None:
+            msg = "Unable to load country data, store not built: '{path}'"
+            raise ValueError(msg.format(path=store_path))
+
+        if name not in store:
+            msg = "Unable to load country data, file not found: '{name}'"
+            raise ValueError(msg.format(name=name))
+
+        if (tolerance is None) and (zoom is not None):
+            from cesiumpy.math.simplification import zoom_tolerance
+
+            tolerance = zoom_tolerance(zoom)
+
+        level = store.level(tolerance)
+        outlines = store.get(name, level=level)
+
+        if (tolerance is None) or (tolerance <= store.tolerances[level]):
+            return outlines
+
+        from cesiumpy.math.simplification import simplify
+
+        return [
+            outline[simplify(outline, tolerance, algorithm=algorithm)]
+            for outline in outlines
+        ]
+
     def __getattr__(self, name):
         try:
             return self.get(name)
         except ValueError:
             msg = "Unable to load country data, file not found: '{name}'"
             raise AttributeError(msg.format(name=name))
+
+
+def build_country_store(path=None, source=None, tolerances=None):
+    """
+    Compile the countries.json index and <cca3>.geo.json outlines of source directory
+    into a CountryStore at path, and return it.
+    Polygons are stored as their exterior, as to_entity does, holes being dropped
+    with a warning.
+    """
+    from cesiumpy.data.store import build_store
+    from cesiumpy.extension.shapefile import _warn_holes
+
+    path = path or store_path
+    source = source or data_path
+
+    with open(os.path.join(source, "countries.json")) as f:
+        entries = json.load(f)
+
+    aliases = {}
+    countries = {}
+    holes = 0
+
+    for entry in entries:
+        cca3 = entry["cca3"].lower()
+        aliases[entry["cca2"].lower()] = cca3
+        aliases[entry["name"]["official"].lower()] = cca3
+
+        geo = os.path.join(source, "data", "{0}.geo.json".format(cca3))
+        if not os.path.exists(geo):
+            continue
+
+        with open(geo) as f:
+            features = json.load(f)["features"]
+
+        outlines = []
+        for feature in features:
+            geometry = feature["geometry"]
+            if geometry["type"] == "Polygon":
+                polygons = [geometry["coordinates"]]
+            elif geometry["type"] == "MultiPolygon":
+                polygons = geometry["coordinates"]
+            else:
+                continue
+            outlines.extend(polygon[0] for polygon in polygons)
+            holes += sum(len(polygon) - 1 for polygon in polygons)
+        countries[cca3] = outlines
+
+    _warn_holes(holes)
+
+    return build_store(path, countries, aliases=aliases, tolerances=tolerances)
+
+
+if __name__ == "__main__":
+    print(build_country_store())
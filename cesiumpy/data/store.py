@@ -0,0 +1,229 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/data/store.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+import cesiumpy.math.simplification as simplification
+
+######################################################################################################################################################
+
+MAGIC: bytes = b"CPYCTRY1"
+
+# Tolerances of the pre-simplified levels of detail, in degrees, full resolution first
+DEFAULT_TOLERANCES: list[float] = [0.0] + [
+    simplification.zoom_tolerance(zoom) for zoom in ("region", "country", "continent")
+]
+
+######################################################################################################################################################
+
+
+class CountryStore:
+
+    """
+    Compiled country outlines, memory-mapped from a single file.
+
+    The file holds a JSON header with the name / alias index and the part ranges of each
+    country and level of detail, followed by the int64 offsets of the parts and their
+    packed float32 longitude, latitude coordinates.
+    """
+
+    # Constructor
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Unable to load country store, invalid file: {path}")
+
+            (length,) = struct.unpack("<Q", f.read(8))
+            header: dict = json.loads(f.read(length).decode("utf-8"))
+
+        start: int = _align(len(MAGIC) + 8 + length)
+        parts: int = header["parts"]
+
+        self._path = path
+        self._tolerances: list[float] = header["tolerances"]
+        self._aliases: dict[str, str] = header["aliases"]
+        self._countries: dict[str, list[list[int]]] = header["countries"]
+
+        self._offsets: np.ndarray = np.memmap(
+            path, dtype="<i8", mode="r", offset=start, shape=(parts + 1,)
+        )
+        self._coordinates: np.ndarray = np.memmap(
+            path,
+            dtype="<f4",
+            mode="r",
+            offset=start + 8 * (parts + 1),
+            shape=(max(header["points"], 1), 2),
+        )
+
+    # Properties
+
+    @property
+    def path(self) -> Union[str, os.PathLike]:
+        return self._path
+
+    @property
+    def tolerances(self) -> list[float]:
+        return self._tolerances
+
+    @property
+    def codes(self) -> list[str]:
+        return list(self._countries)
+
+    # Methods
+
+    def resolve(self, name: str) -> Optional[str]:
+
+        """
+        Return the code of the country named name, its code or an alias, None if unknown.
+        """
+
+        key: str = name.lower()
+        code: str = self._aliases.get(key, key)
+
+        return code if code in self._countries else None
+
+    def level(self, tolerance: Optional[float] = None) -> int:
+
+        """
+        Return the coarsest level of detail simplified within tolerance, in degrees.
+        """
+
+        if tolerance is None:
+            return 0
+
+        return max(
+            index
+            for (index, value) in enumerate(self._tolerances)
+            if value <= tolerance
+        )
+
+    def get(self, name: str, level: int = 0) -> list[np.ndarray]:
+
+        """
+        Return the outlines of the country as (N, 2) float32 views of the file.
+        """
+
+        code: Optional[str] = self.resolve(name)
+
+        if code is None:
+            raise KeyError(name)
+
+        (first, stop) = self._countries[code][level]
+        offsets = self._offsets[first : stop + 1]
+
+        return [
+            self._coordinates[offsets[index] : offsets[index + 1]]
+            for index in range(stop - first)
+        ]
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._countries)
+
+    def __repr__(self) -> str:
+        return f"CountryStore({len(self)})"
+
+
+######################################################################################################################################################
+
+
+def build_store(
+    path: Union[str, os.PathLike],
+    countries: dict[str, Iterable[np.ndarray]],
+    aliases: Optional[dict[str, str]] = None,
+    tolerances: Optional[list[float]] = None,
+) -> CountryStore:
+
+    """
+    Write countries, a dict of code and (N, 2) longitude, latitude outlines, to a store at
+    path, simplified with Douglas-Peucker at each tolerance, and return the store.
+
+    aliases maps lower case names to codes.
+    """
+
+    tolerances = sorted(tolerances if tolerances is not None else DEFAULT_TOLERANCES)
+
+    if tolerances[0] != 0.0:
+        tolerances = [0.0] + tolerances
+
+    parts: list[np.ndarray] = []
+    ranges: dict[str, list[list[int]]] = {}
+
+    for (code, outlines) in countries.items():
+
+        outlines = [
+            np.asarray(outline, dtype=np.float64)[:, :2] for outline in outlines
+        ]
+
+        ranges[code.lower()] = []
+
+        for tolerance in tolerances:
+
+            first: int = len(parts)
+
+            for outline in outlines:
+                if tolerance > 0.0:
+                    outline = outline[simplification.simplify(outline, tolerance)]
+                parts.append(outline.astype("<f4"))
+
+            ranges[code.lower()].append([first, len(parts)])
+
+    offsets = np.zeros(len(parts) + 1, dtype="<i8")
+    np.cumsum([len(part) for part in parts], out=offsets[1:])
+
+    header: bytes = json.dumps(
+        {
+            "tolerances": tolerances,
+            "aliases": {
+                key.lower(): value.lower() for (key, value) in (aliases or {}).items()
+            },
+            "countries": ranges,
+            "parts": len(parts),
+            "points": int(offsets[-1]),
+        }
+    ).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        f.write(offsets.tobytes())
+        for part in parts:
+            f.write(part.tobytes())
+        if offsets[-1] == 0:
+            # single padding point, so that coordinates can be memory-mapped
+            f.write(np.zeros((1, 2), dtype="<f4").tobytes())
+
+    return CountryStore(path)
+
+
+######################################################################################################################################################
+
+
+def _align(position: int) -> int:
+
+    """
+    Return position rounded up to a multiple of 8 bytes.
+    """
+
+    return (position + 7) // 8 * 8
+
+
+######################################################################################################################################################
@@ -0,0 +1,572 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/entities/batch.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any, Optional, Union
+
+import numpy as np
+
+import cesiumpy
+from cesiumpy.base import _CesiumObject
+import cesiumpy.util.common as com
+
+######################################################################################################################################################
+
+
+class _Batch(_CesiumObject):
+
+    """
+    Columnar storage of a batch of items, emitted as a single packed data array looped over in JavaScript.
+
+    Per-item numeric columns are stored as float64 arrays, scalar columns as floats emitted as literals.
+
+    Colors are either a single color, a list of colors (emitted as a palette indexed per item),
+    or a (N, 3) / (N, 4) array of RGB(A) components between 0 and 1.
+    """
+
+    # Constructor
+
+    def __init__(
+        self,
+        count: int,
+        color=None,
+        **columns,
+    ) -> None:
+
+        self._count: int = count
+
+        # scalar columns are emitted as literals, not as part of the data array
+        self._columns: dict[str, Union[float, np.ndarray]] = {
+            key: (
+                float(com.validate_numeric(value, key=key))
+                if not com.is_listlike(value)
+                else _to_column(value, count, key=key)
+            )
+            for key, value in columns.items()
+        }
+
+        (self._palette, self._color_values) = _to_colors(color, count)
+
+    # Properties
+
+    @property
+    def columns(self) -> dict[str, Union[float, np.ndarray]]:
+        return self._columns
+
+    @property
+    def colors(self) -> Optional[np.ndarray]:
+
+        """
+        Return colors as a (N, 4) array of RGBA components between 0 and 1, None if no color.
+        """
+
+        if self._color_values is None:
+            if self._palette is None:
+                return None
+            return np.tile(self._palette[0].rgba, (len(self), 1))
+
+        if self._palette is not None:
+            palette: np.ndarray = np.array([color.rgba for color in self._palette])
+            return palette[self._color_values.astype(np.int64)]
+
+        if self._color_values.shape[1] == 3:
+            return np.column_stack([self._color_values, np.ones(len(self))])
+
+        return self._color_values
+
+    # Methods
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)})"
+
+    # Private methods
+
+    def _pack(
+        self,
+        widget=None,
+        leading: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, dict[str, str], Optional[str], str]:
+
+        """
+        Return (data, accessors, color, palette).
+
+        data: (N, k) array of the leading columns (accessed as data[i], data[i + 1], ...),
+            array columns and color values.
+        accessors: JavaScript expressions of the columns of the item at data[i].
+        color: JavaScript expression of the color of the item at data[i], None if no color.
+        palette: JavaScript array of the palette colors.
+        """
+
+        columns: list[np.ndarray] = []
+        offset: int = 0
+
+        if leading is not None:
+            columns.append(leading)
+            offset = leading.shape[1]
+
+        accessors: dict[str, str] = {}
+
+        for (key, value) in self._columns.items():
+            if isinstance(value, float):
+                accessors[key] = repr(value)
+            else:
+                columns.append(value)
+                accessors[key] = _data_accessor(offset)
+                offset += 1
+
+        color: Optional[str] = None
+        if self._color_values is not None:
+            columns.append(self._color_values)
+            if self._palette is not None:
+                color = f"colors[{_data_accessor(offset)}]"
+            else:
+                components = ", ".join(
+                    _data_accessor(offset + k)
+                    for k in range(self._color_values.shape[1])
+                )
+                color = f"new Cesium.Color({components})"
+        elif self._palette is not None:
+            color = "colors[0]"
+
+        data: np.ndarray = (
+            np.column_stack(columns) if columns else np.empty((len(self), 0))
+        )
+
+        palette: str = "[{0}]".format(
+            ", ".join(c.generate_script(widget=widget) for c in self._palette or [])
+        )
+
+        return (data, accessors, color, palette)
+
+    def _extra_arguments(self) -> dict[str, str]:
+
+        """
+        Return additional non-numeric arguments of the loop function, as name to JavaScript expression.
+        """
+
+        return {}
+
+
+######################################################################################################################################################
+
+
+class EntityBatch(_Batch):
+
+    """
+    Columnar batch of entities.
+
+    Positions and per-entity columns are emitted as a single packed data array added to widget.entities
+    by one JavaScript loop, instead of one entities.add statement per entity.
+    """
+
+    # Definitions
+
+    _is_batch = True
+
+    # Name of the graphics property, e.g. "point"
+    _klass: Optional[str] = None
+
+    # Constructor
+
+    def __init__(
+        self,
+        x,
+        y,
+        z=None,
+        color=None,
+        **columns,
+    ) -> None:
+
+        self._positions: np.ndarray = _to_positions(x, y, z)
+
+        super().__init__(len(self._positions), color=color, **columns)
+
+    # Properties
+
+    @property
+    def positions(self) -> np.ndarray:
+
+        """
+        Return positions as a (N, 3) longitude, latitude, height array.
+        """
+
+        return self._positions
+
+    # Methods
+
+    def take(self, indices) -> EntityBatch:
+
+        """
+        Return a batch of the entities at indices, an integer or boolean array.
+        """
+
+        indices = np.arange(len(self))[indices]
+
+        batch: EntityBatch = copy.copy(self)
+
+        # the copy is not watched for changes, nor held by anything yet
+        for key in ("_script_parents", "_script_version"):
+            batch.__dict__.pop(key, None)
+
+        batch._take(indices)
+
+        return batch
+
+    def generate_script(self, widget=None) -> str:
+
+        varname: str = widget._varname if widget is not None else "widget"
+
+        (data, accessors, color, palette) = self._pack(widget, self._positions)
+
+        script: str = (
+            "(function (data, colors{args}) {{ "
+            "for (let j = 0; j < {length}; j++) {{ "
+            "const i = j * {width}; "
+            "{varname}.entities.add({{position: Cesium.Cartesian3.fromDegrees(data[i], data[i + 1], data[i + 2]), "
+            "{klass}: {graphics}}}); "
+            "}} "
+            "}})({data}, {palette}{values});"
+        )
+
+        extra: dict[str, str] = self._extra_arguments()
+
+        return script.format(
+            args="".join(f", {key}" for key in extra),
+            length=len(self),
+            width=data.shape[1],
+            varname=varname,
+            klass=self._klass,
+            graphics=self._generate_graphics(accessors, color),
+            data=com.to_jsfloat64array(data.ravel()),
+            palette=palette,
+            values="".join(f", {value}" for value in extra.values()),
+        )
+
+    # Private methods
+
+    def _take(self, indices: np.ndarray) -> None:
+
+        """
+        Keep the entities at indices only.
+        """
+
+        self._count = len(indices)
+        self._positions = self._positions[indices]
+        self._columns = {
+            key: (value if isinstance(value, float) else value[indices])
+            for (key, value) in self._columns.items()
+        }
+
+        if self._color_values is not None:
+            self._color_values = self._color_values[indices]
+
+    def _generate_graphics(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        """
+        Return JavaScript object of the graphics of the entity at data[i].
+        """
+
+        raise NotImplementedError
+
+
+######################################################################################################################################################
+
+
+class PointBatch(EntityBatch):
+
+    """
+    Batch of Point entities.
+
+    Parameters
+    ----------
+
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    z: list or float, default 0
+        Heights
+    size: list or float, default 10
+        Pixel size
+    color: list, Color or array, default WHITE
+        Point color
+    """
+
+    _klass = "point"
+
+    def __init__(self, x, y, z=None, size=None, color=None) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=z,
+            color=color if color is not None else cesiumpy.color.WHITE,
+            pixel_size=size if size is not None else 10.0,
+        )
+
+    def _generate_graphics(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+        return f"{{pixelSize: {accessors['pixel_size']}, color: {color}}}"
+
+
+class CylinderBatch(EntityBatch):
+
+    """
+    Batch of Cylinder entities standing on the globe, as used by bar plots.
+
+    Parameters
+    ----------
+
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    length: list or float
+        Cylinder lengths
+    radius: list or float, default 10e3
+        Cylinder radius
+    color: list, Color or array, optional
+        Cylinder material
+    bottom: list or float, default 0
+        Bottom heights
+    """
+
+    _klass = "cylinder"
+
+    def __init__(
+        self,
+        x,
+        y,
+        length,
+        radius=10e3,
+        color=None,
+        bottom=0.0,
+    ) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=bottom,
+            color=color,
+            length=length,
+            radius=radius if radius is not None else 10e3,
+        )
+
+        # position is the center of the cylinder
+        self._positions[:, 2] += self._columns["length"] / 2.0
+
+    def _generate_graphics(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        graphics: str = (
+            f"length: {accessors['length']}, "
+            f"topRadius: {accessors['radius']}, "
+            f"bottomRadius: {accessors['radius']}"
+        )
+
+        if color is not None:
+            graphics += f", material: {color}"
+
+        return f"{{{graphics}}}"
+
+
+class LabelBatch(EntityBatch):
+
+    """
+    Batch of Label entities.
+
+    Parameters
+    ----------
+
+    text: list
+        List of labels
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    z: list or float, default 0
+        Heights
+    size: list or float, default 1
+        Text scale
+    color: list, Color or array, optional
+        Text color
+    """
+
+    _klass = "label"
+
+    def __init__(self, text, x, y, z=None, size=None, color=None) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=z,
+            color=color,
+            scale=size if size is not None else 1.0,
+        )
+
+        self._text: list[str] = [
+            str(t) for t in _to_list(text, len(self), key="text")
+        ]
+
+    @property
+    def text(self) -> list[str]:
+        return self._text
+
+    def _generate_graphics(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        graphics: str = f"text: text[j], scale: {accessors['scale']}"
+
+        if color is not None:
+            graphics += f", fillColor: {color}"
+
+        return f"{{{graphics}}}"
+
+    def _take(self, indices: np.ndarray) -> None:
+        super()._take(indices)
+        self._text = [self._text[index] for index in indices]
+
+    def _extra_arguments(self) -> dict[str, str]:
+        # escape "</" so that texts cannot close the enclosing script tag
+        return {"text": json.dumps(self._text).replace("</", "<\\/")}
+
+
+######################################################################################################################################################
+
+
+def _data_accessor(offset: int) -> str:
+
+    """
+    Return JavaScript expression of the column at offset of the item at data[i].
+    """
+
+    return f"data[i + {offset}]" if offset else "data[i]"
+
+
+def _to_positions(x, y, z=None) -> np.ndarray:
+
+    """
+    Return (N, 3) longitude, latitude, height array, z being broadcast and defaulting to 0.
+    """
+
+    if not com.is_listlike(x):
+        raise ValueError("x must be list-likes: {x}".format(x=x))
+
+    length: int = len(x)
+
+    return com.validate_array_lonlat(
+        np.column_stack(
+            [
+                _to_column(x, length, key="x"),
+                _to_column(y, length, key="y"),
+                _to_column(z, length, key="z", default=0.0),
+            ]
+        ),
+        key="positions",
+    )
+
+
+def _to_list(x, length: int, key: str) -> list[Any]:
+
+    """
+    Broadcast scalar x to a list of length, and validate the length of list-like x.
+    """
+
+    if not com.is_listlike(x):
+        return [x] * length
+
+    if len(x) != length:
+        msg = "{key} length must be {length}: {x}"
+        raise ValueError(msg.format(key=key, length=length, x=x))
+
+    return list(x)
+
+
+def _to_column(
+    x, length: int, key: str, default: Optional[float] = None
+) -> np.ndarray:
+
+    """
+    Broadcast x to a float64 array of length, float64 arrays are not copied.
+    """
+
+    if x is None:
+        x = default
+
+    if not com.is_listlike(x):
+        com.validate_numeric(x, key=key)
+        return np.full(length, x, dtype=np.float64)
+
+    if len(x) != length:
+        msg = "{key} length must be {length}: {x}"
+        raise ValueError(msg.format(key=key, length=length, x=x))
+
+    try:
+        return np.asarray(x, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("{key} must be numeric: {x}".format(key=key, x=x))
+
+
+def _to_colors(x, length: int) -> tuple[Optional[list[Any]], Optional[np.ndarray]]:
+
+    """
+    Return (palette, values) of colors.
+
+    A single color is a palette of one color without values, a list of colors a palette with
+    (N,) palette indices, and a numeric (N, 3) / (N, 4) array no palette with RGB(A) values.
+    """
+
+    if x is None:
+        return (None, None)
+
+    if isinstance(x, np.ndarray) and x.ndim == 2 and x.dtype.kind in "iuf":
+        if x.shape not in ((length, 3), (length, 4)):
+            msg = "color must be of shape ({length}, 3) or ({length}, 4): {shape}"
+            raise ValueError(msg.format(length=length, shape=x.shape))
+        if not ((x >= 0.0).all() and (x <= 1.0).all()):
+            raise ValueError("color components must be between 0 and 1")
+        return (None, np.asarray(x, dtype=np.float64))
+
+    if not com.is_listlike(x):
+        return ([cesiumpy.color.Color.maybe(x)], None)
+
+    colors: list[Any] = _to_list(x, length, key="color")
+
+    palette: list[Any] = []
+    indices: dict[str, int] = {}
+    values: np.ndarray = np.empty(length, dtype=np.float64)
+
+    # colors are mostly repeated names or instances, convert each of them once
+    converted: dict[Any, int] = {}
+
+    for (index, color) in enumerate(colors):
+        key = color if isinstance(color, str) else id(color)
+        if key not in converted:
+            color = cesiumpy.color.Color.maybe(color)
+            script: str = color.generate_script()
+            if script not in indices:
+                indices[script] = len(palette)
+                palette.append(color)
+            converted[key] = indices[script]
+        values[index] = converted[key]
+
+    return (palette, values)
+
+
+######################################################################################################################################################
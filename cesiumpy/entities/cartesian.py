@@ -10,11 +10,14 @@ from __future__ import annotations
 from __future__ import unicode_literals
 
 import math
+
+import numpy as np
 import traitlets
 
 from cesiumpy.base import _CesiumObject
 import cesiumpy.extension.geocode as geocode
 import cesiumpy.extension.shapefile as shapefile
+import cesiumpy.math.simplification as simplification
 import cesiumpy.util.common as com
 
 ######################################################################################################################################################
@@ -122,6 +125,9 @@ class Cartesian3(_Cartesian):
 
     # Definitions
 
+    # Number of floats used to store a Cartesian3 in a columnar sample store.
+    _packed_length = 3
+
     x = traitlets.Float()
     y = traitlets.Float()
     z = traitlets.Float()
@@ -241,26 +247,60 @@ class Cartesian3(_Cartesian):
 
         return f"Cartesian3({self.x}, {self.y}, {self.z})"
 
+    def _pack(self) -> tuple[float, float, float]:
+
+        """
+        Return vector components as a tuple of floats.
+        """
+
+        return (self.x, self.y, self.z)
+
     # Class methods
 
+    @classmethod
+    def _unpack(cls, values, degrees: bool = False) -> Cartesian3:
+
+        """
+        Return Cartesian3 from a sequence of 3 floats.
+        """
+
+        (x, y, z) = values
+
+        return Cartesian3(x, y, z, degrees=degrees)
+
     @classmethod
     def fromDegrees(cls, x, y, z) -> Cartesian3:
         return Cartesian3(x, y, z, degrees=True)
 
     @classmethod
     def fromDegreesArray(cls, x) -> Cartesian3Array:
-        # convert shaply.Polygon to coordinateslist
-        x = shapefile._maybe_shapely_polygon(x)
-        x = shapefile._maybe_shapely_line(x)
-        x = geocode._maybe_geocode(x, height=0)
+        """
+        x: flat list of longitude, latitude, list of (longitude, latitude) or (longitude, latitude, height)
+        tuples, or (N, 2) / (N, 3) ndarray which is not copied.
+        """
+        if isinstance(x, Cartesian3Array):
+            return x
 
-        if com.is_listlike_2elem(x):
-            x = com._flatten_list_of_listlike(x)
-        elif com.is_listlike_3elem(x):
-            raise NotImplementedError
+        try:
+            # numeric input skips per-element shapely and geocode conversion
+            x = com.validate_array_lonlat(x, "x", width=2)
+        except ValueError:
+            # convert shaply.Polygon to coordinateslist
+            x = shapefile._maybe_shapely_polygon(x)
+            x = shapefile._maybe_shapely_line(x)
+            x = geocode._maybe_geocode(x, height=0)
+            x = com.validate_array_lonlat(x, "x", width=2)
 
         return Cartesian3Array(x)
 
+    @classmethod
+    def fromDegreesArrayHeights(cls, x) -> Cartesian3Array:
+        """
+        x: flat list of longitude, latitude, height, list of (longitude, latitude, height) tuples,
+        or (N, 3) ndarray which is not copied.
+        """
+        return Cartesian3Array(x)
+
     @classmethod
     def maybe(cls, x, degrees=False):
         """Convert list or tuple to Cartesian3"""
@@ -286,21 +326,67 @@ class Cartesian3(_Cartesian):
 
 class Cartesian3Array(_Cartesian):
 
+    """
+    Array of positions in degrees, stored as (N, 2) longitude, latitude or
+    (N, 3) longitude, latitude, height float64 ndarray.
+    """
+
     _is_array = True
 
     def __init__(self, x):
         if isinstance(x, Cartesian3Array):
-            x = x.x
+            x = x._values
 
-        self.x = com.validate_listlike_lonlatalt(x, "x")
+        # flat list-likes are regarded as longitude, latitude, height
+        self._values = com.validate_array_lonlat(x, "x", width=3)
         # currently, array always be degrees
         self._is_degrees = True
 
+    @property
+    def x(self) -> list:
+        return self._values.ravel().tolist()
+
+    @property
+    def has_heights(self) -> bool:
+        return self._values.shape[1] == 3
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Return positions as (N, 3) longitude, latitude, height ndarray.
+        """
+        if self.has_heights:
+            return self._values
+        return np.column_stack([self._values, np.zeros(len(self._values))])
+
+    def simplify(
+        self, tolerance=None, algorithm: str = "douglas_peucker", zoom=None
+    ) -> Cartesian3Array:
+        """
+        Return positions simplified with algorithm, "douglas_peucker" or "visvalingam".
+
+        tolerance is in degrees. Otherwise, it is the width of a pixel at zoom, a web map zoom
+        level or a name of cesiumpy.math.ZOOM_LEVELS such as "country".
+        """
+        if tolerance is None:
+            if zoom is None:
+                raise ValueError("tolerance or zoom must be provided")
+            tolerance = simplification.zoom_tolerance(zoom)
+
+        indices = simplification.simplify(self._values, tolerance, algorithm=algorithm)
+
+        if len(indices) == len(self._values):
+            return self
+        return Cartesian3Array(self._values[indices])
+
     def __len__(self):
-        return len(self.x)
+        return len(self._values)
 
     def __repr__(self):
-        rep = """Cartesian3.fromDegreesArrayHeights({x})"""
+        if self.has_heights:
+            rep = """Cartesian3.fromDegreesArrayHeights({x})"""
+        else:
+            rep = """Cartesian3.fromDegreesArray({x})"""
         return rep.format(x=self.x)
 
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 from __future__ import annotations
 
 import random
+import re
 from typing import Optional
 import six
 import traitlets
@@ -31,6 +32,12 @@ class Color(Material):
         self.blue = blue
         self.alpha = alpha
 
+    @property
+    def rgba(self) -> tuple[float, float, float, float]:
+        """Return (red, green, blue, alpha) components between 0 and 1"""
+        alpha = self.alpha if self.alpha is not None else 1.0
+        return (self.red, self.green, self.blue, alpha)
+
     def with_alpha(self, alpha):
         self.alpha = alpha
         return self
@@ -161,6 +168,15 @@ class CSSColor(Color):
         self.name = name
         self.alpha = alpha
 
+    # Properties
+
+    @property
+    def rgba(self) -> tuple[float, float, float, float]:
+        (red, green, blue, alpha) = _parse_css_color(self.name)
+        if self.alpha is not None:
+            alpha = self.alpha
+        return (red, green, blue, alpha)
+
     # Methods
 
     def copy(self) -> CSSColor:
@@ -185,6 +201,45 @@ class ColorConstant(CSSColor):
             return rep.format(name=self.name, alpha=self.alpha)
 
 
+def _parse_css_color(name: str) -> tuple[float, float, float, float]:
+    """
+    Return (red, green, blue, alpha) components of a CSS color name,
+    #rgb(a) / #rrggbb(aa) or rgb() / rgba() value
+    """
+    value = name.strip()
+    key = value.upper()
+
+    if key == "TRANSPARENT":
+        return (0.0, 0.0, 0.0, 0.0)
+
+    value = _COLOR_VALUES.get(key, _COLOR_VALUES.get(_SINGLE_COLORS.get(key), value))
+
+    if re.fullmatch(r"#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})", value):
+        digits = value[1:]
+        if len(digits) <= 4:
+            digits = "".join(d * 2 for d in digits)
+        components = [
+            int(digits[i : i + 2], 16) / 255.0 for i in range(0, len(digits), 2)
+        ]
+        if len(components) == 3:
+            components.append(1.0)
+        return tuple(components)
+
+    match = re.fullmatch(r"rgba?\(([^)]*)\)", value.replace(" ", ""))
+    if match is not None:
+        parts = match.group(1).split(",")
+        if len(parts) in (3, 4):
+            try:
+                components = [float(p) / 255.0 for p in parts[:3]]
+                components.append(float(parts[3]) if len(parts) == 4 else 1.0)
+                return tuple(components)
+            except ValueError:
+                pass
+
+    msg = "Unable to convert CSS color to components: {name}"
+    raise ValueError(msg.format(name=name))
+
+
 class ColorMap(_CesiumObject):
 
     name = traitlets.Unicode()
@@ -414,3 +469,153 @@ _COLORS = [
     "YELLOW",
     "YELLOWGREEN",
 ]
+
+# CSS values of color constants, TRANSPARENT being rgba(0, 0, 0, 0)
+_COLOR_VALUES = {
+    "ALICEBLUE": "#F0F8FF",
+    "ANTIQUEWHITE": "#FAEBD7",
+    "AQUA": "#00FFFF",
+    "AQUAMARINE": "#7FFFD4",
+    "AZURE": "#F0FFFF",
+    "BEIGE": "#F5F5DC",
+    "BISQUE": "#FFE4C4",
+    "BLACK": "#000000",
+    "BLANCHEDALMOND": "#FFEBCD",
+    "BLUE": "#0000FF",
+    "BLUEVIOLET": "#8A2BE2",
+    "BROWN": "#A52A2A",
+    "BURLYWOOD": "#DEB887",
+    "CADETBLUE": "#5F9EA0",
+    "CHARTREUSE": "#7FFF00",
+    "CHOCOLATE": "#D2691E",
+    "CORAL": "#FF7F50",
+    "CORNFLOWERBLUE": "#6495ED",
+    "CORNSILK": "#FFF8DC",
+    "CRIMSON": "#DC143C",
+    "CYAN": "#00FFFF",
+    "DARKBLUE": "#00008B",
+    "DARKCYAN": "#008B8B",
+    "DARKGOLDENROD": "#B8860B",
+    "DARKGRAY": "#A9A9A9",
+    "DARKGREEN": "#006400",
+    "DARKGREY": "#A9A9A9",
+    "DARKKHAKI": "#BDB76B",
+    "DARKMAGENTA": "#8B008B",
+    "DARKOLIVEGREEN": "#556B2F",
+    "DARKORANGE": "#FF8C00",
+    "DARKORCHID": "#9932CC",
+    "DARKRED": "#8B0000",
+    "DARKSALMON": "#E9967A",
+    "DARKSEAGREEN": "#8FBC8F",
+    "DARKSLATEBLUE": "#483D8B",
+    "DARKSLATEGRAY": "#2F4F4F",
+    "DARKSLATEGREY": "#2F4F4F",
+    "DARKTURQUOISE": "#00CED1",
+    "DARKVIOLET": "#9400D3",
+    "DEEPPINK": "#FF1493",
+    "DEEPSKYBLUE": "#00BFFF",
+    "DIMGRAY": "#696969",
+    "DIMGREY": "#696969",
+    "DODGERBLUE": "#1E90FF",
+    "FIREBRICK": "#B22222",
+    "FLORALWHITE": "#FFFAF0",
+    "FORESTGREEN": "#228B22",
+    "FUSCHIA": "#FF00FF",
+    "GAINSBORO": "#DCDCDC",
+    "GHOSTWHITE": "#F8F8FF",
+    "GOLD": "#FFD700",
+    "GOLDENROD": "#DAA520",
+    "GRAY": "#808080",
+    "GREEN": "#008000",
+    "GREENYELLOW": "#ADFF2F",
+    "GREY": "#808080",
+    "HONEYDEW": "#F0FFF0",
+    "HOTPINK": "#FF69B4",
+    "INDIANRED": "#CD5C5C",
+    "INDIGO": "#4B0082",
+    "IVORY": "#FFFFF0",
+    "KHAKI": "#F0E68C",
+    "LAVENDAR_BLUSH": "#FFF0F5",
+    "LAVENDER": "#E6E6FA",
+    "LAWNGREEN": "#7CFC00",
+    "LEMONCHIFFON": "#FFFACD",
+    "LIGHTBLUE": "#ADD8E6",
+    "LIGHTCORAL": "#F08080",
+    "LIGHTCYAN": "#E0FFFF",
+    "LIGHTGOLDENRODYELLOW": "#FAFAD2",
+    "LIGHTGRAY": "#D3D3D3",
+    "LIGHTGREEN": "#90EE90",
+    "LIGHTGREY": "#D3D3D3",
+    "LIGHTPINK": "#FFB6C1",
+    "LIGHTSEAGREEN": "#20B2AA",
+    "LIGHTSKYBLUE": "#87CEFA",
+    "LIGHTSLATEGRAY": "#778899",
+    "LIGHTSLATEGREY": "#778899",
+    "LIGHTSTEELBLUE": "#B0C4DE",
+    "LIGHTYELLOW": "#FFFFE0",
+    "LIME": "#00FF00",
+    "LIMEGREEN": "#32CD32",
+    "LINEN": "#FAF0E6",
+    "MAGENTA": "#FF00FF",
+    "MAROON": "#800000",
+    "MEDIUMAQUAMARINE": "#66CDAA",
+    "MEDIUMBLUE": "#0000CD",
+    "MEDIUMORCHID": "#BA55D3",
+    "MEDIUMPURPLE": "#9370DB",
+    "MEDIUMSEAGREEN": "#3CB371",
+    "MEDIUMSLATEBLUE": "#7B68EE",
+    "MEDIUMSPRINGGREEN": "#00FA9A",
+    "MEDIUMTURQUOISE": "#48D1CC",
+    "MEDIUMVIOLETRED": "#C71585",
+    "MIDNIGHTBLUE": "#191970",
+    "MINTCREAM": "#F5FFFA",
+    "MISTYROSE": "#FFE4E1",
+    "MOCCASIN": "#FFE4B5",
+    "NAVAJOWHITE": "#FFDEAD",
+    "NAVY": "#000080",
+    "OLDLACE": "#FDF5E6",
+    "OLIVE": "#808000",
+    "OLIVEDRAB": "#6B8E23",
+    "ORANGE": "#FFA500",
+    "ORANGERED": "#FF4500",
+    "ORCHID": "#DA70D6",
+    "PALEGOLDENROD": "#EEE8AA",
+    "PALEGREEN": "#98FB98",
+    "PALETURQUOISE": "#AFEEEE",
+    "PALEVIOLETRED": "#DB7093",
+    "PAPAYAWHIP": "#FFEFD5",
+    "PEACHPUFF": "#FFDAB9",
+    "PERU": "#CD853F",
+    "PINK": "#FFC0CB",
+    "PLUM": "#DDA0DD",
+    "POWDERBLUE": "#B0E0E6",
+    "PURPLE": "#800080",
+    "RED": "#FF0000",
+    "ROSYBROWN": "#BC8F8F",
+    "ROYALBLUE": "#4169E1",
+    "SADDLEBROWN": "#8B4513",
+    "SALMON": "#FA8072",
+    "SANDYBROWN": "#F4A460",
+    "SEAGREEN": "#2E8B57",
+    "SEASHELL": "#FFF5EE",
+    "SIENNA": "#A0522D",
+    "SILVER": "#C0C0C0",
+    "SKYBLUE": "#87CEEB",
+    "SLATEBLUE": "#6A5ACD",
+    "SLATEGRAY": "#708090",
+    "SLATEGREY": "#708090",
+    "SNOW": "#FFFAFA",
+    "SPRINGGREEN": "#00FF7F",
+    "STEELBLUE": "#4682B4",
+    "TAN": "#D2B48C",
+    "TEAL": "#008080",
+    "THISTLE": "#D8BFD8",
+    "TOMATO": "#FF6347",
+    "TURQUOISE": "#40E0D0",
+    "VIOLET": "#EE82EE",
+    "WHEAT": "#F5DEB3",
+    "WHITE": "#FFFFFF",
+    "WHITESMOKE": "#F5F5F5",
+    "YELLOW": "#FFFF00",
+    "YELLOWGREEN": "#9ACD32",
+}
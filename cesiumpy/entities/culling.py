@@ -0,0 +1,266 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/entities/culling.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+import cesiumpy.util.common as com
+
+######################################################################################################################################################
+
+
+class Viewport:
+
+    """
+    Longitude, latitude rectangle in degrees, west being greater than east for rectangles
+    crossing the antimeridian, entities are culled to when exporting.
+    """
+
+    # Constructor
+
+    def __init__(
+        self, west: float, south: float, east: float, north: float, margin: float = 0.0
+    ) -> None:
+
+        if margin < 0.0:
+            raise ValueError(f"margin must be positive or zero: {margin}")
+
+        width: float = (east - west) % 360.0 if west != east else 0.0
+
+        self.south: float = max(south - margin, -90.0)
+        self.north: float = min(north + margin, 90.0)
+
+        if (width + 2.0 * margin >= 360.0) or (west == -180.0 and east == 180.0):
+            (self.west, self.east) = (-180.0, 180.0)
+        else:
+            # wrapped across the antimeridian by the margin
+            self.west: float = west - margin
+            self.east: float = east + margin
+
+            if self.west < -180.0:
+                self.west += 360.0
+            if self.east > 180.0:
+                self.east -= 360.0
+
+    @classmethod
+    def maybe(cls, viewport: Any, margin: float = 0.0, camera=None) -> Viewport:
+
+        """
+        Return Viewport of viewport, "camera" for the destination rectangle of camera,
+        a Rectangle in degrees or a list-like of west, south, east, north in degrees.
+        """
+
+        import cesiumpy.entities.cartesian as cartesian
+
+        if isinstance(viewport, Viewport):
+            return cls(viewport.west, viewport.south, viewport.east, viewport.north, margin)
+
+        if isinstance(viewport, str) and (viewport == "camera"):
+            viewport = getattr(camera, "destination", None)
+
+            if not isinstance(viewport, cartesian.Rectangle):
+                raise ValueError(
+                    "camera destination must be a Rectangle to cull to: {viewport}".format(
+                        viewport=viewport
+                    )
+                )
+
+        if isinstance(viewport, cartesian.Rectangle):
+            if not viewport._is_degrees:
+                raise ValueError(f"viewport must be in degrees: {viewport}")
+
+            return cls(
+                viewport.west, viewport.south, viewport.east, viewport.north, margin
+            )
+
+        if com.is_listlike(viewport) and len(viewport) == 4:
+            (west, south, east, north) = viewport
+            return cls(
+                com.validate_longitude(west, key="west"),
+                com.validate_latitude(south, key="south"),
+                com.validate_longitude(east, key="east"),
+                com.validate_latitude(north, key="north"),
+                margin,
+            )
+
+        raise ValueError(
+            'viewport must be "camera", a Rectangle or a list-like of west, south, east, '
+            f"north: {viewport}"
+        )
+
+    # Methods
+
+    def contains(self, longitude, latitude) -> np.ndarray:
+
+        """
+        Return whether each of the points is in the viewport, vectorized over arrays.
+        """
+
+        longitude = np.asarray(longitude)
+        latitude = np.asarray(latitude)
+
+        return _in_longitudes(longitude, longitude, self.west, self.east) & (
+            (latitude >= self.south) & (latitude <= self.north)
+        )
+
+    def intersects(self, west, south, east, north) -> np.ndarray:
+
+        """
+        Return whether each of the rectangles intersects the viewport, vectorized over
+        arrays. Rectangles must not cross the antimeridian.
+        """
+
+        return _in_longitudes(
+            np.asarray(west), np.asarray(east), self.west, self.east
+        ) & ((np.asarray(south) <= self.north) & (np.asarray(north) >= self.south))
+
+    def cull(self, items: Iterable[Any], index=None) -> Iterator[Any]:
+
+        """
+        Yield items in the viewport, batches reduced to their entities in it and
+        polylines to their segments near it. Items without positions in degrees are
+        yielded as they are.
+
+        index is the SpatialIndex of items, whole entities out of the viewport are
+        dropped by querying it when passed.
+        """
+
+        if index is not None:
+            hits = index.query_bbox(self.west, self.south, self.east, self.north)
+            hit = {id(item) for item in index.items(hits)}
+
+        for item in items:
+            if (index is not None) and (id(item) not in hit) and (item in index):
+                continue
+
+            for culled in self._cull_item(item):
+                yield culled
+
+    def __repr__(self) -> str:
+        return "Viewport(west={0}, south={1}, east={2}, north={3})".format(
+            self.west, self.south, self.east, self.north
+        )
+
+    # Private methods
+
+    def _cull_item(self, item: Any) -> list[Any]:
+
+        """
+        Return what is left of item in the viewport, as a list of items.
+        """
+
+        from cesiumpy.entities.graphics.polyline import Polyline
+        from cesiumpy.entities.index import _to_bounds
+
+        if getattr(item, "_is_batch", False):
+            inside: np.ndarray = self.contains(
+                item.positions[:, 0], item.positions[:, 1]
+            )
+            if inside.all():
+                return [item]
+            return [item.take(inside)] if inside.any() else []
+
+        if isinstance(item, Polyline):
+            return self._cull_polyline(item)
+
+        # other entities are kept whole, if their bounding box intersects the viewport
+        bounds: Optional[np.ndarray] = _to_bounds(item)
+
+        if (bounds is None) or self.intersects(*bounds.T).any():
+            return [item]
+
+        return []
+
+    def _cull_polyline(self, polyline) -> list[Any]:
+
+        """
+        Return the parts of polyline made of its segments intersecting the viewport.
+        """
+
+        import cesiumpy.entities.cartesian as cartesian
+
+        values: np.ndarray = polyline.positions._values
+
+        if len(values) < 2:
+            return [polyline] if self.contains(values[:, 0], values[:, 1]).any() else []
+
+        segments: np.ndarray = self._intersects_segments(values)
+
+        if segments.all():
+            return [polyline]
+
+        # runs of consecutive segments, as ranges of their vertices
+        edges: np.ndarray = np.diff(np.concatenate([[0], segments.view(np.int8), [0]]))
+        starts: np.ndarray = np.flatnonzero(edges == 1)
+        stops: np.ndarray = np.flatnonzero(edges == -1) + 1
+
+        return [
+            _replace(
+                polyline, positions=cartesian.Cartesian3Array(values[start:stop])
+            )
+            for (start, stop) in zip(starts, stops)
+        ]
+
+    def _intersects_segments(self, values: np.ndarray) -> np.ndarray:
+
+        """
+        Return whether the bounding box of each segment between values intersects the
+        viewport, segments across the antimeridian being kept.
+        """
+
+        (start, stop) = (values[:-1], values[1:])
+
+        west = np.minimum(start[:, 0], stop[:, 0])
+        east = np.maximum(start[:, 0], stop[:, 0])
+        south = np.minimum(start[:, 1], stop[:, 1])
+        north = np.maximum(start[:, 1], stop[:, 1])
+
+        return self.intersects(west, south, east, north) | (east - west > 180.0)
+
+
+######################################################################################################################################################
+
+
+def _in_longitudes(
+    west: np.ndarray, east: np.ndarray, viewport_west: float, viewport_east: float
+) -> np.ndarray:
+
+    """
+    Return whether the longitude ranges west to east intersect the viewport ones.
+    """
+
+    if viewport_west <= viewport_east:
+        return (west <= viewport_east) & (east >= viewport_west)
+
+    # viewport crossing the antimeridian
+    return (east >= viewport_west) | (west <= viewport_east)
+
+
+def _replace(item: Any, **traits) -> Any:
+
+    """
+    Return a copy of item whose traits are replaced, item being left unchanged.
+    """
+
+    replaced = copy.copy(item)
+
+    # the copy is not watched for changes, nor held by anything yet
+    for key in ("_script_parents", "_script_version"):
+        replaced.__dict__.pop(key, None)
+
+    for (key, value) in traits.items():
+        setattr(replaced, key, value)
+
+    return replaced
+
+
+######################################################################################################################################################
@@ -9,12 +9,13 @@ import traitlets
 import cesiumpy
 from cesiumpy.base import _CesiumObject
 import cesiumpy.entities.cartesian as cartesian
+import cesiumpy.entities.material  # noqa
 import cesiumpy.constants as constants
 import cesiumpy.time as time
 import cesiumpy.position as position
 from cesiumpy.path_graphics import PathGraphics
 import cesiumpy.util.common as com
-from cesiumpy.util.trait import MaybeTrait
+from cesiumpy.util.trait import MaybeTrait, _compile_properties_emitter
 
 
 class _CesiumEntity(_CesiumObject):
@@ -184,6 +185,31 @@ class _CesiumEntity(_CesiumObject):
         props[self._klass] = childs
         return props
 
+    # Private methods
+
+    @classmethod
+    def _compile_emitter(cls):
+        if cls._property_dict is not _CesiumEntity._property_dict:
+            return super()._compile_emitter()
+
+        # same layout as _property_dict, graphics properties being nested
+        emit_entity = _compile_properties_emitter(["name", "position", "orientation"])
+        emit_graphics = _compile_properties_emitter(
+            list(collections.OrderedDict.fromkeys(cls._props + cls._common_props))
+        )
+        key = com._to_jskey(cls._klass)
+
+        def emit(obj, widget):
+            entity = emit_entity(obj, widget)
+            graphics = "{key}: {value}".format(
+                key=key, value=emit_graphics(obj, widget) or ""
+            )
+            if entity is None:
+                return "{" + graphics + "}"
+            return entity[:-1] + ", " + graphics + "}"
+
+        return emit
+
     # Methods
 
     def copy(self):
@@ -558,9 +558,8 @@ class Wall(_CesiumEntity):
             name=name,
         )
 
-        # ToDo: Support fromDegreesArrayHeights
         self.positions = cartesian.Cartesian3.fromDegreesArray(positions)
-        pos_len = len(self.positions) // 2
+        pos_len = len(self.positions)
 
         def _init_heights(x, key):
             if not isinstance(x, list):
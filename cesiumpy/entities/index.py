@@ -0,0 +1,440 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/entities/index.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+######################################################################################################################################################
+
+# Width and height of the grid cells, in degrees
+DEFAULT_CELL_SIZE: float = 1.0
+
+# Records covering more cells are not put in the grid, but checked by every query
+MAX_RECORD_CELLS: int = 64
+
+# Mean radius of the Earth, in meters
+EARTH_RADIUS: float = 6371008.8
+
+######################################################################################################################################################
+
+
+class SpatialIndex:
+
+    """
+    Uniform grid index of the longitude, latitude bounding boxes of entities.
+
+    Each entity is a record, and each position of entity batches too. Records are
+    appended as entities are inserted, and the cell table is sorted again at the next
+    query after insertions. Entities without degrees positions are not indexed.
+    """
+
+    # Constructor
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+
+        self._cell_size: float = cell_size
+        self._columns: int = int(np.ceil(360.0 / cell_size))
+        self._rows: int = int(np.ceil(180.0 / cell_size))
+
+        self._items: list[Any] = []
+        self._ids: set[int] = set()
+
+        # pending arrays of (west, south, east, north), item index, and batch row or -1
+        self._chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+        self._bounds: np.ndarray = np.empty((0, 4), dtype=np.float64)
+        self._owners: np.ndarray = np.empty(0, dtype=np.int64)
+        self._records_rows: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # sorted cell keys and their records, records covering too many cells
+        self._keys: np.ndarray = np.empty(0, dtype=np.int64)
+        self._records: np.ndarray = np.empty(0, dtype=np.int64)
+        self._large: np.ndarray = np.empty(0, dtype=np.int64)
+
+    # Properties
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def bounds(self) -> np.ndarray:
+
+        """
+        Return bounding boxes of the records as (N, 4) west, south, east, north array.
+        """
+
+        self._build()
+        return self._bounds
+
+    # Methods
+
+    def insert(self, item: Any) -> bool:
+
+        """
+        Index item, return whether it has degrees positions to be indexed by.
+        """
+
+        bounds: Optional[np.ndarray] = _to_bounds(item)
+
+        if bounds is None:
+            return False
+
+        rows = (
+            np.arange(len(bounds), dtype=np.int64)
+            if getattr(item, "_is_batch", False)
+            else np.full(len(bounds), -1, dtype=np.int64)
+        )
+
+        self._chunks.append(
+            (bounds, np.full(len(bounds), len(self._items), dtype=np.int64), rows)
+        )
+        self._items.append(item)
+        self._ids.add(id(item))
+
+        return True
+
+    def query_bbox(
+        self, west: float, south: float, east: float, north: float
+    ) -> np.ndarray:
+
+        """
+        Return indices of the records whose bounding box intersects the rectangle,
+        in degrees. west may be greater than east for rectangles crossing the antimeridian.
+        """
+
+        if west > east:
+            return np.union1d(
+                self.query_bbox(west, south, 180.0, north),
+                self.query_bbox(-180.0, south, east, north),
+            )
+
+        self._build()
+
+        candidates: np.ndarray = self._candidates(west, south, east, north)
+        bounds: np.ndarray = self._bounds[candidates]
+
+        intersects = (
+            (bounds[:, 0] <= east)
+            & (bounds[:, 2] >= west)
+            & (bounds[:, 1] <= north)
+            & (bounds[:, 3] >= south)
+        )
+
+        return candidates[intersects]
+
+    def query_radius(
+        self, longitude: float, latitude: float, radius_m: float
+    ) -> np.ndarray:
+
+        """
+        Return indices of the records within radius_m meters of the point, sorted by distance.
+        """
+
+        dlat: float = np.degrees(radius_m / EARTH_RADIUS)
+        (south, north) = (max(latitude - dlat, -90.0), min(latitude + dlat, 90.0))
+
+        cos_latitude: float = np.cos(np.radians(max(abs(south), abs(north))))
+
+        if (north >= 90.0) or (south <= -90.0) or (dlat >= cos_latitude * 180.0):
+            candidates = self.query_bbox(-180.0, south, 180.0, north)
+        else:
+            dlon: float = dlat / cos_latitude
+            west = (longitude - dlon + 180.0) % 360.0 - 180.0
+            east = (longitude + dlon + 180.0) % 360.0 - 180.0
+            candidates = self.query_bbox(west, south, east, north)
+
+        distances: np.ndarray = self.distances(longitude, latitude, candidates)
+        order: np.ndarray = np.argsort(distances, kind="stable")
+
+        return candidates[order[distances[order] <= radius_m]]
+
+    def nearest(self, longitude: float, latitude: float, k: int = 1) -> np.ndarray:
+
+        """
+        Return indices of the k records nearest to the point, sorted by distance.
+        """
+
+        self._build()
+
+        distances: np.ndarray = self.distances(longitude, latitude)
+
+        if k < len(distances):
+            candidates = np.argpartition(distances, k)[:k]
+        else:
+            candidates = np.arange(len(distances))
+
+        return candidates[np.argsort(distances[candidates], kind="stable")]
+
+    def nearest_items(self, longitude: float, latitude: float, k: int = 1) -> list[Any]:
+
+        """
+        Return the k distinct items nearest to the point, sorted by distance.
+        """
+
+        self._build()
+
+        best: np.ndarray = np.full(len(self._items), np.inf)
+        np.minimum.at(best, self._owners, self.distances(longitude, latitude))
+
+        owners: np.ndarray = np.flatnonzero(np.isfinite(best))
+        owners = owners[np.argsort(best[owners], kind="stable")][:k]
+
+        return [self._items[owner] for owner in owners]
+
+    def distances(
+        self,
+        longitude: float,
+        latitude: float,
+        records: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+
+        """
+        Return great circle distances in meters from the point to the nearest point of
+        the bounding boxes of records, all of them by default.
+
+        Out of the longitudes of a box, the nearest point is on its nearest meridian edge,
+        where the great circle through the point crosses the meridian at right angle,
+        which is poleward of the point latitude.
+        """
+
+        self._build()
+
+        bounds: np.ndarray = self._bounds if records is None else self._bounds[records]
+
+        # nearest edge in longitude, going either way around the globe
+        inside = (bounds[:, 0] <= longitude) & (longitude <= bounds[:, 2])
+        to_west = (bounds[:, 0] - longitude) % 360.0
+        to_east = (longitude - bounds[:, 2]) % 360.0
+        nearest_longitude = np.where(
+            inside,
+            longitude,
+            np.where(to_west < to_east, bounds[:, 0], bounds[:, 2]),
+        )
+
+        # latitude of the nearest point of the meridian circle of the edge, past a pole
+        # when the edge is more than 90 degrees away
+        dlon = np.radians(np.where(inside, 0.0, np.minimum(to_west, to_east)))
+        perpendicular = np.degrees(
+            np.arctan2(
+                np.sin(np.radians(latitude)),
+                np.cos(np.radians(latitude)) * np.cos(dlon),
+            )
+        )
+
+        # or the end of the edge nearest to it around the circle
+        (south, north) = (bounds[:, 1], bounds[:, 3])
+        nearest_latitude = np.where(
+            (south <= perpendicular) & (perpendicular <= north),
+            perpendicular,
+            np.where(
+                np.cos(np.radians(south - perpendicular))
+                >= np.cos(np.radians(north - perpendicular)),
+                south,
+                north,
+            ),
+        )
+
+        return _haversine(longitude, latitude, nearest_longitude, nearest_latitude)
+
+    def items(self, records: np.ndarray) -> list[Any]:
+
+        """
+        Return the distinct items of records, in the order of records.
+        """
+
+        self._build()
+
+        owners: np.ndarray = self._owners[records]
+        (_, first) = np.unique(owners, return_index=True)
+
+        return [self._items[owner] for owner in owners[np.sort(first)]]
+
+    def rows(self, records: np.ndarray) -> list[tuple[Any, Optional[int]]]:
+
+        """
+        Return (item, batch row or None) of records.
+        """
+
+        self._build()
+
+        return [
+            (self._items[owner], None if row < 0 else int(row))
+            for (owner, row) in zip(self._owners[records], self._records_rows[records])
+        ]
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._ids
+
+    def __len__(self) -> int:
+        self._build()
+        return len(self._bounds)
+
+    def __repr__(self) -> str:
+        return f"SpatialIndex({len(self)})"
+
+    # Private methods
+
+    def _build(self) -> None:
+
+        """
+        Append pending records, and sort the cell table again.
+        """
+
+        if not self._chunks:
+            return
+
+        (bounds, owners, rows) = zip(*self._chunks)
+        self._chunks = []
+
+        self._bounds = np.concatenate([self._bounds, *bounds])
+        self._owners = np.concatenate([self._owners, *owners])
+        self._records_rows = np.concatenate([self._records_rows, *rows])
+
+        (x0, y0) = self._cells(self._bounds[:, 0], self._bounds[:, 1])
+        (x1, y1) = self._cells(self._bounds[:, 2], self._bounds[:, 3])
+
+        (widths, heights) = (x1 - x0 + 1, y1 - y0 + 1)
+        counts = widths * heights
+
+        large = counts > MAX_RECORD_CELLS
+        self._large = np.flatnonzero(large)
+        counts[large] = 0
+
+        # one (key, record) pair per covered cell
+        records = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(len(records)) - np.repeat(np.cumsum(counts) - counts, counts)
+        keys = (y0[records] + local // widths[records]) * self._columns + (
+            x0[records] + local % widths[records]
+        )
+
+        order = np.argsort(keys, kind="stable")
+        (self._keys, self._records) = (keys[order], records[order])
+
+    def _cells(
+        self, longitude: np.ndarray, latitude: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        x = np.floor((np.asarray(longitude) + 180.0) / self._cell_size).astype(np.int64)
+        y = np.floor((np.asarray(latitude) + 90.0) / self._cell_size).astype(np.int64)
+
+        return (np.clip(x, 0, self._columns - 1), np.clip(y, 0, self._rows - 1))
+
+    def _candidates(
+        self, west: float, south: float, east: float, north: float
+    ) -> np.ndarray:
+
+        """
+        Return records of the cells the rectangle covers, and records covering many cells.
+        """
+
+        (x0, y0) = self._cells(west, south)
+        (x1, y1) = self._cells(east, north)
+
+        # every record is checked anyway
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= len(self._keys):
+            return np.arange(len(self._bounds))
+
+        rows = np.arange(y0, y1 + 1) * self._columns
+        starts = np.searchsorted(self._keys, rows + x0, side="left")
+        stops = np.searchsorted(self._keys, rows + x1, side="right")
+
+        found = [self._records[start:stop] for (start, stop) in zip(starts, stops)]
+
+        return np.unique(np.concatenate([self._large, *found]))
+
+
+######################################################################################################################################################
+
+
+def _to_bounds(item: Any) -> Optional[np.ndarray]:
+
+    """
+    Return (N, 4) west, south, east, north bounding boxes of item, one per position of
+    batches, two for entities crossing the antimeridian, None if item has no degrees
+    positions.
+    """
+
+    import cesiumpy.entities.cartesian as cartesian
+    from cesiumpy.position import SampledPositionProperty
+
+    if getattr(item, "_is_batch", False):
+        positions = item.positions[:, :2]
+        return np.column_stack([positions, positions])
+
+    values: Optional[np.ndarray] = None
+
+    position = getattr(item, "position", None)
+
+    if isinstance(position, cartesian.Cartesian3) and position._is_degrees:
+        values = np.array([[position.x, position.y]])
+
+    elif isinstance(position, SampledPositionProperty) and position._store.degrees:
+        values = position._store.values[:, :2]
+
+    else:
+        for name in ("positions", "hierarchy"):
+            positions = getattr(item, name, None)
+            if isinstance(positions, cartesian.Cartesian3Array):
+                values = positions._values[:, :2]
+                break
+
+        coordinates = getattr(item, "coordinates", None)
+        if isinstance(coordinates, cartesian.Rectangle) and coordinates._is_degrees:
+            return np.array(
+                [
+                    [
+                        coordinates.west,
+                        coordinates.south,
+                        coordinates.east,
+                        coordinates.north,
+                    ]
+                ]
+            )
+
+    if (values is None) or (len(values) == 0):
+        return None
+
+    (west, south) = values.min(axis=0)
+    (east, north) = values.max(axis=0)
+
+    if east - west > 180.0:
+        # narrower across the antimeridian, split in its two sides
+        shifted = values[:, 0] % 360.0
+        (west, east) = (shifted.min(), shifted.max())
+
+        if east - west <= 180.0:
+            west = (west + 180.0) % 360.0 - 180.0
+            east = (east + 180.0) % 360.0 - 180.0
+            return np.array([[west, south, 180.0, north], [-180.0, south, east, north]])
+
+    return np.array([[west, south, east, north]])
+
+
+def _haversine(longitude, latitude, longitudes, latitudes) -> np.ndarray:
+
+    """
+    Return great circle distances between the point and points, in meters.
+    """
+
+    (lon1, lat1, lon2, lat2) = map(
+        np.radians, (longitude, latitude, np.asarray(longitudes), np.asarray(latitudes))
+    )
+
+    a = (
+        np.sin((lat2 - lat1) / 2.0) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    )
+
+    return 2.0 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+######################################################################################################################################################
@@ -3,13 +3,276 @@
 
 from __future__ import unicode_literals
 
+import asyncio
+import collections
+import concurrent.futures
+import os
+import sqlite3
+import threading
+
 import six
-from geopy.geocoders.geocodefarm import GeocodeFarm
 
 import cesiumpy.util.common as com
 
-# ToDo: want different geocoders?
-_GEOCODER = GeocodeFarm()
+# Number of lookups run concurrently when resolving list-likes
+DEFAULT_CONCURRENCY = 8
+
+# Number of results kept in memory by the cache
+DEFAULT_CACHE_SIZE = 1024
+
+# Environment variable holding the path of the default persistent cache
+CACHE_PATH_VARIABLE = "CESIUMPY_GEOCODE_CACHE"
+
+_GEOCODER = None
+_CACHE = None
+
+# returned by GeocodeCache.get for queries never looked up
+_UNKNOWN = object()
+
+
+# --------------------------------------------------
+# Geocoder
+# --------------------------------------------------
+
+
+def set_geocoder(geocoder):
+    """
+    Use geocoder for lookups, any object whose geocode(query) method returns an object
+    with longitude and latitude attributes or None, such as geopy geocoders.
+    None restores the default geopy GeocodeFarm geocoder.
+    """
+    global _GEOCODER
+    _GEOCODER = geocoder
+
+
+def _get_geocoder():
+    """
+    Return the geocoder, geopy is imported on first use
+    """
+    global _GEOCODER
+
+    if _GEOCODER is None:
+        geocodefarm = com._check_package("geopy.geocoders.geocodefarm")
+        _GEOCODER = geocodefarm.GeocodeFarm()
+
+    return _GEOCODER
+
+
+# --------------------------------------------------
+# Cache
+# --------------------------------------------------
+
+
+class GeocodeCache(object):
+    """
+    Geocoding results keyed by normalized query, (longitude, latitude) or None
+    for queries which could not be resolved.
+
+    Recent results are kept in memory in least recently used order, maxsize of them,
+    and all of them in the SQLite database at path if passed, so that they persist
+    across sessions.
+    """
+
+    def __init__(self, path=None, maxsize=DEFAULT_CACHE_SIZE):
+        self.path = path
+        self.maxsize = maxsize
+
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self._connection = None
+        if path is not None:
+            # lookups of a running event loop may come from another thread
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS geocode "
+                    "(query TEXT PRIMARY KEY, longitude REAL, latitude REAL)"
+                )
+
+    def get(self, query, default=None):
+        """
+        Return cached location of query, default if query was never looked up.
+        """
+        key = _normalize(query)
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            if self._connection is None:
+                return default
+
+            row = self._connection.execute(
+                "SELECT longitude, latitude FROM geocode WHERE query = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+
+            location = None if row[0] is None else (row[0], row[1])
+            self._remember(key, location)
+            return location
+
+    def update(self, locations):
+        """
+        Store locations, a dict of query and (longitude, latitude) or None.
+        """
+        rows = [
+            (_normalize(query),) + (location or (None, None))
+            for (query, location) in locations.items()
+        ]
+
+        with self._lock:
+            for (query, location) in locations.items():
+                self._remember(_normalize(query), location)
+
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?)", rows
+                    )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM geocode")
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __len__(self):
+        with self._lock:
+            if self._connection is None:
+                return len(self._memory)
+            row = self._connection.execute("SELECT COUNT(*) FROM geocode").fetchone()
+            return row[0]
+
+    def _remember(self, key, location):
+        self._memory[key] = location
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+def set_cache(path=None, maxsize=DEFAULT_CACHE_SIZE):
+    """
+    Replace the cache of lookups by a new GeocodeCache, persisted at path if passed,
+    and return it.
+    """
+    global _CACHE
+
+    if _CACHE is not None:
+        _CACHE.close()
+
+    _CACHE = GeocodeCache(path=path, maxsize=maxsize)
+    return _CACHE
+
+
+def get_cache():
+    """
+    Return the cache of lookups, persisted at the path of CESIUMPY_GEOCODE_CACHE
+    environment variable if it is set.
+    """
+    global _CACHE
+
+    if _CACHE is None:
+        _CACHE = GeocodeCache(path=os.environ.get(CACHE_PATH_VARIABLE))
+
+    return _CACHE
+
+
+def _normalize(query):
+    """
+    Return cache key of query, so that case and spacing do not matter
+    """
+    return " ".join(query.split()).casefold()
+
+
+# --------------------------------------------------
+# Lookups
+# --------------------------------------------------
+
+
+def geocode(query):
+    """
+    Return (longitude, latitude) of query, None if it cannot be resolved.
+    """
+    return geocode_many([query])[0]
+
+
+def geocode_many(queries, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Return (longitude, latitude) or None of each query. Queries which are not cached
+    are looked up concurrently, each distinct query once.
+    """
+    coroutine = geocode_async(queries, concurrency=concurrency)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # called from a running event loop, such as Jupyter's
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+async def geocode_async(queries, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Coroutine of geocode_many, lookups run in concurrency threads.
+    """
+    cache = get_cache()
+
+    locations = {}
+    missing = collections.OrderedDict()
+
+    for query in queries:
+        key = _normalize(query)
+        if (key in locations) or (key in missing):
+            continue
+
+        location = cache.get(query, default=_UNKNOWN)
+        if location is _UNKNOWN:
+            missing[key] = query
+        else:
+            locations[key] = location
+
+    if missing:
+        geocoder = _get_geocoder()
+        loop = asyncio.get_running_loop()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(executor, geocoder.geocode, query)
+                    for query in missing.values()
+                ],
+                return_exceptions=True,
+            )
+
+        resolved = collections.OrderedDict()
+        for (key, result) in zip(missing, results):
+            if not isinstance(result, Exception):
+                resolved[key] = (
+                    None if result is None else (result.longitude, result.latitude)
+                )
+
+        # successful lookups are kept even if others failed
+        cache.update(resolved)
+        locations.update(resolved)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    return [locations[_normalize(query)] for query in queries]
 
 
 def _maybe_geocode(x, height=None):
@@ -18,14 +281,26 @@ def _maybe_geocode(x, height=None):
     height can be used to create base data for Cartesian3
     """
     if isinstance(x, six.string_types):
-        loc = _GEOCODER.geocode(x)
+        loc = geocode(x)
         if loc is not None:
             if height is None:
                 # return x, y order
-                return loc.longitude, loc.latitude
+                return loc
             else:
-                return loc.longitude, loc.latitude, height
+                return loc + (height,)
     elif com.is_listlike(x):
-        return [_maybe_geocode(e) for e in x]
+        # strings of list-likes are resolved at once
+        queries = [e for e in x if isinstance(e, six.string_types)]
+        locs = dict(zip(queries, geocode_many(queries))) if queries else {}
+
+        results = []
+        for e in x:
+            if not isinstance(e, six.string_types):
+                results.append(_maybe_geocode(e))
+            elif locs[e] is None:
+                results.append(e)
+            else:
+                results.append(locs[e])
+        return results
 
     return x
@@ -3,42 +3,449 @@
 
 from __future__ import unicode_literals
 
+import collections
+import concurrent.futures
+import itertools
 import json
+import re
 
-from cesiumpy.extension.shapefile import to_entity
+import numpy as np
+
+import cesiumpy
+from cesiumpy.entities.cartesian import Cartesian3Array
+from cesiumpy.extension.shapefile import _warn_holes, to_entity
+import cesiumpy.math.simplification as simplification
 import cesiumpy.util.common as com
 
+# Number of features converted to entities at once
+DEFAULT_CHUNK_SIZE = 1000
 
-def read_geojson(path):
+# Number of characters read from the file at once
+DEFAULT_BUFFER_SIZE = 2**16
 
-    sp = com._check_package("shapely.geometry")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
-    with open(path) as f:
-        geos = json.load(f)
+# characters a number may continue with, up to the end of the buffer
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
 
-    # shapely can't parse featurecollection directly
-    results = []
-    for feature in geos["features"]:
-        shape = sp.shape(feature["geometry"])
-        result = to_entity(shape)
-        if isinstance(result, list):
-            results.extend(result)
-        else:
-            results.append(result)
-    return results
+# escape sequences in strings, replaced by as many neutral characters when scanning
+_ESCAPE = re.compile(r"\\.", re.DOTALL)
+
+# ASCII characters delimiting JSON values: quote, brackets and comma
+_STRUCTURAL = np.zeros(128, dtype=bool)
+_STRUCTURAL[[ord(c) for c in '"[]{},']] = True
+
+# GeoJSON geometry types converted by worker processes, and types of their parts
+_GEOMETRY_PARTS = {
+    "Point": "Point",
+    "MultiPoint": "Point",
+    "LineString": "LineString",
+    "MultiLineString": "LineString",
+    "Polygon": "Polygon",
+    "MultiPolygon": "Polygon",
+}
+
+
+def read_geojson(
+    path, tolerance=None, zoom=None, algorithm="douglas_peucker", workers=None
+):
+    """
+    Read GeoJSON features as entities, tolerance, zoom and algorithm are passed to to_entity.
+    """
+    chunks = iter_geojson(
+        path, tolerance=tolerance, zoom=zoom, algorithm=algorithm, workers=workers
+    )
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def iter_geojson(
+    path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    tolerance=None,
+    zoom=None,
+    algorithm="douglas_peucker",
+    workers=None,
+):
+    """
+    Yield lists of the entities of up to chunk_size GeoJSON features.
 
+    The file is parsed incrementally, so that memory is bounded by the chunk rather
+    than the file. Chunks can be passed to viewer.entities.add, as well as the
+    generator itself.
+
+    If workers is passed, chunks are converted to coordinate arrays by as many
+    processes, and the entities are built from them in order.
+    """
+    if workers is not None:
+        # workers decode the features, the file is only split here
+        features = _iter_features(path, DEFAULT_BUFFER_SIZE, raw=True)
+        return _iter_parallel_chunks(
+            features,
+            _features_to_arrays,
+            chunk_size,
+            workers,
+            tolerance,
+            zoom,
+            algorithm,
+        )
 
-def read_shape(path):
     sp = com._check_package("shapely.geometry")
+
+    shapes = (sp.shape(feature["geometry"]) for feature in iter_geojson_features(path))
+    return _iter_chunks(shapes, chunk_size, tolerance, zoom, algorithm)
+
+
+def iter_geojson_features(path, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Yield features of GeoJSON FeatureCollection as dicts one at a time, reading the
+    file buffer_size characters at a time.
+    """
+    return _iter_features(path, buffer_size, raw=False)
+
+
+def read_shape(
+    path, tolerance=None, zoom=None, algorithm="douglas_peucker", workers=None
+):
+    """
+    Read shapefile records as entities, tolerance, zoom and algorithm are passed to to_entity.
+    """
+    chunks = iter_shape(
+        path, tolerance=tolerance, zoom=zoom, algorithm=algorithm, workers=workers
+    )
+    return list(itertools.chain.from_iterable(chunks))
+
+
+def iter_shape(
+    path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    tolerance=None,
+    zoom=None,
+    algorithm="douglas_peucker",
+    workers=None,
+):
+    """
+    Yield lists of the entities of up to chunk_size shapefile records.
+
+    If workers is passed, chunks are converted to coordinate arrays by as many
+    processes, and the entities are built from them in order.
+    """
     fiona = com._check_package("fiona")
 
-    results = []
+    if workers is not None:
+        with fiona.open(path) as f:
+            geometries = (_to_mapping(record["geometry"]) for record in f)
+            for chunk in _iter_parallel_chunks(
+                geometries, _to_arrays, chunk_size, workers, tolerance, zoom, algorithm
+            ):
+                yield chunk
+        return
+
+    sp = com._check_package("shapely.geometry")
+
     with fiona.open(path) as f:
-        for shape in f:
-            shape = sp.shape(shape["geometry"])
-            result = to_entity(shape)
+        shapes = (sp.shape(shape["geometry"]) for shape in f)
+        for chunk in _iter_chunks(shapes, chunk_size, tolerance, zoom, algorithm):
+            yield chunk
+
+
+def _iter_chunks(shapes, chunk_size, tolerance, zoom, algorithm):
+    """
+    Yield lists of the entities converted from up to chunk_size shapes.
+    """
+    _validate_positive(chunk_size, "chunk_size")
+
+    while True:
+        results = []
+        for shape in itertools.islice(shapes, chunk_size):
+            result = to_entity(
+                shape, tolerance=tolerance, zoom=zoom, algorithm=algorithm
+            )
             if isinstance(result, list):
                 results.extend(result)
             else:
                 results.append(result)
+
+        if not results:
+            return
+        yield results
+
+
+def _iter_features(path, buffer_size, raw):
+    """
+    Yield features of GeoJSON FeatureCollection, as their JSON text if raw.
+    """
+    with open(path) as f:
+        stream = _JSONStream(f, buffer_size)
+
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+
+        while True:
+            key = stream.decode()
+            stream.expect(":")
+
+            if key != "features":
+                stream.decode()
+            elif raw:
+                stream.expect("[")
+                for feature in stream.iter_raw_items():
+                    yield feature
+            else:
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield stream.decode()
+                        if stream.expect(",]") == "]":
+                            break
+
+            if stream.expect(",}") == "}":
+                return
+
+
+def _iter_parallel_chunks(
+    items, convert, chunk_size, workers, tolerance, zoom, algorithm
+):
+    """
+    Yield lists of the entities of up to chunk_size items, converting items to
+    coordinate arrays with convert in a pool of workers processes.
+
+    At most two chunks per worker are in flight, so that memory stays bounded.
+    """
+    _validate_positive(chunk_size, "chunk_size")
+    _validate_positive(workers, "workers")
+
+    if (tolerance is None) and (zoom is not None):
+        tolerance = simplification.zoom_tolerance(zoom)
+
+    chunks = iter(lambda: list(itertools.islice(items, chunk_size)), [])
+    pending = collections.deque()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(convert, chunk, tolerance, algorithm))
+
+            while len(pending) >= 2 * workers:
+                results = _to_entities(pending.popleft().result())
+                if results:
+                    yield results
+
+        while pending:
+            results = _to_entities(pending.popleft().result())
+            if results:
+                yield results
+
+
+def _features_to_arrays(features, tolerance, algorithm):
+    """
+    Return (part type, coordinates array, dropped holes) of GeoJSON features text, run in
+    worker processes.
+    """
+    geometries = [json.loads(feature)["geometry"] for feature in features]
+    return _to_arrays(geometries, tolerance, algorithm)
+
+
+def _to_arrays(geometries, tolerance, algorithm):
+    """
+    Return (part type, coordinates array, dropped holes) of GeoJSON geometries, run in
+    worker processes.
+
+    Polygons are converted to their exterior, as to_entity does, their holes being
+    counted so that the warning is raised in the main process.
+    """
+    results = []
+
+    for geometry in geometries:
+        kind = geometry["type"]
+
+        if kind not in _GEOMETRY_PARTS:
+            msg = "Unable to convert to cesiumpy entity: {kind}"
+            raise ValueError(msg.format(kind=kind))
+
+        parts = geometry["coordinates"]
+        if _GEOMETRY_PARTS[kind] == kind:
+            parts = [parts]
+        kind = _GEOMETRY_PARTS[kind]
+
+        for part in parts:
+            holes = 0
+            if kind == "Polygon":
+                (part, holes) = (part[0], len(part) - 1)
+
+            values = np.asarray(part, dtype=np.float64)
+
+            if (kind != "Point") and (tolerance is not None):
+                values = values[
+                    simplification.simplify(values, tolerance, algorithm=algorithm)
+                ]
+
+            results.append((kind, values, holes))
+
     return results
+
+
+def _to_entities(arrays):
+    """
+    Return entities built from (part type, coordinates array, dropped holes) returned
+    by _to_arrays.
+    """
+    results = []
+
+    _warn_holes(sum(holes for (_, _, holes) in arrays))
+
+    for (kind, values, _) in arrays:
+        if kind == "Point":
+            results.append(cesiumpy.Point(position=values.tolist()))
+        elif kind == "LineString":
+            results.append(cesiumpy.Polyline(positions=Cartesian3Array(values)))
+        else:
+            results.append(cesiumpy.Polygon(hierarchy=Cartesian3Array(values)))
+
+    return results
+
+
+def _to_mapping(geometry):
+    """
+    Return fiona geometry as GeoJSON-like dict, which can be sent to worker processes.
+    """
+    if isinstance(geometry, dict):
+        return geometry
+    return {"type": geometry["type"], "coordinates": geometry["coordinates"]}
+
+
+def _validate_positive(value, key):
+    if value < 1:
+        msg = "{key} must be a positive integer: {value}"
+        raise ValueError(msg.format(key=key, value=value))
+
+
+class _JSONStream(object):
+    """
+    Incremental reader of JSON text, decoding values one at a time.
+    """
+
+    def __init__(self, f, buffer_size):
+        self._file = f
+        self._buffer_size = buffer_size
+        self._buffer = ""
+        self._position = 0
+        self._decoder = json.JSONDecoder()
+
+    def peek(self):
+        """
+        Return next non-whitespace character without consuming it, "" at end of file.
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read(self._buffer_size):
+                return ""
+
+    def expect(self, characters):
+        """
+        Consume and return next non-whitespace character, which must be one of characters.
+        """
+        character = self.peek()
+        if (character == "") or (character not in characters):
+            msg = "Unable to parse JSON, expected one of '{characters}': {character!r}"
+            raise ValueError(msg.format(characters=characters, character=character))
+
+        self._position += 1
+        return character
+
+    def decode(self):
+        """
+        Consume and return next value.
+        """
+        self.peek()
+
+        while True:
+            try:
+                (value, end) = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # value is incomplete
+                if not self._read(self._grown_size()):
+                    raise
+                continue
+
+            # numbers may continue past the buffer, even after a decoded part as "1."
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL.match(self._buffer, end)
+                and self._read(self._buffer_size)
+            ):
+                continue
+
+            self._position = end
+            return value
+
+    def iter_raw_items(self):
+        """
+        Yield JSON text of the items of the array being read, whose opening bracket is
+        consumed, through its closing bracket.
+
+        Items are split by scanning brackets and strings of the buffer with NumPy
+        rather than decoding them.
+        """
+        (depth, in_string) = (0, False)
+        scanned = self._position
+
+        while True:
+            segment = _ESCAPE.sub("  ", self._buffer[scanned:])
+            # escape sequence continues past the buffer
+            if segment.endswith("\\"):
+                segment = segment[:-1]
+
+            codes = np.frombuffer(segment.encode("utf-32-le"), dtype=np.uint32)
+
+            # quotes, brackets and commas only
+            positions = np.flatnonzero(_STRUCTURAL[np.minimum(codes, 127)])
+            characters = codes[positions]
+
+            quotes = characters == 34
+            outside = ((np.cumsum(quotes) + in_string) % 2 == 0) & ~quotes
+            opening = outside & ((characters == 123) | (characters == 91))
+            closing = outside & ((characters == 125) | (characters == 93))
+            depths = depth + np.cumsum(opening.astype(np.int64) - closing)
+
+            # separators of the items, and closing bracket of the array
+            ends = positions[
+                (outside & (characters == 44) & (depths == 0))
+                | (closing & (depths == -1))
+            ]
+
+            for end in ends:
+                item = self._buffer[self._position : scanned + end].strip()
+                self._position = scanned + end + 1
+                if item:
+                    yield item
+                if codes[end] == 93:
+                    return
+
+            if len(positions) > 0:
+                depth = depths[-1]
+                in_string = bool((in_string + np.count_nonzero(quotes)) % 2)
+
+            scanned += len(segment) - self._position
+            if not self._read(self._grown_size()):
+                raise ValueError("Unable to parse JSON, unexpected end of file")
+
+    def _grown_size(self):
+        """
+        Return size to read for values not complete in the buffer, as much as their read
+        part so that large values take linear time.
+        """
+        return max(self._buffer_size, len(self._buffer) - self._position)
+
+    def _read(self, size):
+        """
+        Append up to size characters to the buffer, dropping consumed ones.
+        Return False at end of file.
+        """
+        data = self._file.read(size)
+        self._buffer = self._buffer[self._position :] + data
+        self._position = 0
+        return len(data) > 0
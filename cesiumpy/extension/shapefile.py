@@ -4,6 +4,10 @@
 from __future__ import unicode_literals
 
 import itertools
+import sys
+import warnings
+
+import numpy as np
 
 import cesiumpy
 
@@ -11,30 +15,15 @@ import cesiumpy
 # Shapely Functions
 # --------------------------------------------------
 
-try:
-    import shapely.geometry
-
-    ShapelyPoint = shapely.geometry.Point
-    ShapelyMultiPoint = shapely.geometry.MultiPoint
-    ShapelyLineString = shapely.geometry.LineString
-    ShapelyMultiLineString = shapely.geometry.MultiLineString
-    ShapelyLinearRing = shapely.geometry.LinearRing
-    ShapelyPolygon = shapely.geometry.Polygon
-    ShapelyMultiPolygon = shapely.geometry.MultiPolygon
-
-
-except ImportError:
 
-    class DummyClass(object):
-        pass
+def _geometry():
+    """
+    Return shapely.geometry if it has already been imported, otherwise None.
 
-    ShapelyPoint = DummyClass
-    ShapelyMultiPoint = DummyClass
-    ShapelyLineString = DummyClass
-    ShapelyMultiLineString = DummyClass
-    ShapelyLinearRing = DummyClass
-    ShapelyPolygon = DummyClass
-    ShapelyMultiPolygon = DummyClass
+    Shapely instances cannot exist before shapely.geometry is imported,
+    so shapely itself is never imported here.
+    """
+    return sys.modules.get("shapely.geometry")
 
 
 # --------------------------------------------------
@@ -42,63 +31,112 @@ except ImportError:
 # --------------------------------------------------
 
 
-def to_entity(shape):
+def to_entity(shape, tolerance=None, zoom=None, algorithm="douglas_peucker"):
     """
     Convert shapely.geometry to corresponding entities.
     Result may be a list if geometry is consists from multiple instances.
+
+    Lines and polygons are simplified if tolerance (in degrees) or zoom is passed,
+    see Cartesian3Array.simplify.
+
+    Polygons are converted to their exterior, holes being dropped with a warning.
     """
-    if isinstance(shape, ShapelyMultiPoint):
+    sg = _geometry()
+
+    options = dict(tolerance=tolerance, zoom=zoom, algorithm=algorithm)
+
+    if sg is None:
+        pass
+
+    elif isinstance(shape, sg.MultiPoint):
         return [cesiumpy.Point(position=e) for e in shape]
 
-    elif isinstance(shape, ShapelyPoint):
+    elif isinstance(shape, sg.Point):
         return cesiumpy.Point(position=shape)
 
-    elif isinstance(shape, ShapelyMultiLineString):
-        return [cesiumpy.Polyline(positions=e) for e in shape]
+    elif isinstance(shape, sg.MultiLineString):
+        return [cesiumpy.Polyline(positions=_simplify(e, **options)) for e in shape]
 
-    elif isinstance(shape, (ShapelyLineString, ShapelyLinearRing)):
-        return cesiumpy.Polyline(positions=shape)
+    elif isinstance(shape, (sg.LineString, sg.LinearRing)):
+        return cesiumpy.Polyline(positions=_simplify(shape, **options))
 
-    elif isinstance(shape, ShapelyMultiPolygon):
-        return [cesiumpy.Polygon(hierarchy=e) for e in shape]
+    elif isinstance(shape, sg.MultiPolygon):
+        return [cesiumpy.Polygon(hierarchy=_simplify(e, **options)) for e in shape]
 
-    elif isinstance(shape, ShapelyPolygon):
-        return cesiumpy.Polygon(hierarchy=shape)
+    elif isinstance(shape, sg.Polygon):
+        return cesiumpy.Polygon(hierarchy=_simplify(shape, **options))
 
     msg = "Unable to convert to cesiumpy entity: {shape}".format(shape=shape)
     raise ValueError(msg)
 
 
+def _simplify(shape, tolerance, zoom, algorithm):
+    """
+    Return coordinates of line or polygon exterior as simplified Cartesian3Array,
+    or shape as it is if neither tolerance nor zoom is passed.
+    """
+    if (tolerance is None) and (zoom is None):
+        return shape
+
+    if hasattr(shape, "exterior"):
+        _warn_holes(len(shape.interiors))
+        coords = shape.exterior.coords
+    else:
+        coords = shape.coords
+
+    positions = cesiumpy.Cartesian3.fromDegreesArray(np.asarray(coords))
+    return positions.simplify(tolerance=tolerance, algorithm=algorithm, zoom=zoom)
+
+
+def _warn_holes(holes):
+    """
+    Warn that holes of polygons are dropped, entity polygons having no holes.
+    """
+    if holes > 0:
+        msg = "Polygon holes are not supported, {holes} hole(s) dropped"
+        warnings.warn(msg.format(holes=holes))
+
+
 # --------------------------------------------------
 # Convert shaply instances to Cartesian (Coordinates)
 # --------------------------------------------------
 
 
 def _maybe_shapely_point(x):
-    if isinstance(x, ShapelyMultiPoint):
+    sg = _geometry()
+    if sg is None:
+        return x
+    elif isinstance(x, sg.MultiPoint):
         raise NotImplementedError(x)
-    elif isinstance(x, ShapelyPoint):
+    elif isinstance(x, sg.Point):
         return list(x.coords[:][0])
     return x
 
 
 def _maybe_shapely_line(x):
-    if isinstance(x, ShapelyMultiLineString):
+    sg = _geometry()
+    if sg is None:
+        return x
+    elif isinstance(x, sg.MultiLineString):
         raise NotImplementedError(x)
-    elif isinstance(x, (ShapelyLineString, ShapelyLinearRing)):
+    elif isinstance(x, (sg.LineString, sg.LinearRing)):
         return list(itertools.chain(*x.coords[:]))
     return x
 
 
 def _maybe_shapely_polygon(x):
-    if isinstance(x, ShapelyMultiPolygon):
+    sg = _geometry()
+    if sg is None:
+        return x
+    elif isinstance(x, sg.MultiPolygon):
         raise NotImplementedError(x)
-    elif isinstance(x, ShapelyPolygon):
+    elif isinstance(x, sg.Polygon):
         polygons = [x]
     else:
         return x
 
     results = []
     for p in polygons:
+        _warn_holes(len(p.interiors))
         results.extend(list(itertools.chain(*p.exterior.coords)))
     return results
@@ -0,0 +1,498 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/extension/tiling.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+######################################################################################################################################################
+
+# Deepest level of the quadtree, its tiles spanning 360 / 2 ** level degrees of longitude
+DEFAULT_MAX_LEVEL: int = 10
+
+# Deepest level supported, its tiles being about 40 meters wide
+MAX_LEVEL: int = 20
+
+# Number of items of a batch in each tile, the others being pushed down to the next level
+DEFAULT_MAX_ITEMS: int = 2000
+
+TILESET_FILE: str = "tileset.json"
+
+# Formats of the tiles, and their data source
+TILE_FORMATS: dict[str, str] = {
+    "czml": "CzmlDataSource",
+    "geojson": "GeoJsonDataSource",
+}
+
+######################################################################################################################################################
+
+
+class Tileset:
+
+    """
+    Quadtree of tile files written by write_tiles, loaded by view in a widget.
+
+    Level 0 is a single tile covering the globe, and tiles of level L are 360 / 2 ** L
+    degrees wide and 180 / 2 ** L degrees high, numbered x from the antimeridian
+    eastwards and y from the south pole northwards, at directory/L/x/y.czml or .geojson.
+    Items are refined additively: a view loads the tiles of every level down to the one
+    matching its width.
+    """
+
+    # Constructor
+
+    def __init__(
+        self, path: Union[str, os.PathLike], url: Optional[str] = None
+    ) -> None:
+
+        with open(os.path.join(path, TILESET_FILE), encoding="utf-8") as f:
+            manifest: dict = json.load(f)
+
+        self._path = path
+        self._url: str = (
+            url if url is not None else os.fspath(path).replace(os.sep, "/")
+        )
+        self._manifest: dict = manifest
+
+    # Properties
+
+    @property
+    def path(self) -> Union[str, os.PathLike]:
+        return self._path
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def format(self) -> str:
+        return self._manifest["format"]
+
+    @property
+    def max_level(self) -> int:
+        return self._manifest["maxLevel"]
+
+    @property
+    def tiles(self) -> list[str]:
+
+        """
+        Return the keys of the tiles, as "level/x/y".
+        """
+
+        return self._manifest["tiles"]
+
+    @property
+    def bounds(self) -> list[float]:
+        return self._manifest["bounds"]
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+
+        """
+        Return script loading the tiles in view of the camera of widget, as data sources
+        added and removed when the camera stops moving. Tiles are fetched from url.
+        """
+
+        varname: str = widget._varname if widget is not None else "widget"
+
+        manifest: str = json.dumps(
+            {"tiles": self.tiles, "maxLevel": self.max_level}, separators=(",", ":")
+        )
+
+        return _LOADER_SCRIPT.format(
+            varname=varname,
+            url=json.dumps(self._url.rstrip("/") + "/"),
+            extension=json.dumps("." + self.format),
+            klass=TILE_FORMATS[self.format],
+            # escape "</" so that keys cannot close the enclosing script tag
+            manifest=manifest.replace("</", "<\\/"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __repr__(self) -> str:
+        return f"Tileset({len(self)})"
+
+
+######################################################################################################################################################
+
+
+def write_tiles(
+    path: Union[str, os.PathLike],
+    entities: Iterable[Any],
+    max_level: int = DEFAULT_MAX_LEVEL,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    format: str = "czml",
+    seed: int = 0,
+    url: Optional[str] = None,
+) -> Tileset:
+
+    """
+    Write entities as a quadtree of tiles in the directory at path, and return the Tileset.
+
+    Each entity batch is thinned level by level: every tile keeps a random sample of
+    max_items of the batch items in it, the remaining ones being pushed down to the tiles
+    of the next level, and all of them being kept at max_level. Other entities, such as
+    polylines, are written in the deepest tile containing their bounding box.
+
+    format: "czml" or "geojson", which supports point batches and polylines only.
+    seed: Seed of the random samples, so that tiles can be written again identically.
+    url: URL the tiles are fetched from by the loader script, path by default.
+    """
+
+    from cesiumpy.entities.index import _to_bounds
+
+    if format not in TILE_FORMATS:
+        raise ValueError(
+            "format must be one of {formats}: {format}".format(
+                formats=", ".join(TILE_FORMATS), format=format
+            )
+        )
+
+    if not 0 <= max_level <= MAX_LEVEL:
+        raise ValueError(
+            f"max_level must be between 0 and {MAX_LEVEL}: {max_level}"
+        )
+
+    if max_items < 1:
+        raise ValueError(f"max_items must be a positive integer: {max_items}")
+
+    # checked before anything is written, so that no partial tileset is left
+    entities = list(entities)
+
+    if format == "geojson":
+        for entity in entities:
+            _check_geojson(entity)
+
+    rng = np.random.default_rng(seed)
+
+    # tile key: list of batch parts and entities
+    tiles: dict[tuple[int, int, int], list[Any]] = collections.defaultdict(list)
+    bounds: list[np.ndarray] = []
+
+    for entity in entities:
+
+        if getattr(entity, "_is_batch", False):
+            positions: np.ndarray = entity.positions
+            if len(positions) == 0:
+                continue
+
+            (levels, x, y) = thin(positions, max_level, max_items, rng=rng).T
+
+            # items grouped by tile, in their order in the batch
+            codes: np.ndarray = (levels << (2 * max_level)) | (x << max_level) | y
+            order: np.ndarray = np.argsort(codes, kind="stable")
+            starts: np.ndarray = np.flatnonzero(
+                np.r_[True, codes[order][1:] != codes[order][:-1]]
+            )
+
+            for indices in np.split(order, starts[1:]):
+                first: int = indices[0]
+                key = (int(levels[first]), int(x[first]), int(y[first]))
+                tiles[key].append(entity.take(indices))
+
+            bounds.append(
+                np.concatenate(
+                    [positions[:, :2].min(axis=0), positions[:, :2].max(axis=0)]
+                )
+            )
+            continue
+
+        entity_bounds: Optional[np.ndarray] = _to_bounds(entity)
+        if entity_bounds is None:
+            raise ValueError(
+                f"entities must have positions in degrees to be tiled: {entity}"
+            )
+
+        tiles[_containing_tile(entity_bounds, max_level)].append(entity)
+        bounds.append(
+            np.concatenate(
+                [entity_bounds[:, :2].min(axis=0), entity_bounds[:, 2:].max(axis=0)]
+            )
+        )
+
+    os.makedirs(path, exist_ok=True)
+
+    for ((level, column, row), items) in tiles.items():
+        directory: str = os.path.join(path, str(level), str(column))
+        os.makedirs(directory, exist_ok=True)
+
+        with open(
+            os.path.join(directory, f"{row}.{format}"), "w", encoding="utf-8"
+        ) as f:
+            if format == "czml":
+                _write_czml(f, items, prefix=f"{level}-{column}-{row}")
+            else:
+                _write_geojson(f, items)
+
+    if bounds:
+        stacked = np.array(bounds)
+        extent = [
+            *stacked[:, :2].min(axis=0).tolist(),
+            *stacked[:, 2:].max(axis=0).tolist(),
+        ]
+    else:
+        extent = [-180.0, -90.0, 180.0, 90.0]
+
+    manifest: dict = {
+        "format": format,
+        "maxLevel": max_level,
+        "bounds": extent,
+        "tiles": [f"{level}/{column}/{row}" for (level, column, row) in sorted(tiles)],
+    }
+
+    with open(os.path.join(path, TILESET_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+    return Tileset(path, url=url)
+
+
+def thin(
+    positions: np.ndarray,
+    max_level: int = DEFAULT_MAX_LEVEL,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+
+    """
+    Return (N, 3) level, x, y tiles of (N, 2+) longitude, latitude positions, each tile
+    holding at most max_items of them but at max_level, sampled randomly.
+    """
+
+    rng = rng if rng is not None else np.random.default_rng()
+
+    positions = np.asarray(positions, dtype=np.float64)
+    count: int = len(positions)
+    size: int = 2**max_level
+
+    # tiles of max_level, parents being found by shifting bits
+    x = np.clip(((positions[:, 0] + 180.0) / 360.0 * size).astype(np.int64), 0, size - 1)
+    y = np.clip(((positions[:, 1] + 90.0) / 180.0 * size).astype(np.int64), 0, size - 1)
+
+    levels: np.ndarray = np.full(count, max_level, dtype=np.int64)
+
+    # remaining positions, in random order
+    remaining: np.ndarray = rng.permutation(count)
+
+    for level in range(max_level):
+
+        if len(remaining) == 0:
+            break
+
+        shift: int = max_level - level
+        tiles = (x[remaining] >> shift) << level | (y[remaining] >> shift)
+
+        # rank of each position in its tile, in random order
+        order = np.argsort(tiles, kind="stable")
+        sorted_tiles = tiles[order]
+        starts = np.flatnonzero(np.r_[True, sorted_tiles[1:] != sorted_tiles[:-1]])
+        ranks = np.arange(len(order)) - np.repeat(
+            starts, np.diff(np.r_[starts, len(order)])
+        )
+
+        kept = np.zeros(len(remaining), dtype=bool)
+        kept[order[ranks < max_items]] = True
+
+        levels[remaining[kept]] = level
+        remaining = remaining[~kept]
+
+    shifts = max_level - levels
+
+    return np.column_stack([levels, x >> shifts, y >> shifts])
+
+
+######################################################################################################################################################
+
+
+def _containing_tile(bounds: np.ndarray, max_level: int) -> tuple[int, int, int]:
+
+    """
+    Return the deepest level, x, y tile containing (N, 4) west, south, east, north bounds.
+    """
+
+    if len(bounds) > 1:
+        # across the antimeridian
+        return (0, 0, 0)
+
+    (west, south, east, north) = bounds[0]
+    size: int = 2**max_level
+
+    (x0, x1) = np.clip(
+        ((np.array([west, east]) + 180.0) / 360.0 * size).astype(np.int64), 0, size - 1
+    )
+    (y0, y1) = np.clip(
+        ((np.array([south, north]) + 90.0) / 180.0 * size).astype(np.int64), 0, size - 1
+    )
+
+    # levels up to the common prefix of the tile numbers
+    shift: int = max(int(x0 ^ x1).bit_length(), int(y0 ^ y1).bit_length())
+
+    return (max_level - shift, int(x0 >> shift), int(y0 >> shift))
+
+
+def _write_czml(f, items: list[Any], prefix: str) -> None:
+
+    from cesiumpy import czml
+
+    def packets():
+        yield czml._document(None)
+
+        for (index, item) in enumerate(items):
+            if getattr(item, "_is_batch", False):
+                yield from czml.batch_packets(item, prefix=f"{prefix}-{index}")
+            else:
+                yield czml.entity_packet(item, item.name or f"{prefix}-{index}")
+
+    czml.write_packets(f, packets())
+
+
+def _check_geojson(item: Any) -> None:
+
+    """
+    Raise ValueError if item cannot be written as GeoJSON.
+    """
+
+    from cesiumpy.entities.batch import PointBatch
+    from cesiumpy.entities.graphics.polyline import Polyline
+
+    if not isinstance(item, (PointBatch, Polyline)):
+        raise ValueError(
+            f"Only point batches and polylines can be written as GeoJSON: {item}"
+        )
+
+
+def _write_geojson(f, items: list[Any]) -> None:
+
+    """
+    Write items as a GeoJSON feature collection, colors of point batches being written
+    as "marker-color" simplestyle properties, which GeoJsonDataSource uses for pins.
+    """
+
+    from cesiumpy.entities.batch import PointBatch
+
+    features: list[dict] = []
+
+    for item in items:
+
+        _check_geojson(item)
+
+        if isinstance(item, PointBatch):
+            columns = {
+                key: value if isinstance(value, float) else value.tolist()
+                for (key, value) in item.columns.items()
+            }
+
+            colors: Optional[np.ndarray] = item.colors
+            if colors is not None:
+                columns["marker-color"] = _to_css(colors)
+
+            for (index, position) in enumerate(item.positions.tolist()):
+                properties = {
+                    key: value if isinstance(value, float) else value[index]
+                    for (key, value) in columns.items()
+                }
+                features.append(
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": position},
+                        "properties": properties,
+                    }
+                )
+
+        else:
+            features.append(
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": item.positions.values.tolist(),
+                    },
+                    "properties": {"name": item.name} if item.name else {},
+                }
+            )
+
+    json.dump(
+        {"type": "FeatureCollection", "features": features},
+        f,
+        separators=(",", ":"),
+    )
+
+
+def _to_css(colors: np.ndarray) -> list[str]:
+
+    """
+    Return "#rrggbb" strings of (N, 4) RGBA colors, alpha being dropped.
+    """
+
+    components: np.ndarray = np.rint(colors[:, :3] * 255.0).astype(np.int64)
+
+    return [
+        "#{0:02x}{1:02x}{2:02x}".format(*rgb) for rgb in components.tolist()
+    ]
+
+
+######################################################################################################################################################
+
+_LOADER_SCRIPT: str = """(function (viewer, url, extension, tileset) {{
+  const tiles = new Set(tileset.tiles);
+  const loaded = new Map();
+  function visible(level, west, south, east, north, wanted) {{
+    const count = 1 << level;
+    const x0 = Math.max(0, Math.floor((west + 180.0) / 360.0 * count));
+    const x1 = Math.min(count - 1, Math.floor((east + 180.0) / 360.0 * count));
+    const y0 = Math.max(0, Math.floor((south + 90.0) / 180.0 * count));
+    const y1 = Math.min(count - 1, Math.floor((north + 90.0) / 180.0 * count));
+    for (let x = x0; x <= x1; x++) {{
+      for (let y = y0; y <= y1; y++) {{
+        const key = level + "/" + x + "/" + y;
+        if (tiles.has(key)) {{ wanted.add(key); }}
+      }}
+    }}
+  }}
+  function update() {{
+    const rectangle = viewer.camera.computeViewRectangle();
+    if (!rectangle) {{ return; }}
+    const west = Cesium.Math.toDegrees(rectangle.west);
+    const south = Cesium.Math.toDegrees(rectangle.south);
+    const east = Cesium.Math.toDegrees(rectangle.east);
+    const north = Cesium.Math.toDegrees(rectangle.north);
+    const width = east >= west ? east - west : east - west + 360.0;
+    const level = Math.min(tileset.maxLevel, Math.max(0, Math.floor(Math.log2(360.0 / Math.max(width, 1e-9))) + 1));
+    const wanted = new Set();
+    for (let l = 0; l <= level; l++) {{
+      if (east >= west) {{
+        visible(l, west, south, east, north, wanted);
+      }} else {{
+        visible(l, west, south, 180.0, north, wanted);
+        visible(l, -180.0, south, east, north, wanted);
+      }}
+    }}
+    for (const [key, source] of loaded) {{
+      if (!wanted.has(key)) {{ viewer.dataSources.remove(source, true); loaded.delete(key); }}
+    }}
+    for (const key of wanted) {{
+      if (!loaded.has(key)) {{
+        const source = new Cesium.{klass}();
+        loaded.set(key, source);
+        viewer.dataSources.add(source);
+        source.load(url + key + extension);
+      }}
+    }}
+  }}
+  viewer.camera.moveEnd.addEventListener(update);
+  update();
+}})({varname}, {url}, {extension}, {manifest});"""
+
+######################################################################################################################################################
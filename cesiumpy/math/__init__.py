@@ -7,5 +7,6 @@
 ######################################################################################################################################################
 
 from .converters import *  # noqa
+from .simplification import *  # noqa
 
 ######################################################################################################################################################
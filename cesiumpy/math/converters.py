@@ -8,6 +8,13 @@
 
 import math
 
+import numpy as np
+
+######################################################################################################################################################
+
+# Radii of Cesium.Ellipsoid.WGS84, in meters.
+WGS84_RADII: tuple[float, float, float] = (6378137.0, 6378137.0, 6356752.3142451793)
+
 ######################################################################################################################################################
 
 
@@ -20,4 +27,33 @@ def to_radians(value: float) -> float:
     return value * math.pi / 180.0
 
 
+def geodetic_to_cartesian(longitude, latitude, height) -> np.ndarray:
+
+    """
+    Convert geodetic coordinates (degrees, degrees, meters) to WGS84 fixed frame positions (meters).
+
+    Arguments may be scalars or arrays, the result is a (N, 3) float64 array.
+    Follows Cesium.Ellipsoid.cartographicToCartesian.
+    """
+
+    longitude = np.radians(np.atleast_1d(np.asarray(longitude, dtype=np.float64)))
+    latitude = np.radians(np.atleast_1d(np.asarray(latitude, dtype=np.float64)))
+    height = np.atleast_1d(np.asarray(height, dtype=np.float64))
+
+    cos_latitude = np.cos(latitude)
+
+    normal = np.column_stack(
+        [
+            cos_latitude * np.cos(longitude),
+            cos_latitude * np.sin(longitude),
+            np.sin(latitude),
+        ]
+    )
+
+    k = normal * np.square(WGS84_RADII)
+    gamma = np.sqrt(np.einsum("ij,ij->i", normal, k))
+
+    return (k / gamma[:, np.newaxis]) + (normal * height[:, np.newaxis])
+
+
 ######################################################################################################################################################
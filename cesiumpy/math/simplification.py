@@ -0,0 +1,213 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/math/simplification.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from typing import Union
+
+import numpy as np
+
+######################################################################################################################################################
+
+SIMPLIFY_ALGORITHMS: list[str] = ["douglas_peucker", "visvalingam"]
+
+# Web map zoom levels of typical camera distances
+ZOOM_LEVELS: dict[str, int] = {
+    "globe": 2,
+    "continent": 4,
+    "country": 6,
+    "region": 8,
+    "city": 11,
+    "street": 15,
+}
+
+# Width of a web map tile, in pixels
+TILE_SIZE: int = 256
+
+######################################################################################################################################################
+
+
+def zoom_tolerance(zoom: Union[int, float, str]) -> float:
+
+    """
+    Return the width of a pixel at the equator at zoom level, in degrees.
+
+    zoom is a web map zoom level, or a name of ZOOM_LEVELS.
+    """
+
+    if isinstance(zoom, str):
+        if zoom not in ZOOM_LEVELS:
+            raise ValueError(
+                "zoom must be one of {names}: {zoom}".format(
+                    names=", ".join(ZOOM_LEVELS), zoom=zoom
+                )
+            )
+        zoom = ZOOM_LEVELS[zoom]
+
+    return 360.0 / (TILE_SIZE * 2.0**zoom)
+
+
+def simplify(
+    points, tolerance: float, algorithm: str = "douglas_peucker"
+) -> np.ndarray:
+
+    """
+    Return indices of the points kept by simplifying the line with algorithm.
+
+    points is a (N, 2) or (N, 3) longitude, latitude (, height) array, and tolerance is in degrees,
+    measured in the longitude, latitude plane. Closed rings keep at least 4 points.
+    """
+
+    if algorithm not in SIMPLIFY_ALGORITHMS:
+        raise ValueError(
+            "algorithm must be one of {names}: {algorithm}".format(
+                names=", ".join(SIMPLIFY_ALGORITHMS), algorithm=algorithm
+            )
+        )
+
+    points = np.asarray(points, dtype=np.float64)
+
+    closed: bool = (len(points) > 3) and bool(np.all(points[0] == points[-1]))
+    min_points: int = 4 if closed else 2
+
+    if algorithm == "douglas_peucker":
+        return douglas_peucker(points, tolerance, min_points=min_points)
+
+    return visvalingam(points, tolerance, min_points=min_points)
+
+
+def douglas_peucker(points, tolerance: float, min_points: int = 2) -> np.ndarray:
+
+    """
+    Return indices of the points kept by the Douglas-Peucker algorithm.
+
+    Every pass splits all the segments at once, at their farthest point from the segment when it
+    is farther than tolerance.
+    """
+
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    size: int = len(points)
+
+    if size <= max(min_points, 2):
+        return np.arange(size)
+
+    kept = np.zeros(size, dtype=bool)
+    kept[[0, -1]] = True
+
+    everything = np.arange(size)
+
+    while True:
+
+        indices = np.flatnonzero(kept)
+
+        if len(indices) == size:
+            break
+
+        # segment each point belongs to, points at indices being their segment start
+        segments = np.minimum(
+            np.searchsorted(indices, everything, side="right") - 1, len(indices) - 2
+        )
+
+        distances = _segment_distances(
+            points, points[indices[segments]], points[indices[segments + 1]]
+        )
+        distances[kept] = -1.0
+
+        # farthest point of each segment
+        order = np.lexsort((-distances, segments))
+        (_, first) = np.unique(segments[order], return_index=True)
+        farthest = order[first]
+        farthest = farthest[distances[farthest] >= 0.0]
+
+        if len(indices) >= min_points:
+            farthest = farthest[distances[farthest] > tolerance]
+
+        if len(farthest) == 0:
+            break
+
+        kept[farthest] = True
+
+    return np.flatnonzero(kept)
+
+
+def visvalingam(points, tolerance: float, min_points: int = 2) -> np.ndarray:
+
+    """
+    Return indices of the points kept by the Visvalingam-Whyatt algorithm.
+
+    Points whose triangle with their neighbours has an area below tolerance ** 2 are removed,
+    every pass removing half of the small triangles at once rather than the smallest one.
+    """
+
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    size: int = len(points)
+
+    min_points = max(min_points, 2)
+
+    kept = np.ones(size, dtype=bool)
+    threshold: float = tolerance**2
+
+    while True:
+
+        indices = np.flatnonzero(kept)
+
+        if len(indices) <= min_points:
+            break
+
+        (previous, current, following) = (
+            points[indices[:-2]],
+            points[indices[1:-1]],
+            points[indices[2:]],
+        )
+        areas = 0.5 * np.abs(
+            (current[:, 0] - previous[:, 0]) * (following[:, 1] - previous[:, 1])
+            - (following[:, 0] - previous[:, 0]) * (current[:, 1] - previous[:, 1])
+        )
+
+        # every other point of the runs of small triangles, so that removed points are never
+        # adjacent and their areas stay valid within a pass
+        small = areas < threshold
+        starts = small & ~np.concatenate([[False], small[:-1]])
+        offsets = np.arange(len(areas))
+        offsets -= np.maximum.accumulate(np.where(starts, offsets, 0))
+        removed = np.flatnonzero(small & (offsets % 2 == 0))
+
+        if len(removed) == 0:
+            break
+
+        removable: int = len(indices) - min_points
+        if len(removed) > removable:
+            removed = removed[np.argsort(areas[removed], kind="stable")[:removable]]
+
+        kept[indices[1:-1][removed]] = False
+
+    return np.flatnonzero(kept)
+
+
+######################################################################################################################################################
+
+
+def _segment_distances(
+    points: np.ndarray, start: np.ndarray, stop: np.ndarray
+) -> np.ndarray:
+
+    """
+    Return distances of points from the segments between start and stop.
+    """
+
+    direction = stop - start
+    length = np.einsum("ij,ij->i", direction, direction)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.einsum("ij,ij->i", points - start, direction) / length
+
+    # degenerated segments are measured from their start
+    ratio = np.where(length > 0.0, np.clip(ratio, 0.0, 1.0), 0.0)
+
+    return np.linalg.norm(points - (start + ratio[:, np.newaxis] * direction), axis=1)
+
+
+######################################################################################################################################################
@@ -8,6 +8,9 @@
 
 from __future__ import annotations
 
+import math
+
+import numpy as np
 import traitlets
 
 import cesiumpy
@@ -27,12 +30,18 @@ class Quaternion(_CesiumObject):
     var hpRoll = new Cesium.HeadingPitchRoll(heading,pitch,roll);
     var orientation = Cesium.Transforms.headingPitchRollQuaternion(position,hpRoll);
     orientationProperty.addSample(time, orientation);
+
+    Products, axis angle and heading pitch roll conversions are evaluated in Python,
+    so that composed rotations serialize as four numbers.
     """
 
     # Definitions
 
     _props = ["x", "y", "z", "w"]
 
+    # Number of floats used to store a Quaternion in a columnar sample store.
+    _packed_length = 4
+
     x = traitlets.Float(allow_none=False)
     y = traitlets.Float(allow_none=False)
     z = traitlets.Float(allow_none=False)
@@ -59,14 +68,72 @@ class Quaternion(_CesiumObject):
         return f"new Cesium.Quaternion({self.x}, {self.y}, {self.z}, {self.w})"
 
     def __mul__(self, quaternion: Quaternion) -> Quaternion:
-        return _QuaternionFromProduct(
-            quaternion_1=self,
-            quaternion_2=quaternion,
+
+        """
+        Return the rotation by self followed by quaternion, as Cesium.Quaternion.multiply(quaternion, self).
+        """
+
+        return Quaternion._unpack(
+            multiply_packed(quaternion._pack(), self._pack()).tolist()
         )
 
     def __repr__(self) -> str:
         return f"Cesium.Quaternion({self.x}, {self.y}, {self.z}, {self.w})"
 
+    def _pack(self) -> tuple[float, float, float, float]:
+        return (self.x, self.y, self.z, self.w)
+
+    # Class methods
+
+    @classmethod
+    def _unpack(cls, values, degrees: bool = False) -> Quaternion:
+
+        (x, y, z, w) = values
+
+        return Quaternion(x=x, y=y, z=z, w=w)
+
+    @classmethod
+    def _to_interpolation(cls, windows: np.ndarray) -> np.ndarray:
+
+        """
+        Return (M, P, 3) rotation vectors of (M, P, 4) windows of samples, relative to the first
+        sample of each window, as Cesium.Quaternion.convertPackedArrayForInterpolation.
+        """
+
+        conjugate: np.ndarray = windows[:, :1] * np.array([-1.0, -1.0, -1.0, 1.0])
+
+        relative: np.ndarray = multiply_packed(windows, conjugate)
+        relative = np.where(relative[..., 3:] < 0.0, -relative, relative)
+
+        w: np.ndarray = np.clip(relative[..., 3], -1.0, 1.0)
+
+        # axis * angle, Cesium regarding rotations with |w - 1| < 1e-6 as null
+        null: np.ndarray = np.abs(w - 1.0) < 1e-6
+        scale: np.ndarray = np.where(
+            null, 0.0, 2.0 * np.arccos(w) / np.sqrt(np.where(null, 1.0, 1.0 - w * w))
+        )
+
+        return relative[..., :3] * scale[..., np.newaxis]
+
+    @classmethod
+    def _from_interpolation(cls, results: np.ndarray, windows: np.ndarray) -> np.ndarray:
+
+        """
+        Return (M, 4) packed quaternions of (M, 3) interpolated rotation vectors, as
+        Cesium.Quaternion.unpackInterpolationResult.
+        """
+
+        angles: np.ndarray = np.linalg.norm(results, axis=-1)
+        null: np.ndarray = angles == 0.0
+
+        scale: np.ndarray = np.sin(angles / 2.0) / np.where(null, 1.0, angles)
+
+        rotations: np.ndarray = np.column_stack(
+            [results * scale[:, np.newaxis], np.cos(angles / 2.0)]
+        )
+
+        return multiply_packed(rotations, windows[:, 0])
+
     # Static methods
 
     @staticmethod
@@ -85,9 +152,8 @@ class Quaternion(_CesiumObject):
         angle: float,
     ) -> Quaternion:
 
-        return _QuaternionFromAxisAngle(
-            axis=axis,
-            angle=angle,
+        return Quaternion._unpack(
+            axis_angle_to_packed((axis.x, axis.y, axis.z), angle).tolist()
         )
 
     @staticmethod
@@ -95,8 +161,12 @@ class Quaternion(_CesiumObject):
         heading_pitch_roll: HeadingPitchRoll,
     ) -> Quaternion:
 
-        return _QuaternionFromHeadingPitchRoll(
-            heading_pitch_roll=heading_pitch_roll,
+        return Quaternion._unpack(
+            heading_pitch_roll_to_packed(
+                heading_pitch_roll.heading,
+                heading_pitch_roll.pitch,
+                heading_pitch_roll.roll,
+            )[0].tolist()
         )
 
 
@@ -148,10 +218,10 @@ class HeadingPitchRoll(_CesiumObject):
         roll: float,
     ) -> HeadingPitchRoll:
 
-        return _HeadingPitchRollFromDegrees(
-            heading=heading,
-            pitch=pitch,
-            roll=roll,
+        return HeadingPitchRoll(
+            heading=math.radians(heading),
+            pitch=math.radians(pitch),
+            roll=math.radians(roll),
         )
 
     @staticmethod
@@ -159,146 +229,119 @@ class HeadingPitchRoll(_CesiumObject):
         quaternion: Quaternion,
     ) -> HeadingPitchRoll:
 
-        return _HeadingPitchRollFromQuaternion(
-            quaternion=quaternion,
-        )
-
-
-######################################################################################################################################################
+        (heading, pitch, roll) = packed_to_heading_pitch_roll(quaternion._pack())[0]
 
-
-class _QuaternionFromProduct(Quaternion):
-
-    # Constructor
-
-    def __init__(
-        self,
-        quaternion_1: Quaternion,
-        quaternion_2: Quaternion,
-    ) -> None:
-
-        super().__init__(
-            x=0.0,
-            y=0.0,
-            z=0.0,
-            w=0.0,
+        return HeadingPitchRoll(
+            heading=float(heading),
+            pitch=float(pitch),
+            roll=float(roll),
         )
 
-        self.quaternion_1: Quaternion = quaternion_1
-        self.quaternion_2: Quaternion = quaternion_2
-
-    # Methods
-
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.Quaternion.multiply({self.quaternion_2.generate_script(widget=widget)}, {self.quaternion_1.generate_script(widget=widget)}, {Quaternion.unit().generate_script(widget=widget)})"
-
 
 ######################################################################################################################################################
 
 
-class _QuaternionFromAxisAngle(Quaternion):
-
-    # Constructor
+def multiply_packed(left, right) -> np.ndarray:
 
-    def __init__(
-        self,
-        axis: cesiumpy.Cartesian3,
-        angle: float,
-    ) -> None:
+    """
+    Return the products of packed (x, y, z, w) quaternions, as Cesium.Quaternion.multiply(left, right).
 
-        super().__init__(
-            x=0.0,
-            y=0.0,
-            z=0.0,
-            w=0.0,
-        )
+    left, right: (4,) or (N, 4) arrays, broadcast against each other.
+    """
 
-        self.axis = axis
-        self.angle = angle
+    (lx, ly, lz, lw) = np.moveaxis(np.asarray(left, dtype=np.float64), -1, 0)
+    (rx, ry, rz, rw) = np.moveaxis(np.asarray(right, dtype=np.float64), -1, 0)
 
-    # Methods
+    return np.stack(
+        [
+            lw * rx + lx * rw + ly * rz - lz * ry,
+            lw * ry - lx * rz + ly * rw + lz * rx,
+            lw * rz + lx * ry - ly * rx + lz * rw,
+            lw * rw - lx * rx - ly * ry - lz * rz,
+        ],
+        axis=-1,
+    )
 
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.Quaternion.fromAxisAngle({self.axis.generate_script(widget=widget)}, {self.angle})"
 
+def rotate_packed(quaternions, vectors) -> np.ndarray:
 
-######################################################################################################################################################
+    """
+    Return vectors rotated by packed (x, y, z, w) quaternions, as Cesium.Matrix3.fromQuaternion(q) * v.
 
+    quaternions: (4,) or (N, 4) array.
+    vectors: (3,) or (N, 3) array.
+    """
 
-class _QuaternionFromHeadingPitchRoll(Quaternion):
+    quaternions = np.asarray(quaternions, dtype=np.float64)
+    vectors = np.asarray(vectors, dtype=np.float64)
 
-    # Constructor
+    (u, w) = (quaternions[..., :3], quaternions[..., 3:])
 
-    def __init__(
-        self,
-        heading_pitch_roll: HeadingPitchRoll,
-    ) -> None:
+    t: np.ndarray = 2.0 * np.cross(u, vectors)
 
-        super().__init__(
-            x=0.0,
-            y=0.0,
-            z=0.0,
-            w=0.0,
-        )
+    return vectors + (w * t) + np.cross(u, t)
 
-        self.heading_pitch_roll: HeadingPitchRoll = heading_pitch_roll
 
-    # Methods
+def axis_angle_to_packed(axes, angles) -> np.ndarray:
 
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.Quaternion.fromHeadingPitchRoll({self.heading_pitch_roll.generate_script(widget=widget)})"
+    """
+    Return packed quaternions of rotations around axes, as Cesium.Quaternion.fromAxisAngle.
 
+    axes: (3,) or (N, 3) array, normalized here.
+    angles: Scalar or (N,) array, in radians.
+    """
 
-######################################################################################################################################################
+    axes = np.asarray(axes, dtype=np.float64)
+    angles = np.asarray(angles, dtype=np.float64)[..., np.newaxis]
 
+    axes = axes / np.linalg.norm(axes, axis=-1, keepdims=True)
 
-class _HeadingPitchRollFromDegrees(HeadingPitchRoll):
+    vectors: np.ndarray = np.sin(angles / 2.0) * axes
+    scalars: np.ndarray = np.broadcast_to(
+        np.cos(angles / 2.0), vectors.shape[:-1] + (1,)
+    )
 
-    # Constructor
+    return np.concatenate([vectors, scalars], axis=-1)
 
-    def __init__(
-        self,
-        heading: float,
-        pitch: float,
-        roll: float,
-    ) -> None:
 
-        super().__init__(
-            heading=heading,
-            pitch=pitch,
-            roll=roll,
-        )
+def heading_pitch_roll_to_packed(headings, pitches, rolls) -> np.ndarray:
 
-    # Methods
+    """
+    Return (N, 4) packed quaternions of heading, pitch and roll rotations, as Cesium.Quaternion.fromHeadingPitchRoll.
 
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.HeadingPitchRoll.fromDegrees({self.heading}, {self.pitch}, {self.roll})"
+    headings, pitches, rolls: Scalars or (N,) arrays, in radians.
+    """
 
+    headings = np.atleast_1d(np.asarray(headings, dtype=np.float64))
+    pitches = np.atleast_1d(np.asarray(pitches, dtype=np.float64))
+    rolls = np.atleast_1d(np.asarray(rolls, dtype=np.float64))
 
-######################################################################################################################################################
+    q_roll: np.ndarray = axis_angle_to_packed((1.0, 0.0, 0.0), rolls)
+    q_pitch: np.ndarray = axis_angle_to_packed((0.0, 1.0, 0.0), -pitches)
+    q_heading: np.ndarray = axis_angle_to_packed((0.0, 0.0, 1.0), -headings)
 
+    return multiply_packed(q_heading, multiply_packed(q_pitch, q_roll))
 
-class _HeadingPitchRollFromQuaternion(HeadingPitchRoll):
 
-    # Constructor
+def packed_to_heading_pitch_roll(quaternions) -> np.ndarray:
 
-    def __init__(
-        self,
-        quaternion: Quaternion,
-    ) -> None:
+    """
+    Return (N, 3) headings, pitches and rolls of packed quaternions, as Cesium.HeadingPitchRoll.fromQuaternion.
+    """
 
-        super().__init__(
-            heading=0.0,
-            pitch=0.0,
-            roll=0.0,
-        )
+    quaternions = np.atleast_2d(np.asarray(quaternions, dtype=np.float64))
 
-        self.quaternion: Quaternion = quaternion
+    (x, y, z, w) = quaternions.T
 
-    # Methods
+    test: np.ndarray = 2.0 * (w * y - z * x)
 
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.HeadingPitchRoll.fromQuaternion({self.quaternion.generate_script(widget=widget)})"
+    return np.column_stack(
+        [
+            -np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z)),
+            -np.arcsin(np.clip(test, -1.0, 1.0)),
+            np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y)),
+        ]
+    )
 
 
 ######################################################################################################################################################
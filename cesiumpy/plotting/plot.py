@@ -4,13 +4,23 @@
 from __future__ import unicode_literals
 
 import cesiumpy
+from cesiumpy.entities.batch import CylinderBatch, LabelBatch, PointBatch
 import cesiumpy.util.common as com
 
+# Number of rows from which scatter, bar and label add a single EntityBatch
+# instead of one entity per row
+BATCH_THRESHOLD = 1000
+
 
 class PlottingAccessor(object):
     def __init__(self, widget):
         self.widget = widget
 
+    def _use_batch(self, x, batch):
+        if batch is None:
+            return len(x) >= BATCH_THRESHOLD
+        return batch
+
     def _fill_by(self, x, length, key, default=None):
         if not com.is_listlike(x):
             if x is None:
@@ -29,7 +39,7 @@ class PlottingAccessor(object):
     def __call__(self):
         raise NotImplementedError
 
-    def bar(self, x, y, z, size=10e3, color=None, bottom=0.0):
+    def bar(self, x, y, z, size=10e3, color=None, bottom=0.0, batch=None):
         """
         Plot cesiumpy.Cylinder like bar plot
 
@@ -48,7 +58,18 @@ class PlottingAccessor(object):
             Cylinder color
         bottom : list or float, default 0
             Bottom heights
+        batch : bool, optional
+            Whether to add a single CylinderBatch, default to True from
+            BATCH_THRESHOLD rows
         """
+        if com.is_listlike(x) and self._use_batch(x, batch):
+            self.widget.entities.add(
+                CylinderBatch(
+                    x, y, length=z, radius=size, color=color, bottom=bottom
+                )
+            )
+            return self.widget
+
         x = com.validate_listlike(x, key="x")
 
         # for list validation (not allow scalar)
@@ -69,14 +90,14 @@ class PlottingAccessor(object):
             p = cesiumpy.Cylinder(
                 position=(_x, _y, _bottom + _z / 2.0),
                 length=_z,
-                topRadius=_size,
-                bottomRadius=_size,
+                top_radius=_size,
+                bottom_radius=_size,
                 material=_color,
             )
             self.widget.entities.add(p)
         return self.widget
 
-    def scatter(self, x, y, z=None, size=None, color=None):
+    def scatter(self, x, y, z=None, size=None, color=None, batch=None):
         """
         Plot cesiumpy.Point like scatter plot
 
@@ -93,7 +114,14 @@ class PlottingAccessor(object):
             Pixel size
         color : list or Color
             Point color
+        batch : bool, optional
+            Whether to add a single PointBatch, default to True from
+            BATCH_THRESHOLD rows
         """
+        if com.is_listlike(x) and self._use_batch(x, batch):
+            self.widget.entities.add(PointBatch(x, y, z, size=size, color=color))
+            return self.widget
+
         x = com.validate_listlike(x, key="x")
 
         # for list validation (not allow scalar)
@@ -106,7 +134,7 @@ class PlottingAccessor(object):
         color = self._fill_by(color, len(x), key="color")
 
         for i, (_x, _y, _z, _size, _color) in enumerate(zip(x, y, z, size, color)):
-            p = cesiumpy.Point(position=(_x, _y, _z), pixelSize=_size, color=_color)
+            p = cesiumpy.Point(position=(_x, _y, _z), pixel_size=_size, color=_color)
             self.widget.entities.add(p)
         return self.widget
 
@@ -149,7 +177,7 @@ class PlottingAccessor(object):
             self.widget.entities.add(p)
         return self.widget
 
-    def label(self, text, x, y, z=None, size=None, color=None):
+    def label(self, text, x, y, z=None, size=None, color=None, batch=None):
         """
         Plot cesiumpy.Label
 
@@ -168,7 +196,17 @@ class PlottingAccessor(object):
             Text size
         color : list or Color
             Text color
+        batch : bool, optional
+            Whether to add a single LabelBatch, default to True from
+            BATCH_THRESHOLD rows
         """
+        if com.is_listlike(x) and self._use_batch(x, batch):
+            text = com.validate_listlike(text, key="text")
+            self.widget.entities.add(
+                LabelBatch(text, x, y, z, size=size, color=color)
+            )
+            return self.widget
+
         x = com.validate_listlike(x, key="x")
 
         # for list validation (not allow scalar)
@@ -11,11 +11,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import traitlets
 
 from cesiumpy.base import _CesiumEnum
 import cesiumpy.entities.cartesian as cartesian
-from cesiumpy.property import Property, SampledProperty
+from cesiumpy.math import geodetic_to_cartesian
+from cesiumpy.property import (
+    InterpolationAlgorithm,
+    Property,
+    SampledProperty,
+    _interpolate,
+)
+
+######################################################################################################################################################
+
+DECIMATION_ALGORITHMS: list[str] = ["refine", "douglas_peucker"]
 
 ######################################################################################################################################################
 
@@ -29,6 +40,65 @@ class ReferenceFrame(_CesiumEnum):
 ######################################################################################################################################################
 
 
+class Decimation:
+
+    """
+    Report of a SampledPositionProperty decimation.
+    """
+
+    # Constructor
+
+    def __init__(
+        self,
+        size_before: int,
+        size_after: int,
+        max_error: float,
+    ) -> None:
+
+        self._size_before: int = size_before
+        self._size_after: int = size_after
+        self._max_error: float = max_error
+
+    # Properties
+
+    @property
+    def size_before(self) -> int:
+        return self._size_before
+
+    @property
+    def size_after(self) -> int:
+        return self._size_after
+
+    @property
+    def max_error(self) -> float:
+
+        """
+        Return the largest distance between a dropped sample and the interpolated track, in meters.
+        """
+
+        return self._max_error
+
+    @property
+    def compression_ratio(self) -> float:
+        return self._size_before / max(self._size_after, 1)
+
+    # Methods
+
+    def __repr__(self) -> str:
+        return (
+            "Decimation({before} -> {after} samples, "
+            "ratio {ratio:.1f}, max error {error:.3f} m)"
+        ).format(
+            before=self.size_before,
+            after=self.size_after,
+            ratio=self.compression_ratio,
+            error=self.max_error,
+        )
+
+
+######################################################################################################################################################
+
+
 class PositionProperty(Property):
 
     # Definitions
@@ -78,6 +148,9 @@ class SampledPositionProperty(PositionProperty, SampledProperty):
         ] = None,
         reference_frame: Optional[ReferenceFrame] = None,
         number_of_derivatives: Optional[float] = None,
+        packed: bool = True,
+        interpolation_algorithm: Optional[InterpolationAlgorithm] = None,
+        interpolation_degree: Optional[int] = None,
     ) -> None:
 
         PositionProperty.__init__(
@@ -90,6 +163,9 @@ class SampledPositionProperty(PositionProperty, SampledProperty):
             type=cartesian.Cartesian3,
             name=name,
             samples=samples,
+            packed=packed,
+            interpolation_algorithm=interpolation_algorithm,
+            interpolation_degree=interpolation_degree,
         )
 
         self.number_of_derivatives = number_of_derivatives
@@ -105,5 +181,170 @@ class SampledPositionProperty(PositionProperty, SampledProperty):
 
         super().add_sample(time, position, derivatives)
 
+    def add_samples(
+        self,
+        times,
+        positions,
+        epoch: Optional[datetime] = None,
+        degrees: bool = False,
+    ) -> None:
+
+        super().add_samples(times, positions, epoch=epoch, degrees=degrees)
+
+    def decimate(
+        self,
+        tolerance_m: float,
+        algorithm: str = "refine",
+    ) -> Decimation:
+
+        """
+        Drop the samples which the interpolation of the remaining samples reproduces within tolerance.
+
+        tolerance_m: Largest distance allowed between a dropped sample and the interpolated track, in meters.
+        algorithm: "refine" starts from the first and last samples, and adds the worst sample of every gap
+            where the property interpolation deviates by more than tolerance, until none does.
+            "douglas_peucker" splits the track in time at the sample farthest from the chord, which
+            bounds the error of linear interpolation only.
+        """
+
+        if algorithm not in DECIMATION_ALGORITHMS:
+            raise ValueError(
+                "algorithm must be one of {algorithms}: {algorithm}".format(
+                    algorithms=", ".join(DECIMATION_ALGORITHMS),
+                    algorithm=algorithm,
+                )
+            )
+
+        values: np.ndarray = self._store.values
+        times: np.ndarray = self._store.times
+
+        size: int = len(times)
+
+        if size <= 2:
+            return Decimation(size_before=size, size_after=size, max_error=0.0)
+
+        if self._store.degrees:
+            values = geodetic_to_cartesian(values[:, 0], values[:, 1], values[:, 2])
+
+        order: np.ndarray = np.argsort(times, kind="stable")
+        (times, values) = (times[order], values[order])
+
+        degree: int = self._interpolation_degree()
+
+        if algorithm == "douglas_peucker":
+            kept: np.ndarray = _douglas_peucker(times, values, tolerance_m)
+        else:
+            kept = _refine(times, values, tolerance_m, degree)
+
+        errors: np.ndarray = np.linalg.norm(
+            _interpolate(times[kept], values[kept], times, degree, cartesian.Cartesian3)
+            - values,
+            axis=1,
+        )
+
+        self._store.select(order[kept])
+        self._invalidate_script()
+
+        return Decimation(
+            size_before=size,
+            size_after=len(kept),
+            max_error=float(errors.max()),
+        )
+
+
+######################################################################################################################################################
+
+
+def _douglas_peucker(
+    times: np.ndarray,
+    positions: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+
+    """
+    Return indices of the samples kept by the Douglas-Peucker algorithm, in time.
+
+    Distances are measured to the chord at the same time, i.e. to the linear interpolation.
+    """
+
+    kept: np.ndarray = np.zeros(len(times), dtype=bool)
+    kept[[0, -1]] = True
+
+    segments: list[tuple[int, int]] = [(0, len(times) - 1)]
+
+    while segments:
+
+        (start, stop) = segments.pop()
+
+        if stop - start < 2:
+            continue
+
+        duration: float = times[stop] - times[start]
+        fractions: np.ndarray = (
+            (times[start + 1 : stop] - times[start]) / duration
+            if duration > 0.0
+            else np.zeros(stop - start - 1)
+        )
+
+        chord: np.ndarray = positions[start] + fractions[:, np.newaxis] * (
+            positions[stop] - positions[start]
+        )
+        errors: np.ndarray = np.linalg.norm(positions[start + 1 : stop] - chord, axis=1)
+
+        worst: int = int(np.argmax(errors))
+
+        if errors[worst] > tolerance:
+            split: int = start + 1 + worst
+            kept[split] = True
+            segments.extend([(start, split), (split, stop)])
+
+    return np.flatnonzero(kept)
+
+
+def _refine(
+    times: np.ndarray,
+    positions: np.ndarray,
+    tolerance: float,
+    degree: int,
+) -> np.ndarray:
+
+    """
+    Return indices of the samples kept by refinement of the track interpolated with degree.
+
+    Every pass evaluates the interpolation of the kept samples at all sample times at once,
+    and keeps the worst sample of every gap between kept samples exceeding tolerance.
+    """
+
+    kept: np.ndarray = np.zeros(len(times), dtype=bool)
+    kept[[0, -1]] = True
+
+    while True:
+
+        indices: np.ndarray = np.flatnonzero(kept)
+
+        errors: np.ndarray = np.linalg.norm(
+            _interpolate(
+                times[indices], positions[indices], times, degree, cartesian.Cartesian3
+            )
+            - positions,
+            axis=1,
+        )
+        errors[kept] = 0.0
+
+        candidates: np.ndarray = np.flatnonzero(errors > tolerance)
+
+        if len(candidates) == 0:
+            return indices
+
+        # gap of a sample: index of the next kept sample
+        gaps: np.ndarray = np.searchsorted(indices, candidates)
+
+        order: np.ndarray = np.lexsort((-errors[candidates], gaps))
+        (candidates, gaps) = (candidates[order], gaps[order])
+
+        (_, first) = np.unique(gaps, return_index=True)
+
+        kept[candidates[first]] = True
+
 
 ######################################################################################################################################################
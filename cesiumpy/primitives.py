@@ -0,0 +1,388 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           cesiumpy/primitives.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+import numpy as np
+
+from cesiumpy.entities.batch import _Batch, _to_list, _to_positions
+from cesiumpy.math import geodetic_to_cartesian
+import cesiumpy.util.common as com
+
+######################################################################################################################################################
+
+
+class _PrimitiveCollection(_Batch):
+
+    """
+    Base class for primitive collections added to scene.primitives.
+
+    Positions are converted to Cartesian3 (ECEF, in meters) in Python, and emitted with the other
+    per-primitive columns as a single packed data array. The collection is built by a JavaScript
+    loop, and the whole script is an expression, so that it can be passed to scene.primitives.add.
+    """
+
+    # Definitions
+
+    # Name of the Cesium collection, e.g. "PointPrimitiveCollection"
+    _collection: Optional[str] = None
+
+    # Constructor
+
+    def __init__(
+        self,
+        x,
+        y,
+        z=None,
+        color=None,
+        **columns,
+    ) -> None:
+
+        self._positions: np.ndarray = _to_positions(x, y, z)
+
+        super().__init__(len(self._positions), color=color, **columns)
+
+    # Properties
+
+    @property
+    def positions(self) -> np.ndarray:
+
+        """
+        Return positions as a (N, 3) longitude, latitude, height array.
+        """
+
+        return self._positions
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+
+        positions: np.ndarray = geodetic_to_cartesian(
+            self._positions[:, 0], self._positions[:, 1], self._positions[:, 2]
+        )
+
+        (data, accessors, color, palette) = self._pack(widget, positions)
+
+        script: str = (
+            "(function (data, colors{args}) {{ "
+            "const collection = new Cesium.{collection}(); "
+            "for (let j = 0; j < {length}; j++) {{ "
+            "const i = j * {width}; "
+            "collection.add({{position: new Cesium.Cartesian3(data[i], data[i + 1], data[i + 2]), {members}}}); "
+            "}} "
+            "return collection; "
+            "}})({data}, {palette}{values})"
+        )
+
+        extra: dict[str, str] = self._extra_arguments()
+
+        return script.format(
+            args="".join(f", {key}" for key in extra),
+            collection=self._collection,
+            length=len(self),
+            width=data.shape[1],
+            members=self._generate_members(accessors, color),
+            data=com.to_jsfloat64array(data.ravel()),
+            palette=palette,
+            values="".join(f", {value}" for value in extra.values()),
+        )
+
+    # Private methods
+
+    def _generate_members(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        """
+        Return the members of the JavaScript object describing the primitive at data[i], besides position.
+        """
+
+        raise NotImplementedError
+
+
+######################################################################################################################################################
+
+
+class PointPrimitiveCollection(_PrimitiveCollection):
+
+    """
+    PointPrimitiveCollection
+
+    Parameters
+    ----------
+
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    z: list or float, default 0
+        Heights
+    size: list or float, default 10
+        Pixel size
+    color: list, Color or array, default WHITE
+        Point color
+    """
+
+    _collection = "PointPrimitiveCollection"
+
+    def __init__(self, x, y, z=None, size=None, color=None) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=z,
+            color=color,
+            pixel_size=size if size is not None else 10.0,
+        )
+
+    def _generate_members(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        members: str = f"pixelSize: {accessors['pixel_size']}"
+
+        if color is not None:
+            members += f", color: {color}"
+
+        return members
+
+
+class BillboardCollection(_PrimitiveCollection):
+
+    """
+    BillboardCollection
+
+    Parameters
+    ----------
+
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    image: str or Pin
+        Image URL or Pin shared by all billboards
+    z: list or float, default 0
+        Heights
+    scale: list or float, default 1
+        Image scale
+    color: list, Color or array, optional
+        Color multiplied with the image
+    """
+
+    _collection = "BillboardCollection"
+
+    def __init__(self, x, y, image, z=None, scale=None, color=None) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=z,
+            color=color,
+            scale=scale if scale is not None else 1.0,
+        )
+
+        self._image = image
+
+    @property
+    def image(self) -> Any:
+        return self._image
+
+    def _generate_members(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        members: str = f"image: image, scale: {accessors['scale']}"
+
+        if color is not None:
+            members += f", color: {color}"
+
+        return members
+
+    def _extra_arguments(self) -> dict[str, str]:
+        return {"image": com.to_jsscalar(self._image)}
+
+
+class LabelCollection(_PrimitiveCollection):
+
+    """
+    LabelCollection
+
+    Parameters
+    ----------
+
+    text: list
+        List of labels
+    x: list
+        List of longitudes
+    y: list
+        List of latitudes
+    z: list or float, default 0
+        Heights
+    size: list or float, default 1
+        Text scale
+    color: list, Color or array, optional
+        Text color
+    """
+
+    _collection = "LabelCollection"
+
+    def __init__(self, text, x, y, z=None, size=None, color=None) -> None:
+
+        super().__init__(
+            x,
+            y,
+            z=z,
+            color=color,
+            scale=size if size is not None else 1.0,
+        )
+
+        self._text: list[str] = [
+            str(t) for t in _to_list(text, len(self), key="text")
+        ]
+
+    @property
+    def text(self) -> list[str]:
+        return self._text
+
+    def _generate_members(
+        self, accessors: dict[str, str], color: Optional[str]
+    ) -> str:
+
+        members: str = f"text: text[j], scale: {accessors['scale']}"
+
+        if color is not None:
+            members += f", fillColor: {color}"
+
+        return members
+
+    def _extra_arguments(self) -> dict[str, str]:
+        # escape "</" so that texts cannot close the enclosing script tag
+        return {"text": json.dumps(self._text).replace("</", "<\\/")}
+
+
+######################################################################################################################################################
+
+
+class PolylineCollection(_Batch):
+
+    """
+    PolylineCollection
+
+    Vertices of all polylines are converted to Cartesian3 (ECEF, in meters) and emitted as a single
+    packed array, sliced per polyline in JavaScript.
+
+    Parameters
+    ----------
+
+    positions: list
+        List of polylines, each of them being a flat list of longitude, latitude, a list of
+        (longitude, latitude) or (longitude, latitude, height) tuples, or a (M, 2) / (M, 3) array
+    width: list or float, default 1
+        Line width in pixels
+    color: list, Color or array, optional
+        Line color
+    """
+
+    # Constructor
+
+    def __init__(self, positions, width=None, color=None) -> None:
+
+        if not com.is_listlike(positions):
+            raise ValueError(f"positions must be list-likes: {positions}")
+
+        polylines: list[np.ndarray] = [
+            com.validate_array_lonlat(p, key="positions", width=2) for p in positions
+        ]
+
+        super().__init__(
+            len(polylines),
+            color=color,
+            width=width if width is not None else 1.0,
+        )
+
+        self._offsets: np.ndarray = np.zeros(len(polylines) + 1, dtype=np.float64)
+        np.cumsum([len(p) for p in polylines], out=self._offsets[1:])
+
+        self._positions: np.ndarray = (
+            np.concatenate([_with_heights(p) for p in polylines])
+            if polylines
+            else np.empty((0, 3), dtype=np.float64)
+        )
+
+    # Properties
+
+    @property
+    def positions(self) -> list[np.ndarray]:
+
+        """
+        Return polylines as a list of (M, 3) longitude, latitude, height arrays.
+        """
+
+        offsets: np.ndarray = self._offsets.astype(np.int64)
+
+        return [
+            self._positions[start:stop] for (start, stop) in zip(offsets, offsets[1:])
+        ]
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+
+        vertices: np.ndarray = geodetic_to_cartesian(
+            self._positions[:, 0], self._positions[:, 1], self._positions[:, 2]
+        )
+
+        (data, accessors, color, palette) = self._pack(widget)
+
+        members: str = f"width: {accessors['width']}"
+
+        if color is not None:
+            material = f'Cesium.Material.fromType("Color", {{color: {color}}})'
+            members += f", material: {material}"
+
+        script: str = (
+            "(function (vertices, offsets, data, colors) {{ "
+            "const collection = new Cesium.PolylineCollection(); "
+            "for (let j = 0; j < {length}; j++) {{ "
+            "const i = j * {width}; "
+            "collection.add({{positions: Cesium.Cartesian3.unpackArray(vertices.subarray(offsets[j] * 3, offsets[j + 1] * 3)), {members}}}); "
+            "}} "
+            "return collection; "
+            "}})({vertices}, {offsets}, {data}, {palette})"
+        )
+
+        return script.format(
+            length=len(self),
+            width=data.shape[1],
+            members=members,
+            vertices=com.to_jsfloat64array(vertices.ravel()),
+            offsets=com.to_jsfloat64array(self._offsets),
+            data=com.to_jsfloat64array(data.ravel()),
+            palette=palette,
+        )
+
+
+######################################################################################################################################################
+
+
+def _with_heights(positions: np.ndarray) -> np.ndarray:
+
+    """
+    Return (M, 3) longitude, latitude, height array, heights defaulting to 0.
+    """
+
+    if positions.shape[1] == 3:
+        return positions
+
+    return np.column_stack([positions, np.zeros(len(positions))])
+
+
+######################################################################################################################################################
@@ -8,15 +8,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Type, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Type, Optional
+
+import numpy as np
+import traitlets
 
 from cesiumpy.base import _CesiumEnum
 from cesiumpy.base import _CesiumObject
+from cesiumpy.math import geodetic_to_cartesian
+import cesiumpy.util.common as com
 from cesiumpy.util.name import generate_name
 
 ######################################################################################################################################################
 
+DEFAULT_CAPACITY: int = 16
+
+######################################################################################################################################################
+
 
 class ReferenceFrame(_CesiumEnum):
 
@@ -24,6 +33,13 @@ class ReferenceFrame(_CesiumEnum):
     INERTIAL = "Cesium.ReferenceFrame.INERTIAL"  # The inertial frame.
 
 
+class InterpolationAlgorithm(_CesiumEnum):
+
+    LINEAR = "Cesium.LinearApproximation"  # Linear interpolation between the enclosing samples.
+    LAGRANGE = "Cesium.LagrangePolynomialApproximation"  # Lagrange polynomial of degree.
+    HERMITE = "Cesium.HermitePolynomialApproximation"  # Hermite polynomial of degree.
+
+
 ######################################################################################################################################################
 
 
@@ -55,8 +71,242 @@ class Property(_CesiumObject):
 ######################################################################################################################################################
 
 
+class _SampleStore:
+
+    """
+    Columnar storage of property samples.
+
+    Times are stored as float64 second offsets from an epoch, values as a (N, k) float64 array,
+    where k is the packed length of the value type (3 for Cartesian3, 4 for Quaternion).
+
+    Values which cannot be represented numerically (deferred JavaScript expressions) make
+    the store fall back to keeping the value objects themselves.
+    """
+
+    # Constructor
+
+    def __init__(
+        self,
+        type: Type[_CesiumObject],
+    ) -> None:
+
+        self._type = type
+        self._length: Optional[int] = getattr(type, "_packed_length", None)
+
+        self._epoch: Optional[datetime] = None
+        self._size: int = 0
+        self._times: np.ndarray = np.empty(DEFAULT_CAPACITY, dtype=np.float64)
+        self._values: Optional[np.ndarray] = (
+            np.empty((DEFAULT_CAPACITY, self._length), dtype=np.float64)
+            if self._length is not None
+            else None
+        )
+        self._degrees: Optional[bool] = None
+
+        self._objects: Optional[list[Any]] = None if self._length is not None else []
+        self._derivatives: dict[int, list[Any]] = {}
+
+    # Properties
+
+    @property
+    def epoch(self) -> Optional[datetime]:
+        return self._epoch
+
+    @property
+    def is_columnar(self) -> bool:
+        return self._objects is None
+
+    @property
+    def degrees(self) -> bool:
+        return bool(self._degrees)
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[: self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        if not self.is_columnar:
+            raise ValueError("samples are not stored as numeric values")
+        return self._values[: self._size]
+
+    # Methods
+
+    def __len__(self) -> int:
+        return self._size
+
+    def time_at(self, index: int) -> datetime:
+        return self._epoch + timedelta(seconds=float(self._times[index]))
+
+    def value_at(self, index: int) -> Any:
+        if self._objects is not None:
+            return self._objects[index]
+        return self._type._unpack(self._values[index].tolist(), degrees=self.degrees)
+
+    def derivatives_at(self, index: int) -> Optional[list[Any]]:
+        return self._derivatives.get(index)
+
+    def append(
+        self,
+        time: datetime,
+        value: Any,
+        derivatives: Optional[list[Any]] = None,
+    ) -> None:
+
+        time = _to_utc(time)
+
+        if self._epoch is None:
+            self._epoch = time
+
+        self._reserve(self._size + 1)
+
+        if self.is_columnar and not self._is_packable(value):
+            self._to_objects()
+
+        self._times[self._size] = (time - self._epoch).total_seconds()
+
+        if self._objects is not None:
+            self._objects.append(value)
+        else:
+            self._values[self._size] = value._pack()
+
+        if derivatives is not None:
+            self._derivatives[self._size] = derivatives
+
+        self._size += 1
+
+    def extend(
+        self,
+        epoch: datetime,
+        offsets: np.ndarray,
+        values: np.ndarray,
+        degrees: bool = False,
+    ) -> None:
+
+        if self._length is None:
+            raise ValueError(
+                f"{self._type.__name__} samples cannot be added from numeric arrays"
+            )
+
+        if values.shape != (len(offsets), self._length):
+            raise ValueError(
+                f"values must be of shape ({len(offsets)}, {self._length}): {values.shape}"
+            )
+
+        epoch = _to_utc(epoch)
+
+        if self._epoch is None:
+            self._epoch = epoch
+
+        if self._degrees is None:
+            self._degrees = degrees
+
+        if self.is_columnar and (self._degrees != degrees):
+            self._to_objects()
+
+        size: int = self._size + len(offsets)
+
+        self._reserve(size)
+
+        self._times[self._size : size] = offsets + (epoch - self._epoch).total_seconds()
+
+        if self._objects is not None:
+            self._objects.extend(
+                self._type._unpack(row, degrees=degrees) for row in values.tolist()
+            )
+        else:
+            self._values[self._size : size] = values
+
+        self._size = size
+
+    def __iter__(self) -> Iterator[tuple[datetime, Any, Optional[list[Any]]]]:
+        for index in range(self._size):
+            yield (
+                self.time_at(index),
+                self.value_at(index),
+                self.derivatives_at(index),
+            )
+
+    def select(self, indices: np.ndarray) -> None:
+
+        """
+        Keep the samples at indices only, in that order.
+        """
+
+        indices = np.asarray(indices, dtype=np.intp)
+
+        size: int = len(indices)
+        capacity: int = max(size, DEFAULT_CAPACITY)
+
+        times: np.ndarray = np.empty(capacity, dtype=np.float64)
+        times[:size] = self.times[indices]
+        self._times = times
+
+        if self._objects is not None:
+            self._objects = [self._objects[index] for index in indices.tolist()]
+        else:
+            values: np.ndarray = np.empty((capacity, self._length), dtype=np.float64)
+            values[:size] = self.values[indices]
+            self._values = values
+
+        self._derivatives = {
+            new: self._derivatives[old]
+            for (new, old) in enumerate(indices.tolist())
+            if old in self._derivatives
+        }
+
+        self._size = size
+
+    # Private methods
+
+    def _is_packable(self, value: Any) -> bool:
+
+        if getattr(type(value), "_packed_length", None) != self._length:
+            return False
+
+        degrees: bool = bool(getattr(value, "_is_degrees", False))
+
+        if self._degrees is None:
+            self._degrees = degrees
+
+        return self._degrees == degrees
+
+    def _reserve(self, size: int) -> None:
+
+        capacity: int = len(self._times)
+
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        self._times = np.resize(self._times, capacity)
+
+        if self._values is not None:
+            self._values = np.resize(self._values, (capacity, self._length))
+
+    def _to_objects(self) -> None:
+
+        self._objects = [self.value_at(index) for index in range(self._size)]
+        self._values = None
+
+
+######################################################################################################################################################
+
+
 class SampledProperty(Property):
 
+    # Definitions
+
+    # The algorithm used to interpolate between samples, Cesium.LinearApproximation by default.
+    interpolation_algorithm = traitlets.Instance(
+        klass=InterpolationAlgorithm, allow_none=True
+    )
+
+    # The degree of the interpolation polynomial, 1 by default.
+    interpolation_degree = traitlets.Int(allow_none=True)
+
     # Constructor
 
     def __init__(
@@ -65,8 +315,20 @@ class SampledProperty(Property):
         name: Optional[str] = None,
         samples: Optional[list[tuple[datetime, Any, Optional[list[Any]]]]] = None,
         derivative_types=None,  # TBI
+        packed: bool = True,
+        interpolation_algorithm: Optional[InterpolationAlgorithm] = None,
+        interpolation_degree: Optional[int] = None,
     ) -> None:
 
+        """
+        type: The type of property.
+        name: Name of the JavaScript variable holding the property.
+        samples: List of (time, value, derivatives) tuples.
+        packed: If True, samples are added with a single addSamplesPackedArray call instead of one addSample call per sample.
+        interpolation_algorithm: The algorithm used to interpolate between samples.
+        interpolation_degree: The degree of the interpolation polynomial.
+        """
+
         assert derivative_types is None, NotImplementedError  # TBI
 
         super().__init__(
@@ -74,17 +336,57 @@ class SampledProperty(Property):
         )
 
         self._type = type
-        self._samples: list[tuple[datetime, Any, Optional[list[Any]]]] = samples or []
+        self._store: _SampleStore = _SampleStore(type)
         self._derivative_types = derivative_types
+        self._packed: bool = packed
+        self._scripts_cache: Optional[tuple[tuple[str, int], list[str]]] = None
+
+        self.interpolation_algorithm = interpolation_algorithm
+        self.interpolation_degree = interpolation_degree
+
+        for (time, value, derivatives) in samples or []:
+            self.add_sample(time, value, derivatives)
 
     # Properties
 
     @property
     def samples(self) -> list[tuple[datetime, Any, Optional[list[Any]]]]:
-        return self._samples
+
+        """
+        Return samples as a list of (time, value, derivatives) tuples.
+
+        Value objects are built on access, prefer times / values for large properties.
+        """
+
+        return list(self._store)
+
+    @property
+    def epoch(self) -> Optional[datetime]:
+        return self._store.epoch
+
+    @property
+    def times(self) -> np.ndarray:
+
+        """
+        Return sample times as float64 second offsets from epoch.
+        """
+
+        return self._store.times
+
+    @property
+    def values(self) -> np.ndarray:
+
+        """
+        Return sample values as a (N, k) float64 array.
+        """
+
+        return self._store.values
 
     # Methods
 
+    def __len__(self) -> int:
+        return len(self._store)
+
     def add_sample(
         self,
         time: datetime,
@@ -92,7 +394,101 @@ class SampledProperty(Property):
         derivatives: Optional[list[Any]] = None,
     ) -> None:
 
-        self._samples.append((time, value, derivatives))
+        self._store.append(time, value, derivatives)
+        self._invalidate_script()
+
+    def add_samples(
+        self,
+        times,
+        values,
+        epoch: Optional[datetime] = None,
+        degrees: bool = False,
+    ) -> None:
+
+        """
+        Add samples from arrays, without building per-sample objects.
+
+        times: datetimes, numpy datetime64 array, or float second offsets from epoch when epoch is provided.
+        values: (N, k) array of packed values, e.g. (x, y, z) for Cartesian3 or (x, y, z, w) for Quaternion.
+        epoch: Reference time of float offsets.
+        degrees: Whether Cartesian3 values are (longitude, latitude, height) in degrees.
+        """
+
+        (epoch, offsets) = _to_offsets(times, epoch)
+
+        values = np.asarray(values, dtype=np.float64)
+
+        if len(offsets) == 0:
+            return
+
+        self._store.extend(epoch, offsets, values, degrees=degrees)
+        self._invalidate_script()
+
+    def set_interpolation_options(
+        self,
+        interpolation_algorithm: Optional[InterpolationAlgorithm] = None,
+        interpolation_degree: Optional[int] = None,
+    ) -> None:
+
+        if interpolation_algorithm is not None:
+            self.interpolation_algorithm = interpolation_algorithm
+
+        if interpolation_degree is not None:
+            self.interpolation_degree = interpolation_degree
+
+    def get_value(self, time: datetime) -> Any:
+
+        """
+        Return the value at time, interpolated as Cesium would, None outside of the samples.
+
+        Cartesian3 samples given in degrees are interpolated, and returned, in the fixed frame.
+        """
+
+        values: np.ndarray = self.get_values([time])
+
+        if np.isnan(values[0]).any():
+            return None
+
+        return self._type._unpack(values[0].tolist())
+
+    def get_values(
+        self,
+        times,
+        epoch: Optional[datetime] = None,
+    ) -> np.ndarray:
+
+        """
+        Return values at times as a (N, k) array of packed values, interpolated as Cesium would.
+
+        Times are located among the samples by binary search, and values are interpolated
+        over a window of interpolation_degree + 1 samples around them.
+        Rows of times outside of the samples are NaN.
+
+        times: datetimes, numpy datetime64 array, or float second offsets from epoch when epoch is provided.
+        epoch: Reference time of float offsets.
+        """
+
+        (query_epoch, offsets) = _to_offsets(times, epoch)
+
+        values: np.ndarray = self._store.values
+
+        if self._store.degrees:
+            values = geodetic_to_cartesian(values[:, 0], values[:, 1], values[:, 2])
+
+        if len(offsets) == 0 or len(values) == 0:
+            return np.full((len(offsets), values.shape[1]), np.nan)
+
+        offsets = offsets + (query_epoch - self._store.epoch).total_seconds()
+
+        sample_times: np.ndarray = self._store.times
+
+        if np.any(np.diff(sample_times) < 0.0):
+            order: np.ndarray = np.argsort(sample_times, kind="stable")
+            (sample_times, values) = (sample_times[order], values[order])
+
+        return _interpolate(
+            sample_times, values, offsets, self._interpolation_degree(), self._type
+        )
 
     def generate_script(self, widget=None):
 
@@ -100,6 +496,24 @@ class SampledProperty(Property):
 
         assert widget is not None
 
+        widget.reference_property(self)
+
+        if widget.has_property(self.name):
+            return f"{widget._varname}.{self.name}"
+
+        key: tuple[str, int] = (widget._varname, self._script_version)
+
+        # streaming writes neither reuse nor keep the scripts
+        cache: bool = widget._cache_scripts
+
+        if (
+            cache
+            and (self._scripts_cache is not None)
+            and (self._scripts_cache[0] == key)
+        ):
+            widget.register_property(self.name, self._scripts_cache[1])
+            return f"{widget._varname}.{self.name}"
+
         property_scripts: list[str] = []
 
         property_scripts.append(
@@ -110,7 +524,98 @@ class SampledProperty(Property):
             )
         )
 
-        for (time, value, _) in self._samples:
+        property_scripts.extend(self._generate_interpolation_scripts(widget=widget))
+
+        if self._packed and self._store.is_columnar:
+            property_scripts.extend(self._generate_packed_scripts(widget=widget))
+        else:
+            property_scripts.extend(self._generate_sample_scripts(widget=widget))
+
+        widget.register_property(self.name, property_scripts)
+
+        if cache:
+            self._scripts_cache = (key, property_scripts)
+        elif (self._scripts_cache is not None) and (self._scripts_cache[0] != key):
+            # stale, released instead of being replaced
+            self._scripts_cache = None
+
+        return f"{widget._varname}.{self.name}"
+
+    # Private methods
+
+    @traitlets.observe("interpolation_algorithm", "interpolation_degree")
+    def _observe_interpolation(self, change) -> None:
+
+        """
+        Mark the cached scripts as stale, even if no holder watches this property.
+        """
+
+        self._invalidate_script()
+
+    def _interpolation_degree(self) -> int:
+
+        if self.interpolation_algorithm in (None, InterpolationAlgorithm.LINEAR):
+            return 1
+
+        return self.interpolation_degree or 1
+
+    def _generate_interpolation_scripts(self, widget) -> list[str]:
+
+        options: list[str] = []
+
+        if self.interpolation_algorithm is not None:
+            options.append(
+                f"interpolationAlgorithm: {self.interpolation_algorithm.generate_script()}"
+            )
+
+        if self.interpolation_degree is not None:
+            options.append(f"interpolationDegree: {self.interpolation_degree}")
+
+        if not options:
+            return []
+
+        return [
+            "{widget}.{name}.setInterpolationOptions({{{options}}});".format(
+                widget=widget._varname,
+                name=self.name,
+                options=", ".join(options),
+            )
+        ]
+
+    def _generate_packed_scripts(self, widget) -> list[str]:
+
+        """
+        Return a single addSamplesPackedArray call, times being offsets from epoch.
+        """
+
+        if len(self._store) == 0:
+            return []
+
+        values: np.ndarray = self._store.values
+
+        if self._store.degrees:
+            values = geodetic_to_cartesian(values[:, 0], values[:, 1], values[:, 2])
+
+        packed_samples: np.ndarray = np.column_stack([self._store.times, values])
+
+        return [
+            "{widget}.{name}.addSamplesPackedArray({samples}, {epoch});".format(
+                widget=widget._varname,
+                name=self.name,
+                samples=com.to_jsfloat64array(packed_samples.ravel()),
+                epoch=com.to_jsscalar(self._store.epoch),
+            )
+        ]
+
+    def _generate_sample_scripts(self, widget) -> list[str]:
+
+        """
+        Return one addSample call per sample.
+        """
+
+        sample_scripts: list[str] = []
+
+        for (time, value, _) in self._store:
 
             pre_script: str = "{widget}.{name}.addSample({time}, {value});".format(
                 widget=widget._varname,
@@ -119,11 +624,113 @@ class SampledProperty(Property):
                 value=value.generate_script(widget=widget),
             )
 
-            property_scripts.append(pre_script)
+            sample_scripts.append(pre_script)
 
-        widget.register_property(self.name, property_scripts)
+        return sample_scripts
 
-        return f"{widget._varname}.{self.name}"
+
+######################################################################################################################################################
+
+
+def _interpolate(
+    times: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    degree: int,
+    type: Type[_CesiumObject],
+) -> np.ndarray:
+
+    """
+    Interpolate sorted samples at offsets, following Cesium.SampledProperty.getValue.
+
+    Each offset is interpolated over a window of degree + 1 samples, starting (degree // 2) + 1
+    samples before its insertion index and shifted to fit in the samples. Without derivatives,
+    Lagrange and Hermite polynomials through the window are the same polynomial.
+    """
+
+    size: int = len(times)
+    points: int = min(degree + 1, size)
+
+    index: np.ndarray = np.searchsorted(times, offsets, side="left")
+
+    first: np.ndarray = np.clip(index - (degree // 2) - 1, 0, size - points)
+    windows: np.ndarray = first[:, np.newaxis] + np.arange(points)
+
+    # times relative to the last sample of the window
+    last: np.ndarray = times[windows[:, -1]]
+    x_table: np.ndarray = times[windows] - last[:, np.newaxis]
+    x: np.ndarray = offsets - last
+
+    y_windows: np.ndarray = values[windows]
+
+    to_interpolation = getattr(type, "_to_interpolation", None)
+
+    y_table: np.ndarray = (
+        to_interpolation(y_windows) if to_interpolation is not None else y_windows
+    )
+
+    # Lagrange basis polynomials at x
+    weights: np.ndarray = np.ones((len(offsets), points))
+
+    for j in range(points):
+        for i in range(points):
+            if i != j:
+                weights[:, j] *= (x - x_table[:, i]) / (x_table[:, j] - x_table[:, i])
+
+    results: np.ndarray = np.einsum("np,npk->nk", weights, y_table)
+
+    if to_interpolation is not None:
+        results = type._from_interpolation(results, y_windows)
+
+    exact: np.ndarray = (index < size) & (times[np.minimum(index, size - 1)] == offsets)
+    results[exact] = values[index[exact]]
+
+    results[(offsets < times[0]) | (offsets > times[-1])] = np.nan
+
+    return results
+
+
+def _to_offsets(times, epoch: Optional[datetime]) -> tuple[datetime, np.ndarray]:
+
+    """
+    Convert times to float64 second offsets from epoch, returned in UTC.
+    """
+
+    if epoch is not None:
+        return (_to_utc(epoch), np.asarray(times, dtype=np.float64))
+
+    times = np.asarray(times)
+
+    if len(times) == 0:
+        return (epoch, np.empty(0, dtype=np.float64))
+
+    if np.issubdtype(times.dtype, np.datetime64):
+        # numpy datetimes are naive, and regarded as UTC
+        times = times.astype("datetime64[us]")
+        epoch = times[0].item().replace(tzinfo=timezone.utc)
+        return (epoch, (times - times[0]) / np.timedelta64(1, "s"))
+
+    epoch = _to_utc(times[0])
+
+    return (
+        epoch,
+        np.fromiter(
+            ((_to_utc(time) - epoch).total_seconds() for time in times),
+            dtype=np.float64,
+            count=len(times),
+        ),
+    )
+
+def _to_utc(time: datetime) -> datetime:
+
+    """
+    Return time as an aware datetime, naive ones being regarded as UTC as numpy datetimes are.
+    """
+
+    if time.tzinfo is None:
+        return time.replace(tzinfo=timezone.utc)
+
+    return time
 
 
 ######################################################################################################################################################
@@ -31,14 +31,22 @@ class Satellite:
         model: Optional[cesiumpy.IonResource] = None,
         sensors: Optional[list["cesiumpy.Sensor"]] = None,
         name: Optional[str] = None,
+        decimation_tolerance_m: Optional[float] = None,
     ) -> None:
 
+        """
+        decimation_tolerance_m: If provided, position samples which the interpolated track reproduces
+            within this distance, in meters, are dropped before the first render.
+        """
+
         self._name: str = name or generate_name()
         self._position: cesiumpy.SampledPositionProperty = position
         self._orientation: Optional[cesiumpy.SampledProperty] = orientation
         self._availability: Optional[cesiumpy.TimeIntervalCollection] = availability
         self._model: Optional[cesiumpy.IonResource] = model
         self._sensors: list["cesiumpy.Sensor"] = sensors or []
+        self._decimation_tolerance_m: Optional[float] = decimation_tolerance_m
+        self._decimation: Optional["cesiumpy.position.Decimation"] = None
 
     # Properties
 
@@ -66,6 +74,19 @@ class Satellite:
     def sensors(self) -> list["cesiumpy.Sensor"]:
         return self._sensors
 
+    @property
+    def decimation_tolerance_m(self) -> Optional[float]:
+        return self._decimation_tolerance_m
+
+    @property
+    def decimation(self) -> Optional["cesiumpy.position.Decimation"]:
+
+        """
+        Return the report of the position decimation, once rendered.
+        """
+
+        return self._decimation
+
     # Methods
 
     def add_sensor(self, sensor: "cesiumpy.Sensor") -> None:
@@ -73,6 +94,12 @@ class Satellite:
 
     def render(self, viewer: cesiumpy.Viewer) -> None:
 
+        # decimate once, so that rendering again does not decimate the decimated track
+        if (self.decimation_tolerance_m is not None) and (self._decimation is None):
+            self._decimation = self.position.decimate(
+                tolerance_m=self.decimation_tolerance_m,
+            )
+
         # Add orbital track
         # viewer.entities.add(
         #     cesiumpy.Polyline(
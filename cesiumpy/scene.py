@@ -7,6 +7,7 @@ import traitlets
 
 import cesiumpy
 from cesiumpy.base import _CesiumObject, _CesiumBase, RestrictedList
+from cesiumpy.primitives import _PrimitiveCollection, PolylineCollection
 
 
 class Scene(_CesiumObject):
@@ -16,7 +17,9 @@ class Scene(_CesiumObject):
     def __init__(self, widget):
         self.widget = widget
         self._primitives = RestrictedList(
-            self.widget, allowed=cesiumpy.Model, propertyname="scene.primitives"
+            self.widget,
+            allowed=(cesiumpy.Model, _PrimitiveCollection, PolylineCollection),
+            propertyname="scene.primitives",
         )
 
     @property
@@ -25,3 +28,6 @@ class Scene(_CesiumObject):
 
     def generate_script(self, widget=None):
         return self._primitives.generate_script(widget=widget)
+
+    def iter_scripts(self, widget=None, cache=True):
+        return self._primitives.iter_scripts(widget=widget, cache=cache)
@@ -10,7 +10,12 @@ import abc
 import math
 from typing import Optional
 
+import numpy as np
+
 import cesiumpy
+import cesiumpy.entities.color  # noqa
+from cesiumpy.math import geodetic_to_cartesian
+from cesiumpy.orientation import axis_angle_to_packed, multiply_packed, rotate_packed
 from cesiumpy.util.name import generate_name
 
 ######################################################################################################################################################
@@ -41,6 +46,7 @@ class Sensor(abc.ABC):
         intersection_color: Optional[cesiumpy.color.Color] = None,
         name: Optional[str] = None,
         show: Optional[bool] = None,
+        offset: Optional[cesiumpy.Cartesian3] = None,
     ) -> None:
 
         self._direction: cesiumpy.Cartesian3 = direction
@@ -55,6 +61,7 @@ class Sensor(abc.ABC):
 
         self._name: str = name or generate_name()
         self._show: bool = show if (show is not None) else True
+        self._offset: Optional[cesiumpy.Cartesian3] = offset
 
     # Properties
 
@@ -82,37 +89,126 @@ class Sensor(abc.ABC):
     def show(self) -> bool:
         return self._show
 
+    @property
+    def offset(self) -> Optional[cesiumpy.Cartesian3]:
+
+        """
+        Return the position of the sensor in the satellite body frame, in meters.
+        """
+
+        return self._offset
+
     # Methods
 
-    @abc.abstractmethod
     def render(
         self,
         viewer: cesiumpy.Viewer,
         satellite: cesiumpy.Satellite,
     ) -> None:
 
-        raise NotImplementedError
+        viewer.entities.add(
+            self._to_entity(
+                position=self._generate_position(satellite),
+                orientation=self._generate_orientation(satellite),
+                availability=satellite.availability,
+            )
+        )
 
     # Private methods
 
+    @abc.abstractmethod
+    def _to_entity(
+        self,
+        position,
+        orientation,
+        availability: Optional[cesiumpy.TimeIntervalCollection],
+    ):
+
+        """
+        Return the entity drawing the sensor, at the given position and orientation.
+        """
+
+        raise NotImplementedError
+
+    def _mount_quaternion(self) -> Optional[np.ndarray]:
+
+        """
+        Return the packed (x, y, z, w) rotation from the sensor frame to the body frame,
+        None if the sensor points along the body z axis.
+        """
+
+        direction: np.ndarray = np.array(
+            [self.direction.x, self.direction.y, self.direction.z], dtype=np.float64
+        )
+        direction /= np.linalg.norm(direction)
+
+        cos_angle: float = float(np.clip(direction[2], -1.0, 1.0))
+
+        if cos_angle == 1.0:
+            return None
+
+        if cos_angle == -1.0:
+            return axis_angle_to_packed((1.0, 0.0, 0.0), math.pi)
+
+        # z x direction
+        axis: np.ndarray = np.array([-direction[1], direction[0], 0.0])
+
+        return axis_angle_to_packed(axis / np.linalg.norm(axis), math.acos(cos_angle))
+
     def _generate_position(
         self,
         satellite: cesiumpy.Satellite,
     ) -> cesiumpy.SampledPositionProperty:
 
-        sampled_position = cesiumpy.SampledPositionProperty(
-            name=f"{self.name}_position",
-        )
+        """
+        Return the position property of the sensor.
+
+        Without offset, this is the position property of the satellite itself, so that the
+        track is defined once in the viewer for the satellite and all its sensors.
+        """
+
+        position: cesiumpy.SampledPositionProperty = satellite.position
 
-        for (time, lla_B, _) in satellite.position.samples:
+        if self.offset is None:
+            return position
 
-            lla_S = lla_B  # TBI
+        if satellite.orientation is None:
+            raise ValueError("Sensor offset requires satellite orientation samples")
 
-            sampled_position.add_sample(
-                time=time,
-                position=lla_S,
+        # attitudes at the position sample times
+        orientations: np.ndarray = satellite.orientation.get_values(
+            position.times, epoch=position.epoch
+        )
+
+        if np.isnan(orientations).any():
+            raise ValueError(
+                "Sensor offset requires satellite orientation samples "
+                "over the position sample times"
             )
 
+        values: np.ndarray = position.values
+
+        if position._store.degrees:
+            values = geodetic_to_cartesian(values[:, 0], values[:, 1], values[:, 2])
+
+        # r_S_ECEF = r_B_ECEF + q_B_ECEF * r_S_B
+        values = values + rotate_packed(
+            orientations,
+            [self.offset.x, self.offset.y, self.offset.z],
+        )
+
+        sampled_position = cesiumpy.SampledPositionProperty(
+            name=f"{self.name}_position",
+            reference_frame=position.reference_frame,
+            interpolation_algorithm=position.interpolation_algorithm,
+            interpolation_degree=position.interpolation_degree,
+        )
+        sampled_position.add_samples(
+            times=position.times,
+            positions=values,
+            epoch=position.epoch,
+        )
+
         return sampled_position
 
     def _generate_orientation(
@@ -125,38 +221,21 @@ class Sensor(abc.ABC):
             name=f"{self.name}_orientation",
         )
 
-        x_direction: cesiumpy.Cartesian3 = cesiumpy.Cartesian3(0.0, 0.0, 1.0)
-
-        q_S_B: Optional[cesiumpy.Quaternion] = None
-
-        if self.direction.dot(x_direction) != 1.0:
-
-            if self.direction.dot(x_direction) != -1.0:
-
-                q_S_B = cesiumpy.Quaternion.from_axis_angle(
-                    axis=x_direction.cross(self.direction).normalized(),
-                    angle=self.direction.angle_with(x_direction),
-                )
-
-            else:
+        q_S_B: Optional[np.ndarray] = self._mount_quaternion()
 
-                q_S_B = cesiumpy.Quaternion.from_axis_angle(
-                    axis=cesiumpy.Cartesian3(1.0, 0.0, 0.0),
-                    angle=cesiumpy.math.to_radians(180.0),
-                )
+        orientation: cesiumpy.SampledProperty = satellite.orientation
 
-        for (time, q_B_ECEF, _) in satellite.orientation.samples:
+        # q_S_ECEF = q_B_ECEF * q_S_B, for all samples at once
+        values: np.ndarray = orientation.values
 
-            if q_S_B is not None:
-                q_S_ECEF = q_S_B * q_B_ECEF
+        if q_S_B is not None:
+            values = multiply_packed(values, q_S_B)
 
-            else:
-                q_S_ECEF = q_B_ECEF
-
-            sampled_orientation.add_sample(
-                time=time,
-                value=q_S_ECEF,
-            )
+        sampled_orientation.add_samples(
+            times=orientation.times,
+            values=values,
+            epoch=orientation.epoch,
+        )
 
         return sampled_orientation
 
@@ -182,6 +261,7 @@ class CustomPatternSensor(Sensor):
         intersection_color: Optional[cesiumpy.color.Color] = None,
         name: Optional[str] = None,
         show: Optional[bool] = None,
+        offset: Optional[cesiumpy.Cartesian3] = None,
     ) -> None:
 
         super().__init__(
@@ -191,6 +271,7 @@ class CustomPatternSensor(Sensor):
             intersection_color=intersection_color,
             name=name,
             show=show,
+            offset=offset,
         )
 
         self._radius: float = radius
@@ -206,31 +287,30 @@ class CustomPatternSensor(Sensor):
     def directions(self) -> list[cesiumpy.Spherical]:
         return self._directions
 
-    # Methods
+    # Private methods
 
-    def render(
+    def _to_entity(
         self,
-        viewer: cesiumpy.Viewer,
-        satellite: cesiumpy.Satellite,
-    ) -> None:
+        position,
+        orientation,
+        availability: Optional[cesiumpy.TimeIntervalCollection],
+    ):
 
         from cesiumpy.entities.sensors.custom_pattern_sensor import (
             CustomPatternSensor as CustomPatternSensorEntity,
         )
 
-        viewer.entities.add(
-            CustomPatternSensorEntity(
-                position=self._generate_position(satellite),
-                orientation=self._generate_orientation(satellite),
-                availability=satellite.availability,
-                radius=self.radius,
-                directions=self.directions,
-                lateral_surface_material=self.material,
-                show_intersection=self.show_intersection,
-                intersection_color=self.intersection_color,
-                intersection_width=1,
-                show=self.show,
-            )
+        return CustomPatternSensorEntity(
+            position=position,
+            orientation=orientation,
+            availability=availability,
+            radius=self.radius,
+            directions=self.directions,
+            lateral_surface_material=self.material,
+            show_intersection=self.show_intersection,
+            intersection_color=self.intersection_color,
+            intersection_width=1,
+            show=self.show,
         )
 
 
@@ -256,6 +336,7 @@ class RectangularSensor(CustomPatternSensor):
         show_intersection: Optional[bool] = None,
         intersection_color: Optional[cesiumpy.color.Color] = None,
         show: Optional[bool] = None,
+        offset: Optional[cesiumpy.Cartesian3] = None,
     ) -> None:
 
         super().__init__(
@@ -269,6 +350,7 @@ class RectangularSensor(CustomPatternSensor):
             intersection_color=intersection_color,
             name=name,
             show=show,
+            offset=offset,
         )
 
         self._x_half_angle: float = x_half_angle
@@ -328,6 +410,7 @@ class CylindricalSensor(Sensor):
         show_intersection: Optional[bool] = None,
         intersection_color: Optional[cesiumpy.color.Color] = None,
         show: Optional[bool] = None,
+        offset: Optional[cesiumpy.Cartesian3] = None,
     ) -> None:
 
         super().__init__(
@@ -337,6 +420,7 @@ class CylindricalSensor(Sensor):
             intersection_color=intersection_color,
             name=name,
             show=show,
+            offset=offset,
         )
 
         self._top_radius: int = top_radius
@@ -362,25 +446,24 @@ class CylindricalSensor(Sensor):
     def slices(self) -> int:
         return self._slices
 
-    # Methods
+    # Private methods
 
-    def render(
+    def _to_entity(
         self,
-        viewer: cesiumpy.Viewer,
-        satellite: cesiumpy.Satellite,
-    ) -> None:
-
-        viewer.entities.add(
-            cesiumpy.Cylinder(
-                position=self._generate_position(satellite),
-                orientation=self._generate_orientation(satellite),
-                availability=satellite.availability,
-                length=self.length,
-                top_radius=self.top_radius,
-                bottom_radius=self.bottom_radius,
-                slices=self.slices,
-                material=self.material,
-            )
+        position,
+        orientation,
+        availability: Optional[cesiumpy.TimeIntervalCollection],
+    ):
+
+        return cesiumpy.Cylinder(
+            position=position,
+            orientation=orientation,
+            availability=availability,
+            length=self.length,
+            top_radius=self.top_radius,
+            bottom_radius=self.bottom_radius,
+            slices=self.slices,
+            material=self.material,
         )
 
 
@@ -406,6 +489,7 @@ class ConicSensor(CylindricalSensor):
         show_intersection: Optional[bool] = None,
         intersection_color: Optional[cesiumpy.color.Color] = None,
         show: Optional[bool] = None,
+        offset: Optional[cesiumpy.Cartesian3] = None,
     ) -> None:
 
         length = length or DEFAULT_LENGTH
@@ -421,6 +505,7 @@ class ConicSensor(CylindricalSensor):
             show_intersection=show_intersection,
             intersection_color=intersection_color,
             show=show,
+            offset=offset,
         )
 
         self._half_angle: float = half_angle
@@ -431,32 +516,31 @@ class ConicSensor(CylindricalSensor):
     def half_angle(self) -> float:
         return self._half_angle
 
-    # Methods
+    # Private methods
 
-    def render(
+    def _to_entity(
         self,
-        viewer: cesiumpy.Viewer,
-        satellite: cesiumpy.Satellite,
-    ) -> None:
+        position,
+        orientation,
+        availability: Optional[cesiumpy.TimeIntervalCollection],
+    ):
 
         from cesiumpy.entities.sensors.conic_sensor import (
             ConicSensor as ConicSensorEntity,
         )
 
-        viewer.entities.add(
-            ConicSensorEntity(
-                position=self._generate_position(satellite),
-                orientation=self._generate_orientation(satellite),
-                availability=satellite.availability,
-                radius=self.length,
-                inner_half_angle=self.half_angle,
-                outer_half_angle=self.half_angle,
-                lateral_surface_material=self.material,
-                show_intersection=self.show_intersection,
-                intersection_color=self.intersection_color,
-                intersection_width=1,
-                show=self.show,
-            )
+        return ConicSensorEntity(
+            position=position,
+            orientation=orientation,
+            availability=availability,
+            radius=self.length,
+            inner_half_angle=self.half_angle,
+            outer_half_angle=self.half_angle,
+            lateral_surface_material=self.material,
+            show_intersection=self.show_intersection,
+            intersection_color=self.intersection_color,
+            intersection_width=1,
+            show=self.show,
         )
 
 
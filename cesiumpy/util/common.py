@@ -3,7 +3,7 @@
 
 from __future__ import unicode_literals
 
-import collections
+import base64
 import importlib
 import itertools
 import six
@@ -118,6 +118,48 @@ def validate_listlike_lonlatalt(x, key):
     return x
 
 
+def validate_array_lonlat(x, key, width=2):
+    """
+    validate whether x consists from lon, lat (and alt) rows, and return it
+    as (N, 2) or (N, 3) float64 ndarray
+
+    flat list-likes are regarded as rows of width elements. float64 ndarray
+    is not copied.
+    """
+    if not is_listlike(x):
+        raise ValueError("{key} must be list-likes: {x}".format(key=key, x=x))
+
+    msg = "{key} must be a list consists from longitude and latitude: {x}"
+
+    try:
+        values = _to_float64_array(x)
+    except ValueError:
+        if not all(is_listlike(e) for e in x):
+            raise ValueError(msg.format(key=key, x=x))
+        # ragged list of list-likes, validate its flattened length
+        x = _flatten_list_of_listlike(x)
+        values = _to_float64_array(x, msg=msg.format(key=key, x=x))
+
+    if values.ndim == 1:
+        if len(values) % width != 0:
+            length = "an even number" if width == 2 else f"a multiple of {width}"
+            raise ValueError(
+                "{key} length must be {length}: {x}".format(key=key, length=length, x=x)
+            )
+        values = values.reshape(-1, width)
+
+    if values.ndim != 2 or values.shape[1] not in (2, 3):
+        raise ValueError(msg.format(key=key, x=x))
+
+    # NaN fails both comparisons
+    if not (
+        (np.abs(values[:, 0]) <= 180).all() and (np.abs(values[:, 1]) <= 90).all()
+    ):
+        raise ValueError(msg.format(key=key, x=x))
+
+    return values
+
+
 # --------------------------------------------------
 # Check Functions
 # --------------------------------------------------
@@ -182,48 +224,86 @@ def is_listlike_3elem(x):
 def to_jsscalar(x, widget=None):
     """convert x to JavaScript representation"""
 
-    from cesiumpy.base import _CesiumObject, _CesiumEnum
+    klass = type(x)
 
-    if isinstance(x, (_CesiumObject, _CesiumEnum)):
-        return x.generate_script(widget=widget)
+    # converters are resolved once per type, instead of an isinstance chain per value
+    converter = _JSSCALAR_CONVERTERS.get(klass)
+    if converter is None:
+        converter = _JSSCALAR_CONVERTERS[klass] = _get_jsscalar_converter(klass)
 
-    if isinstance(x, bool):
-        # convert to JavaScript repr
-        x = "true" if x else "false"
-    elif isinstance(x, six.string_types):
-        x = f'"{x}"'
-    elif isinstance(x, datetime.datetime):
-        x = f'Cesium.JulianDate.fromIso8601("{x.isoformat()}")'
-    elif isinstance(x, dict):
-        x = "".join(to_jsobject(x, widget=widget))
-    elif isinstance(x, list):
-        x = [str(to_jsscalar(e, widget=widget)) for e in x]
-        x = "[{0}]".format(", ".join(x))
-    return x
+    return converter(x, widget)
 
 
 def to_jsobject(x, widget=None):
     """convert x to JavaScript Object"""
 
-    results = ["{"]
+    # filter None, keeping property order
+    items = [
+        f"{_to_jskey(key)}: {to_jsscalar(val, widget=widget)}"
+        for key, val in x.items()
+        if val is not None
+    ]
 
-    # filter None
-    dic = collections.OrderedDict()
-    # do not use dict comprehension to keep property order
-    for k, v in six.iteritems(x):
-        if v is not None:
-            dic[k] = v
-    x = dic
-    if len(x) == 0:
+    if len(items) == 0:
         return [""]
 
-    for key, val in six.iteritems(x):
-        results.append(
-            f"{case.snake_case_to_camel_case(key)}: {to_jsscalar(val, widget = widget)}, "
+    return ["{", ", ".join(items), "}"]
+
+
+# type -> function(x, widget) converting x to JavaScript representation
+_JSSCALAR_CONVERTERS = {}
+
+# snake_case property name -> JavaScript key
+_JSKEYS = {}
+
+
+def _to_jskey(key):
+    """convert snake_case property name to camelCase JavaScript key, cached"""
+    try:
+        return _JSKEYS[key]
+    except KeyError:
+        jskey = _JSKEYS[key] = case.snake_case_to_camel_case(key)
+        return jskey
+
+
+def _get_jsscalar_converter(klass):
+    """return the converter of klass instances to JavaScript representation"""
+
+    from cesiumpy.base import _CesiumObject, _CesiumEnum
+
+    if issubclass(klass, (_CesiumObject, _CesiumEnum)):
+        return lambda x, widget: x.generate_script(widget=widget)
+    elif issubclass(klass, bool):
+        # convert to JavaScript repr
+        return lambda x, widget: "true" if x else "false"
+    elif issubclass(klass, six.string_types):
+        return lambda x, widget: f'"{x}"'
+    elif issubclass(klass, datetime.datetime):
+        return lambda x, widget: f'Cesium.JulianDate.fromIso8601("{x.isoformat()}")'
+    elif issubclass(klass, dict):
+        return lambda x, widget: "".join(to_jsobject(x, widget=widget))
+    elif issubclass(klass, list):
+        return lambda x, widget: "[{0}]".format(
+            ", ".join([str(to_jsscalar(e, widget=widget)) for e in x])
         )
-    results[-1] = results[-1][:-2]  # remove final comma
-    results.append("}")
-    return results
+    return lambda x, widget: x
+
+
+def to_jsfloat64array(x):
+    """convert x to JavaScript Float64Array, decoded from a base64 string"""
+    import numpy as np
+
+    data = base64.b64encode(np.ascontiguousarray(x, dtype="<f8").tobytes())
+    data = data.decode("ascii")
+    return f'new Float64Array(Uint8Array.from(atob("{data}"), (c) => c.charCodeAt(0)).buffer)'
+
+
+def _to_float64_array(x, msg=None):
+    """convert x to float64 ndarray, float64 ndarray is returned as it is"""
+    try:
+        return np.asarray(x, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(msg)
 
 
 def _flatten_list_of_listlike(x):
@@ -6,7 +6,7 @@ from __future__ import unicode_literals
 import os
 import six
 import warnings
-from typing import List
+from typing import IO, Iterable, Iterator, List
 
 
 def _check_uri(sourceUri):
@@ -26,34 +26,31 @@ def _wrap_uri(sourceUri):
 
 
 def _wrap_async_init(scripts: List[str]) -> List[str]:
+    return list(_iter_wrap_async_init(scripts))
 
-    before: List[str] = [
-        "async function init() {",
-    ]
 
-    after: List[str] = [
-        "}",
-        "init();",
-    ]
+def _iter_wrap_async_init(scripts: Iterable[str]) -> Iterator[str]:
 
-    return before + _add_indent(scripts) + after
+    yield "async function init() {"
+    yield from _iter_add_indent(scripts)
+    yield "}"
+    yield "init();"
 
 
 def _wrap_scripts(scripts: List[str]) -> List[str]:
     assert isinstance(scripts, list)
 
-    # filter None and empty str
-    scripts = [s for s in scripts if ((s is not None) and len(s) > 0)]
+    return list(_iter_wrap_scripts(scripts))
+
 
-    before: List[str] = [
-        '<script type="text/javascript">',
-    ]
+def _iter_wrap_scripts(scripts: Iterable[str]) -> Iterator[str]:
 
-    after: List[str] = [
-        "</script>",
-    ]
+    # filter None and empty str
+    scripts = (s for s in scripts if ((s is not None) and len(s) > 0))
 
-    return before + _add_indent(_wrap_async_init(scripts)) + after
+    yield '<script type="text/javascript">'
+    yield from _iter_add_indent(_iter_wrap_async_init(scripts))
+    yield "</script>"
 
 
 def _add_indent(script, indent=2):
@@ -61,17 +58,33 @@ def _add_indent(script, indent=2):
     if not isinstance(script, list):
         script = [script]
 
+    return list(_iter_add_indent(script, indent=indent))
+
+
+def _iter_add_indent(scripts: Iterable[str], indent=2) -> Iterator[str]:
+    """Indent scripts lazily with specfied number of spaces"""
     indent = " " * indent
-    return [indent + s for s in script]
+    return (indent + s for s in scripts)
 
 
 def _build_html(*args):
-    results = []
+    # text mode files translate newlines to os.linesep on write
+    return "\n".join(_iter_html(*args))
+
+
+def _iter_html(*args) -> Iterator[str]:
     for a in args:
-        if isinstance(a, list):
-            results.extend(a)
-        elif isinstance(a, six.string_types):
-            results.append(a)
+        if isinstance(a, six.string_types):
+            yield a
+        elif isinstance(a, (list, Iterator)):
+            yield from a
         else:
             raise ValueError(type(a))
-    return os.linesep.join(results)
+
+
+def _write_html(fileobj: IO[str], *args) -> None:
+    """Write HTML lines to fileobj one at a time, as joined by _build_html"""
+    for (index, line) in enumerate(_iter_html(*args)):
+        if index > 0:
+            fileobj.write("\n")
+        fileobj.write(line)
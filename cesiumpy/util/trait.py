@@ -6,7 +6,9 @@ from __future__ import unicode_literals
 import collections
 from enum import Enum
 import datetime
+import itertools
 from typing import Optional
+import weakref
 
 import traitlets
 
@@ -73,12 +75,41 @@ class _HTMLObject(traitlets.HasTraits):
         return False
 
 
+# Global counter, so that a version is never reused across objects
+_SCRIPT_VERSIONS = itertools.count(1)
+
+# class -> function(obj, widget) returning the script of obj, see _compile_emitter
+_EMITTERS = {}
+
+_MISSING = object()
+
+
 class _JavaScriptObject(_HTMLObject):
     """
     Base class for JavaScript instances, which can be converted to
     JavaScript instance
+
+    Once its script is cached, an object and the objects it holds as
+    attributes are watched: every public attribute assignment (trait or
+    not) bumps _script_version, and is propagated to the objects holding
+    this one, so generated scripts can be reused until the object or any
+    nested object changes.
     """
 
+    # Definitions
+
+    _script_version = 0
+
+    # Methods
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+
+        if "_script_parents" in self.__dict__ and name[0] != "_":
+            self._invalidate_script()
+            # traits may have converted value on validation
+            self._link_script_child(self._trait_values.get(name, value))
+
     # Properties
 
     @property
@@ -99,7 +130,95 @@ class _JavaScriptObject(_HTMLObject):
     # Methods
 
     def generate_script(self, widget=None) -> str:
-        return "".join(com.to_jsobject(self._property_dict, widget=widget))
+        emitter = _EMITTERS.get(type(self))
+        if emitter is None:
+            emitter = _EMITTERS[type(self)] = type(self)._compile_emitter()
+        return emitter(self, widget)
+
+    # Private methods
+
+    @classmethod
+    def _compile_emitter(cls):
+        """
+        Return function emitting the JavaScript object of cls instances
+
+        The camelCase key table is built once per class, and property
+        values are read from the trait values directly. Classes which
+        customize _property_dict go through it.
+        """
+        if cls._property_dict is not _JavaScriptObject._property_dict or not (
+            isinstance(cls._props, (list, tuple))
+        ):
+            return lambda obj, widget: "".join(
+                com.to_jsobject(obj._property_dict, widget=widget)
+            )
+
+        emit = _compile_properties_emitter(cls._props)
+        return lambda obj, widget: emit(obj, widget) or ""
+
+    def _invalidate_script(self, version=None):
+        """Mark generated scripts of this object and its holders as stale"""
+        if version is None:
+            version = next(_SCRIPT_VERSIONS)
+        elif self._script_version >= version:
+            # already invalidated by this change, objects may hold each other
+            return
+        self.__dict__["_script_version"] = version
+
+        parents = self.__dict__.get("_script_parents")
+        if parents:
+            for key, ref in list(parents.items()):
+                parent = ref()
+                if parent is None:
+                    del parents[key]
+                else:
+                    parent._invalidate_script(version)
+
+    def _watch_script(self):
+        """Start tracking changes, return the holders of this object"""
+        parents = self.__dict__.get("_script_parents")
+        if parents is None:
+            parents = self.__dict__["_script_parents"] = {}
+            for values in (self._trait_values, self.__dict__):
+                for name, value in list(values.items()):
+                    if name[0] != "_":
+                        self._link_script_child(value)
+        return parents
+
+    def _link_script_child(self, value):
+        if isinstance(value, _JavaScriptObject):
+            value._watch_script()[id(self)] = weakref.ref(self)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                self._link_script_child(v)
+
+
+def _compile_properties_emitter(props):
+    """
+    Return function emitting the JavaScript object of props of an object,
+    or None when all of them are None
+    """
+    keys = tuple((p, com._to_jskey(p) + ": ") for p in props)
+    to_jsscalar = com.to_jsscalar
+
+    def emit(obj, widget):
+        values = obj._trait_values
+        attributes = obj.__dict__
+        items = []
+        for name, key in keys:
+            value = values.get(name, _MISSING)
+            if value is _MISSING:
+                value = attributes.get(name, _MISSING)
+            if value is _MISSING:
+                # property, or trait default not yet computed
+                value = getattr(obj, name)
+            if value is not None:
+                items.append(key + str(to_jsscalar(value, widget)))
+        if not items:
+            return None
+        return "{" + ", ".join(items) + "}"
+
+    return emit
 
 
 class _JavaScriptEnum(Enum):
@@ -64,6 +64,7 @@ setup(
     package_data={
         "cesiumpy.data": [
             "countries/*.json",
+            "countries/*.store",
             "countries/data/*.json",
             "countries/data/*.svg",
         ]
@@ -8,9 +8,14 @@
 
 import pytest
 
-import sys
+import importlib.util
+import json
+
+import numpy as np
 
 import cesiumpy
+import cesiumpy.data.country as country
+from cesiumpy.data.store import CountryStore, build_store
 
 ######################################################################################################################################################
 
@@ -25,7 +30,7 @@ class TestCountry:
             cesiumpy.countries.get("X")
 
     @pytest.mark.skipif(
-        "shapely.geometry" not in sys.modules, reason="requires Shapely"
+        importlib.util.find_spec("shapely") is None, reason="requires Shapely"
     )
     def test_country_jpn(self):
 
@@ -53,7 +58,7 @@ class TestCountry:
         assert jpn[0].script == exp
 
     @pytest.mark.skipif(
-        "shapely.geometry" not in sys.modules, reason="requires Shapely"
+        importlib.util.find_spec("shapely") is None, reason="requires Shapely"
     )
     def test_country_get_jpn(self):
 
@@ -64,7 +69,7 @@ class TestCountry:
         assert jpn[0].script == exp
 
     @pytest.mark.skipif(
-        "shapely.geometry" not in sys.modules, reason="requires Shapely"
+        importlib.util.find_spec("shapely") is None, reason="requires Shapely"
     )
     def test_viewer(self):
         v = cesiumpy.Viewer(divid="viewertest")
@@ -81,4 +86,104 @@ class TestCountry:
         assert res == exp
 
 
+class TestCountryStore:
+    @pytest.fixture
+    def source(self, tmp_path):
+
+        t = np.linspace(0.0, 2.0 * np.pi, 1001)
+        ring = np.column_stack([140.0 + 2.0 * np.cos(t), 36.0 + 2.0 * np.sin(t)])
+        ring[-1] = ring[0]
+        island = [[153.9, 24.2], [154.0, 24.2], [154.0, 24.3], [153.9, 24.2]]
+
+        (tmp_path / "data").mkdir()
+
+        with open(tmp_path / "countries.json", "w") as f:
+            json.dump(
+                [
+                    {"cca3": "JPN", "cca2": "JP", "name": {"official": "Japan"}},
+                    {"cca3": "ABW", "cca2": "AW", "name": {"official": "Aruba"}},
+                ],
+                f,
+            )
+
+        with open(tmp_path / "data" / "jpn.geo.json", "w") as f:
+            json.dump(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "type": "Feature",
+                            "geometry": {
+                                "type": "MultiPolygon",
+                                "coordinates": [[ring.tolist()], [island]],
+                            },
+                        }
+                    ],
+                },
+                f,
+            )
+
+        return tmp_path
+
+    def test_build_country_store_success(self, source):
+
+        store = country.build_country_store(
+            path=source / "countries.store", source=source
+        )
+
+        assert isinstance(store, CountryStore)
+        assert len(store) == 1
+        assert store.resolve("JAPAN") == "jpn"
+        assert store.resolve("jp") == "jpn"
+        assert "aw" not in store
+
+        outlines = store.get("JPN")
+        assert [len(outline) for outline in outlines] == [1001, 4]
+        assert outlines[0].dtype == np.float32
+        assert np.allclose(
+            outlines[1], [[153.9, 24.2], [154.0, 24.2], [154.0, 24.3], [153.9, 24.2]]
+        )
+
+        # views of the memory-mapped file
+        assert isinstance(outlines[0].base, np.memmap)
+
+        # coarser levels have fewer points
+        sizes = [len(store.get("jpn", level=level)[0]) for level in range(4)]
+        assert sizes == sorted(sizes, reverse=True)
+        assert sizes[-1] < 100
+
+        with pytest.raises(KeyError):
+            store.get("X")
+
+    def test_outlines_success(self, source, monkeypatch):
+
+        build_store(
+            source / "countries.store",
+            {"jpn": [np.array([[0.0, 0.0], [1.0, 0.001], [2.0, 0.0]])]},
+            aliases={"Japan": "JPN"},
+            tolerances=[0.01],
+        )
+        monkeypatch.setattr(country, "store_path", str(source / "countries.store"))
+
+        loader = country.CountryLoader()
+
+        assert loader.store.tolerances == [0.0, 0.01]
+        assert len(loader.outlines("japan")[0]) == 3
+        assert len(loader.outlines("japan", tolerance=0.01)[0]) == 2
+        assert len(loader.outlines("japan", tolerance=0.001)[0]) == 3
+        assert len(loader.outlines("japan", zoom=0)[0]) == 2
+
+        msg = "Unable to load country data, file not found: 'X'"
+        with pytest.raises(ValueError, match=msg):
+            loader.outlines("X")
+
+    def test_store_error(self, tmp_path):
+
+        path = tmp_path / "countries.store"
+        path.write_bytes(b"X" * 16)
+
+        with pytest.raises(ValueError, match="Unable to load country store"):
+            CountryStore(path)
+
+
 ######################################################################################################################################################
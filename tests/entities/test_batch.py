@@ -0,0 +1,116 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/entities/test_batch.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy.plotting import plot
+
+######################################################################################################################################################
+
+
+class TestEntityBatch:
+    def test_point_batch_success(self):
+
+        batch = cesiumpy.PointBatch(
+            [130.0, 140.0],
+            [30.0, 40.0],
+            size=[5.0, 6.0],
+            color=["red", cesiumpy.color.BLUE],
+        )
+
+        assert len(batch) == 2
+        assert batch.positions.tolist() == [[130.0, 30.0, 0.0], [140.0, 40.0, 0.0]]
+
+        script = batch.generate_script(widget=cesiumpy.Viewer())
+
+        assert script.startswith("(function (data, colors) { ")
+        assert (
+            "point: {pixelSize: data[i + 3], color: colors[data[i + 4]]}" in script
+        )
+        assert script.endswith(
+            "{data}, [Cesium.Color.RED, Cesium.Color.BLUE]);".format(
+                data=cesiumpy.util.common.to_jsfloat64array(
+                    [130.0, 30.0, 0.0, 5.0, 0.0, 140.0, 40.0, 0.0, 6.0, 1.0]
+                )
+            )
+        )
+
+    def test_cylinder_batch_success(self):
+
+        batch = cesiumpy.CylinderBatch(
+            [130.0, 140.0],
+            [30.0, 40.0],
+            length=[10.0, 20.0],
+            color=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+            bottom=5.0,
+        )
+
+        assert batch.positions[:, 2].tolist() == [10.0, 15.0]
+
+        script = batch.generate_script(widget=cesiumpy.Viewer())
+
+        assert (
+            "cylinder: {length: data[i + 3], topRadius: 10000.0, bottomRadius: 10000.0, "
+            "material: new Cesium.Color(data[i + 4], data[i + 5], data[i + 6])}"
+        ) in script
+
+    def test_label_batch_success(self):
+
+        batch = cesiumpy.LabelBatch(["a", "</script>"], [130.0, 140.0], [30.0, 40.0])
+
+        script = batch.generate_script(widget=cesiumpy.Viewer())
+
+        assert "label: {text: text[j], scale: 1.0}" in script
+        assert script.endswith(', [], ["a", "<\\/script>"]);')
+
+    def test_batch_colors_success(self):
+
+        assert cesiumpy.LabelBatch(["a"], [1.0], [2.0]).colors is None
+
+        batch = cesiumpy.PointBatch([1.0, 2.0], [3.0, 4.0])
+        assert batch.colors.tolist() == [[1.0, 1.0, 1.0, 1.0]] * 2
+
+        batch = cesiumpy.PointBatch([1.0, 2.0], [3.0, 4.0], color=["red", "blue"])
+        assert batch.colors.tolist() == [[1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]]
+
+        rgb = np.array([[0.5, 0.5, 0.5], [0.0, 1.0, 0.0]])
+        batch = cesiumpy.PointBatch([1.0, 2.0], [3.0, 4.0], color=rgb)
+        assert batch.colors.tolist() == [[0.5, 0.5, 0.5, 1.0], [0.0, 1.0, 0.0, 1.0]]
+
+    def test_batch_failure(self):
+
+        with pytest.raises(ValueError, match="y length must be 2"):
+            cesiumpy.PointBatch([130.0, 140.0], [30.0])
+
+        msg = "must be a list consists from longitude"
+        with pytest.raises(ValueError, match=msg):
+            cesiumpy.PointBatch([130.0, 240.0], [30.0, 40.0])
+
+        with pytest.raises(ValueError, match="color must be of shape"):
+            cesiumpy.PointBatch([130.0], [30.0], color=np.zeros((2, 3)))
+
+    def test_plot_scatter_threshold_success(self, monkeypatch):
+
+        monkeypatch.setattr(plot, "BATCH_THRESHOLD", 3)
+
+        viewer = cesiumpy.Viewer()
+        viewer.plot.scatter([130, 140], [30, 40])
+        viewer.plot.scatter([130, 140, 150], [30, 40, 50])
+
+        assert len(viewer.entities) == 3
+        assert isinstance(viewer.entities[0], cesiumpy.Point)
+        assert isinstance(viewer.entities[2], cesiumpy.PointBatch)
+
+        script = viewer.script
+        assert script[-2].startswith("(function (data, colors) { ")
+        assert script[-1] == "widget.zoomTo(widget.entities);"
+
+
+######################################################################################################################################################
@@ -6,6 +6,7 @@
 
 ######################################################################################################################################################
 
+import numpy as np
 import pytest
 
 import cesiumpy
@@ -115,6 +116,69 @@ class TestCartesian:
         with pytest.raises(ValueError, match=msg):
             cesiumpy.Cartesian3.fromDegreesArray([10, 20, 20, 91])
 
+    def test_cartesian3_array_simplify_success(self):
+        t = np.linspace(0.0, 2.0 * np.pi, 10001)
+        x = np.column_stack([10.0 * np.cos(t), 10.0 * np.sin(t), np.full(len(t), 5.0)])
+        x[-1] = x[0]
+
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+
+        for algorithm in ["douglas_peucker", "visvalingam"]:
+            result = c.simplify(0.01, algorithm=algorithm)
+            assert isinstance(result, cartesian.Cartesian3Array)
+            assert 10 < len(result) < 500
+            assert result.has_heights
+            # closed ring stays closed
+            assert result._values[0].tolist() == result._values[-1].tolist()
+
+        assert len(c.simplify(zoom="globe")) < len(c.simplify(zoom="city"))
+
+        # nothing to remove
+        assert c.simplify(0.0) is c
+
+        with pytest.raises(ValueError, match="tolerance or zoom must be provided"):
+            c.simplify()
+
+        with pytest.raises(ValueError, match="algorithm must be one of"):
+            c.simplify(0.01, algorithm="x")
+
+    def test_cartesian3_array_ndarray_success(self):
+        x = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+        assert c._values is x
+        assert len(c) == 2
+        assert c.values.tolist() == [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0]]
+        assert (
+            c.generate_script()
+            == "Cesium.Cartesian3.fromDegreesArray([1.0, 2.0, 3.0, 4.0])"
+        )
+
+        x = np.array([[1.0, 2.0, 10.0], [3.0, 4.0, 20.0]])
+
+        c = cesiumpy.Cartesian3.fromDegreesArray(x)
+        assert c._values is x
+        assert c.has_heights
+        assert (
+            c.generate_script()
+            == "Cesium.Cartesian3.fromDegreesArrayHeights([1.0, 2.0, 10.0, 3.0, 4.0, 20.0])"
+        )
+
+        c = cesiumpy.Cartesian3.fromDegreesArrayHeights([1, 2, 10, 3, 4, 20])
+        assert c.values.tolist() == x.tolist()
+
+        msg = "x must be a list consists from longitude and latitude"
+        with pytest.raises(ValueError, match=msg):
+            cesiumpy.Cartesian3.fromDegreesArray(
+                np.array([[10.0, 20.0], [200.0, 20.0]])
+            )
+
+        with pytest.raises(ValueError, match=msg):
+            cesiumpy.Cartesian3.fromDegreesArray(np.array([[10.0, np.nan]]))
+
+        with pytest.raises(ValueError, match=msg):
+            cesiumpy.Cartesian3.fromDegreesArray(np.zeros((2, 4)))
+
     def test_cartesian4(self):
         c = cesiumpy.Cartesian4(5, 10, 20, 30)
         exp = "new Cesium.Cartesian4(5.0, 10.0, 20.0, 30.0)"
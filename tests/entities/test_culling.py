@@ -0,0 +1,95 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/entities/test_culling.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import pytest
+
+import cesiumpy
+from cesiumpy.entities.culling import Viewport
+
+######################################################################################################################################################
+
+
+class TestViewport:
+    def test_viewport_success(self):
+
+        viewport = Viewport.maybe([170.0, -10.0, 175.0, 10.0], margin=10.0)
+        assert (viewport.west, viewport.south, viewport.east, viewport.north) == (
+            160.0,
+            -20.0,
+            -175.0,
+            20.0,
+        )
+
+        inside = viewport.contains([165.0, 179.0, -178.0, -170.0, 0.0], [0.0] * 5)
+        assert inside.tolist() == [True, True, True, False, False]
+
+        rectangle = cesiumpy.entities.cartesian.Rectangle.fromDegrees(
+            -10.0, 80.0, 10.0, 85.0
+        )
+        viewport = Viewport.maybe(rectangle, margin=200.0)
+        assert (viewport.west, viewport.south, viewport.east, viewport.north) == (
+            -180.0,
+            -90.0,
+            180.0,
+            90.0,
+        )
+
+    def test_viewport_failure(self):
+
+        with pytest.raises(ValueError, match="camera destination must be a Rectangle"):
+            cesiumpy.Viewer().to_html(viewport="camera")
+
+        with pytest.raises(ValueError, match="viewport must be in degrees"):
+            Viewport.maybe(cesiumpy.entities.cartesian.Rectangle(0.0, 0.0, 0.1, 0.1))
+
+        with pytest.raises(ValueError, match="margin must be positive or zero"):
+            Viewport.maybe([0.0, 0.0, 1.0, 1.0], margin=-1.0)
+
+    def test_to_html_success(self):
+
+        viewer = cesiumpy.Viewer()
+
+        batch = cesiumpy.PointBatch([0.0, 5.0, 100.0], [0.0, 5.0, 0.0], size=[1, 2, 3])
+        labels = cesiumpy.LabelBatch(["a", "b"], [1.0, 120.0], [1.0, 0.0])
+        line = cesiumpy.Polyline(
+            positions=[-30.0, 0.0, -20.0, 0.0, 20.0, 0.0, 30.0, 0.0, 40.0, 40.0, 20.0, 1.0]
+        )
+        inside = cesiumpy.Point(position=[3.0, 3.0, 0.0])
+        outside = cesiumpy.Point(position=[100.0, 0.0, 0.0])
+
+        viewer.entities.add([batch, labels, line, inside, outside])
+        viewer.camera.flyTo([-10.0, -10.0, 10.0, 10.0])
+
+        full = viewer.to_html()
+        assert "fromDegrees(100.0" in full
+
+        html = viewer.to_html(viewport="camera")
+
+        assert len(html) < len(full)
+        assert "fromDegrees(3.0, 3.0, 0.0)" in html
+        assert "fromDegrees(100.0" not in html
+        assert '["a"]' in html
+
+        batch_script = batch.take([0, 1]).generate_script(widget=viewer)
+        assert batch_script in html
+
+        # polyline is split in the runs of segments crossing the viewport
+        assert (
+            "fromDegreesArray([-20.0, 0.0, 20.0, 0.0])" in html
+            and "fromDegreesArray([40.0, 40.0, 20.0, 1.0])" not in html
+        )
+        html = viewer.to_html(viewport=[15.0, 0.5, 25.0, 1.5])
+        assert "fromDegreesArray([40.0, 40.0, 20.0, 1.0])" in html
+
+        # exported entities are left unchanged
+        assert len(batch) == 3
+        assert len(line.positions.x) == 12
+        assert viewer.to_html() == full
+
+
+######################################################################################################################################################
@@ -0,0 +1,97 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/entities/test_index.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import numpy as np
+
+import cesiumpy
+from cesiumpy.entities.index import SpatialIndex, _haversine
+
+######################################################################################################################################################
+
+
+class TestSpatialIndex:
+    def test_entity_queries_success(self):
+
+        viewer = cesiumpy.Viewer()
+
+        tokyo = cesiumpy.Point(position=[139.69, 35.68, 0.0])
+        paris = cesiumpy.Point(position=[2.35, 48.85, 0.0])
+        line = cesiumpy.Polyline(positions=[179.0, 10.0, -179.0, 12.0])
+        batch = cesiumpy.PointBatch([0.0, 140.0], [0.0, 36.0])
+
+        viewer.entities.add([tokyo, paris, line])
+
+        assert viewer.entities.query_bbox(130.0, 30.0, 150.0, 40.0) == [tokyo]
+        assert viewer.entities.query_bbox(-10.0, -10.0, 10.0, 10.0) == []
+
+        # rectangle crossing the antimeridian
+        assert viewer.entities.query_bbox(178.0, 9.0, -178.0, 11.0) == [line]
+
+        # index is updated as entities are added
+        viewer.entities.add(batch)
+
+        assert viewer.entities.query_bbox(130.0, 30.0, 150.0, 40.0) == [tokyo, batch]
+        assert viewer.entities.query_radius(139.7, 35.7, 20e3) == [tokyo]
+        assert viewer.entities.query_radius(139.7, 35.7, 500e3) == [tokyo, batch]
+        assert viewer.entities.nearest(1.0, 1.0) == [batch]
+        assert viewer.entities.nearest(2.0, 48.0, k=3) == [paris, batch, tokyo]
+
+        # positions changed after addition
+        tokyo.position = cesiumpy.Cartesian3.fromDegrees(-74.0, 40.7, 0.0)
+        assert viewer.entities.query_bbox(-80.0, 35.0, -70.0, 45.0) == []
+
+        viewer.entities.reindex()
+        assert viewer.entities.query_bbox(-80.0, 35.0, -70.0, 45.0) == [tokyo]
+
+        viewer.entities.clear()
+        assert viewer.entities.nearest(0.0, 0.0) == []
+
+    def test_grid_success(self):
+
+        rng = np.random.default_rng(0)
+        points = np.column_stack(
+            [rng.uniform(-180.0, 180.0, 10000), rng.uniform(-90.0, 90.0, 10000)]
+        )
+
+        index = SpatialIndex(cell_size=2.0)
+        assert index.insert(cesiumpy.PointBatch(points[:, 0], points[:, 1]))
+        assert not index.insert(cesiumpy.Point(position=cesiumpy.Cartesian3(1, 2, 3)))
+        assert len(index) == 10000
+
+        inside = (
+            (points[:, 0] >= -20.0)
+            & (points[:, 0] <= 15.0)
+            & (points[:, 1] >= 5.0)
+            & (points[:, 1] <= 30.0)
+        )
+        result = index.query_bbox(-20.0, 5.0, 15.0, 30.0)
+        assert result.tolist() == np.flatnonzero(inside).tolist()
+
+        distances = index.distances(10.0, 20.0)
+        result = index.query_radius(10.0, 20.0, 1000e3)
+        expected = np.flatnonzero(distances <= 1000e3)
+        assert sorted(result.tolist()) == expected.tolist()
+        assert np.all(np.diff(distances[result]) >= 0.0)
+
+        result = index.nearest(10.0, 20.0, k=5)
+        assert result.tolist() == np.argsort(distances)[:5].tolist()
+
+        # nearest point of a meridian edge is poleward of the point
+        index = SpatialIndex()
+        index.insert(cesiumpy.Polyline(positions=[90.0, 0.0, 100.0, 89.0]))
+
+        assert np.isclose(
+            index.distances(0.0, 60.0)[0], _haversine(0.0, 60.0, 90.0, 89.0)
+        )
+        assert index.query_radius(0.0, 60.0, 35.0 * 111195.08).tolist() == [0]
+
+        # one degree of latitude
+        assert np.isclose(_haversine(0.0, 0.0, 0.0, 1.0), 111195.08, atol=1.0)
+
+
+######################################################################################################################################################
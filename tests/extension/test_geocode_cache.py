@@ -0,0 +1,150 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/extension/test_geocode_cache.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import asyncio
+import threading
+
+import pytest
+
+import cesiumpy
+import cesiumpy.extension.geocode as geocode
+
+######################################################################################################################################################
+
+
+class Location:
+    def __init__(self, longitude: float, latitude: float) -> None:
+        self.longitude = longitude
+        self.latitude = latitude
+
+
+class StandInGeocoder:
+
+    """
+    Local geocoder of a few places, recording its lookups.
+    """
+
+    PLACES = {
+        "Tokyo": Location(139.6917, 35.6895),
+        "Paris": Location(2.3522, 48.8566),
+        "Los Angeles": Location(-118.2437, 34.0522),
+    }
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self._lock = threading.Lock()
+
+    def geocode(self, query: str):
+        with self._lock:
+            self.queries.append(query)
+        if query == "error":
+            raise RuntimeError("unavailable")
+        return self.PLACES.get(query)
+
+
+@pytest.fixture
+def geocoder(monkeypatch) -> StandInGeocoder:
+
+    geocoder = StandInGeocoder()
+
+    monkeypatch.setattr(geocode, "_GEOCODER", geocoder)
+    monkeypatch.setattr(geocode, "_CACHE", geocode.GeocodeCache())
+
+    return geocoder
+
+
+######################################################################################################################################################
+
+
+class TestGeocodeCache:
+    def test_maybe_geocode_success(self, geocoder: StandInGeocoder):
+
+        assert geocode._maybe_geocode("Tokyo") == (139.6917, 35.6895)
+        assert geocode._maybe_geocode(" tokyo ", height=10) == (139.6917, 35.6895, 10)
+        assert geocode._maybe_geocode("Nowhere") == "Nowhere"
+        assert geocode._maybe_geocode(3) == 3
+
+        result = geocode._maybe_geocode(["Paris", "Nowhere", [1, 2], "PARIS"])
+        assert result == [(2.3522, 48.8566), "Nowhere", [1, 2], (2.3522, 48.8566)]
+
+        # normalized queries are looked up once, unresolvable ones too
+        assert geocoder.queries == ["Tokyo", "Nowhere", "Paris"]
+
+        result = cesiumpy.Cartesian3.maybe("Paris", degrees=True)
+        assert result.x == 2.3522
+        assert len(geocoder.queries) == 3
+
+    def test_geocode_many_success(self, geocoder: StandInGeocoder):
+
+        result = geocode.geocode_many(["Tokyo", "Paris", "Los Angeles", "Tokyo"])
+
+        assert result == [
+            (139.6917, 35.6895),
+            (2.3522, 48.8566),
+            (-118.2437, 34.0522),
+            (139.6917, 35.6895),
+        ]
+        assert sorted(geocoder.queries) == ["Los Angeles", "Paris", "Tokyo"]
+
+        # from a running event loop
+        async def lookup():
+            return (
+                geocode.geocode("Tokyo"),
+                await geocode.geocode_async(["Paris"]),
+            )
+
+        assert asyncio.run(lookup()) == ((139.6917, 35.6895), [(2.3522, 48.8566)])
+        assert len(geocoder.queries) == 3
+
+    def test_geocode_many_failure(self, geocoder: StandInGeocoder):
+
+        with pytest.raises(RuntimeError, match="unavailable"):
+            geocode.geocode_many(["Tokyo", "error"])
+
+        # successful lookups are cached anyway
+        assert geocode.get_cache().get("Tokyo") == (139.6917, 35.6895)
+        assert geocode.get_cache().get("error", default="unknown") == "unknown"
+
+    def test_persistent_cache_success(self, geocoder: StandInGeocoder, tmp_path):
+
+        path = str(tmp_path / "geocode.sqlite")
+
+        cache = geocode.set_cache(path=path, maxsize=1)
+        assert geocode.geocode_many(["Tokyo", "Paris", "Nowhere"]) == [
+            (139.6917, 35.6895),
+            (2.3522, 48.8566),
+            None,
+        ]
+        assert len(cache) == 3
+        cache.close()
+
+        # results of another session
+        cache = geocode.set_cache(path=path)
+        assert geocode.geocode("tokyo") == (139.6917, 35.6895)
+        assert geocode.geocode("Nowhere") is None
+        assert len(geocoder.queries) == 3
+
+        cache.clear()
+        assert len(cache) == 0
+        cache.close()
+
+    def test_lru_cache_success(self):
+
+        cache = geocode.GeocodeCache(maxsize=2)
+        cache.update({"a": (1.0, 2.0), "b": None})
+
+        assert cache.get("A") == (1.0, 2.0)
+
+        # least recently used is dropped
+        cache.update({"c": (3.0, 4.0)})
+        assert cache.get("b", default="unknown") == "unknown"
+        assert cache.get("a") == (1.0, 2.0)
+        assert len(cache) == 2
+
+
+######################################################################################################################################################
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import json
 import pytest
 import os
 
@@ -34,6 +35,145 @@ class TestIO:
         self.assertTrue(all([isinstance(e, cesiumpy.Polyline) for e in res]))
         self.assertEqual(res[0].script, exp)
 
+    def test_iter_geojson_features(self, tmp_path):
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [float(i), 1.5e-3]},
+                "properties": {"name": 'a]}"b', "value": i},
+            }
+            for i in range(20)
+        ]
+        collection = {
+            "type": "FeatureCollection",
+            "crs": {"properties": {"features": 1}},
+            "features": features,
+            "bbox": [0, 1, 19, 1],
+        }
+
+        path = tmp_path / "features.geo.json"
+
+        for indent in [None, 2]:
+            with open(path, "w") as f:
+                json.dump(collection, f, indent=indent)
+
+            # values spanning buffers are read further
+            for buffer_size in [1, 7, 2**16]:
+                res = cesiumpy.io.iter_geojson_features(path, buffer_size=buffer_size)
+                assert list(res) == features
+
+        with open(path, "w") as f:
+            json.dump({"type": "FeatureCollection", "features": []}, f)
+
+        assert list(cesiumpy.io.iter_geojson_features(path)) == []
+
+        # numbers split after their decimal point or exponent are read further
+        with open(path, "w") as f:
+            f.write('{"version": 1.5, "scale": 2.5e-3, "features": [{"type": "Feature"}]}')
+
+        for buffer_size in [14, 28, 29, 30, 31]:
+            res = cesiumpy.io.iter_geojson_features(path, buffer_size=buffer_size)
+            assert list(res) == [{"type": "Feature"}]
+
+        with open(path, "w") as f:
+            f.write('{"features": [{"type": "Feature"}, {"type": ')
+
+        res = cesiumpy.io.iter_geojson_features(path)
+        assert next(res) == {"type": "Feature"}
+        with pytest.raises(ValueError):
+            next(res)
+
+    def test_iter_geojson(self):
+        pytest.importorskip("shapely.geometry")
+
+        path = os.path.join(current_dir, "data", "jpn.geo.json")
+        res = list(cesiumpy.io.iter_geojson(path, chunk_size=10))
+
+        assert all(isinstance(chunk, list) for chunk in res)
+        assert sum(len(chunk) for chunk in res) == len(cesiumpy.io.read_geojson(path))
+
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            next(cesiumpy.io.iter_geojson(path, chunk_size=0))
+
+    def test_to_arrays_holes(self):
+        square = [[0.0, 0.0], [0.0, 2.0], [2.0, 2.0], [0.0, 0.0]]
+        hole = [[0.5, 0.5], [0.5, 1.0], [1.0, 1.0], [0.5, 0.5]]
+        geometries = [
+            {"type": "Polygon", "coordinates": [square, hole]},
+            {"type": "MultiPolygon", "coordinates": [[square], [square, hole, hole]]},
+        ]
+
+        # polygons are converted to their exterior, dropped holes being counted
+        res = cesiumpy.io._to_arrays(geometries, 0.1, "douglas_peucker")
+        assert [(kind, values.tolist(), holes) for (kind, values, holes) in res] == [
+            ("Polygon", square, 1),
+            ("Polygon", square, 0),
+            ("Polygon", square, 2),
+        ]
+
+    def test_iter_geojson_workers(self, tmp_path):
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[float(i), 0.0], [float(i), 0.5], [float(i), 1.0]],
+                },
+                "properties": {"name": 'a]}"b'},
+            }
+            for i in range(10)
+        ]
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiPoint",
+                    "coordinates": [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+                },
+                "properties": {},
+            }
+        )
+
+        path = tmp_path / "features.geo.json"
+        with open(path, "w") as f:
+            json.dump({"type": "FeatureCollection", "features": features}, f)
+
+        res = list(cesiumpy.io.iter_geojson(path, chunk_size=3, workers=2))
+
+        # chunks are kept in order
+        assert [len(chunk) for chunk in res] == [3, 3, 3, 3]
+        entities = [entity for chunk in res for entity in chunk]
+        assert all(isinstance(e, cesiumpy.Polyline) for e in entities[:10])
+        assert [e.positions._values[0, 0] for e in entities[:10]] == list(range(10))
+        assert entities[10].position.x == 1.0
+        assert entities[11].position.z == 6.0
+
+        # simplified by workers
+        res = cesiumpy.io.read_geojson(path, tolerance=0.1, workers=1)
+        assert len(res) == 12
+        assert res[0].positions._values.tolist() == [[0.0, 0.0], [0.0, 1.0]]
+
+        with pytest.raises(ValueError, match="workers must be a positive integer"):
+            cesiumpy.io.read_geojson(path, workers=0)
+
+
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "type": "Feature",
+                            "geometry": {"type": "X", "coordinates": []},
+                        }
+                    ],
+                },
+                f,
+            )
+
+        with pytest.raises(ValueError, match="Unable to convert to cesiumpy entity"):
+            cesiumpy.io.read_geojson(path, workers=1)
+
 
 if __name__ == "__main__":
     nose.runmodule(argv=[__file__, "-vvs", "-x", "--pdb", "--pdb-failure"], exit=False)
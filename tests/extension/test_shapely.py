@@ -174,6 +174,15 @@ class TestShapelyEntity:
         ]
         self.assertEqual([e.script for e in res], exp)
 
+        # holes are dropped, simplified or not
+        p = shapely.geometry.Polygon(
+            [[1, 1], [1, 4], [4, 4], [4, 1]], [[[2, 2], [2, 3], [3, 3], [3, 2]]]
+        )
+        for tolerance in [None, 0.1]:
+            with pytest.warns(UserWarning, match="1 hole"):
+                res = cesiumpy.extension.shapefile.to_entity(p, tolerance=tolerance)
+                res.script
+
 
 if __name__ == "__main__":
     nose.runmodule(argv=[__file__, "-vvs", "-x", "--pdb", "--pdb-failure"], exit=False)
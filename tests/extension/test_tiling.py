@@ -0,0 +1,176 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/extension/test_tiling.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import functools
+import http.server
+import json
+import threading
+import urllib.request
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy.extension import tiling
+
+######################################################################################################################################################
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+
+    """
+    Local HTTP server of tmp_path, yielding its URL.
+    """
+
+    handler = functools.partial(QuietHandler, directory=str(tmp_path))
+
+    with http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler) as httpd:
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield "http://127.0.0.1:{port}".format(port=httpd.server_address[1])
+        httpd.shutdown()
+
+
+def _fetch(url: str):
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+######################################################################################################################################################
+
+
+class TestTiling:
+    def test_thin_success(self):
+
+        rng = np.random.default_rng(0)
+        positions = np.column_stack(
+            [rng.normal(10.0, 5.0, 5000), rng.normal(40.0, 5.0, 5000)]
+        )
+
+        tiles = tiling.thin(positions, max_level=6, max_items=100, rng=rng)
+
+        (keys, counts) = np.unique(tiles, axis=0, return_counts=True)
+
+        # every tile but the deepest ones holds max_items at most
+        assert counts[keys[:, 0] < 6].max() <= 100
+        assert counts[keys[:, 0] == 0].tolist() == [100]
+
+        # each position is in its tile
+        size = 360.0 / 2.0 ** tiles[:, 0]
+        assert np.all(np.floor((positions[:, 0] + 180.0) / size) == tiles[:, 1])
+        assert np.all(np.floor((positions[:, 1] + 90.0) / size * 2.0) == tiles[:, 2])
+
+    def test_write_tiles_success(self, tmp_path, server):
+
+        rng = np.random.default_rng(0)
+        batch = cesiumpy.PointBatch(
+            rng.uniform(0.0, 20.0, 3000), rng.uniform(30.0, 50.0, 3000), size=5.0
+        )
+        line = cesiumpy.Polyline(positions=[1.0, 1.0, 1.1, 1.2], name="road")
+
+        tileset = tiling.write_tiles(
+            tmp_path / "tiles",
+            [batch, line],
+            max_level=5,
+            max_items=500,
+            url=server + "/tiles",
+        )
+
+        assert tileset.tiles[0] == "0/0/0"
+        assert "5/16/16" in tileset.tiles
+        assert tileset.bounds[1] == pytest.approx(1.0)
+        assert len(batch) == 3000
+
+        manifest = _fetch(server + "/tiles/tileset.json")
+        assert manifest["tiles"] == tileset.tiles
+        assert manifest["maxLevel"] == 5
+
+        packets = []
+        for key in tileset.tiles:
+            document = _fetch("{url}/tiles/{key}.czml".format(url=server, key=key))
+            assert document[0] == {"id": "document", "version": "1.0"}
+            packets.extend(document[1:])
+
+        assert len(packets) == 3001
+        assert len({packet["id"] for packet in packets}) == 3001
+        (road,) = [packet for packet in packets if "polyline" in packet]
+        assert road["id"] == "road"
+        assert road["polyline"]["positions"] == {
+            "cartographicDegrees": [1.0, 1.0, 0.0, 1.1, 1.2, 0.0]
+        }
+
+        viewer = cesiumpy.Viewer()
+        viewer.scripts.add(tileset.generate_script(widget=viewer))
+
+        html = viewer.to_html()
+        assert "new Cesium.CzmlDataSource()" in html
+        assert json.dumps(server + "/tiles/") in html
+        assert "camera.moveEnd.addEventListener(update)" in html
+
+    def test_write_tiles_geojson_success(self, tmp_path):
+
+        batch = cesiumpy.PointBatch(
+            [1.0, 2.0], [3.0, 4.0], size=[5.0, 6.0], color=["red", "blue"]
+        )
+        line = cesiumpy.Polyline(positions=[1.0, 1.0, 1.1, 1.2])
+
+        tileset = tiling.write_tiles(
+            tmp_path, [batch, line], max_level=0, format="geojson"
+        )
+        assert tileset.tiles == ["0/0/0"]
+        assert tileset.url == str(tmp_path).replace("\\", "/")
+
+        with open(tmp_path / "0" / "0" / "0.geojson") as f:
+            collection = json.load(f)
+
+        features = collection["features"]
+        assert [feature["geometry"]["coordinates"] for feature in features] == [
+            [1.0, 3.0, 0.0],
+            [2.0, 4.0, 0.0],
+            [[1.0, 1.0, 0.0], [1.1, 1.2, 0.0]],
+        ]
+        assert features[1]["properties"] == {
+            "pixel_size": 6.0,
+            "marker-color": "#0000ff",
+        }
+        assert features[2]["properties"] == {}
+
+        assert "new Cesium.GeoJsonDataSource()" in tileset.generate_script()
+
+    def test_write_tiles_failure(self, tmp_path):
+
+        batch = cesiumpy.PointBatch([1.0], [3.0])
+
+        with pytest.raises(ValueError, match="format must be one of czml, geojson"):
+            tiling.write_tiles(tmp_path, [batch], format="pnts")
+
+        with pytest.raises(ValueError, match="max_level must be between 0 and 20"):
+            tiling.write_tiles(tmp_path, [batch], max_level=21)
+
+        with pytest.raises(ValueError, match="max_items must be a positive integer"):
+            tiling.write_tiles(tmp_path, [batch], max_items=0)
+
+        point = cesiumpy.Point(position=cesiumpy.Cartesian3(1.0, 2.0, 3.0))
+        with pytest.raises(ValueError, match="must have positions in degrees"):
+            tiling.write_tiles(tmp_path, [point])
+
+        # nothing is written
+        labels = cesiumpy.LabelBatch(["a"], [1.0], [3.0])
+        with pytest.raises(ValueError, match="Only point batches and polylines"):
+            tiling.write_tiles(tmp_path / "tiles", [batch, labels], format="geojson")
+
+        assert not (tmp_path / "tiles").exists()
+
+
+######################################################################################################################################################
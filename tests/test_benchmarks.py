@@ -0,0 +1,65 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_benchmarks.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import pytest
+
+from benchmarks import run
+from benchmarks.workloads import WORKLOADS
+
+######################################################################################################################################################
+
+
+class TestBenchmarks:
+    @pytest.mark.parametrize("name", list(WORKLOADS))
+    def test_measure_success(self, name):
+
+        result = run.measure(name, 10)
+
+        if "skipped" in result:
+            pytest.skip(result["skipped"])
+
+        assert result["html_bytes"] > 0
+        assert result["peak_rss"] > 0
+        assert result["build_time"] >= 0.0
+
+    def test_compare_success(self):
+
+        baseline = [
+            {
+                "name": "scatter",
+                "size": 10,
+                "import_time": 0.1,
+                "build_time": 1.0,
+                "html_time": 0.001,
+                "peak_rss": 100,
+                "html_bytes": 100,
+            }
+        ]
+        results = [
+            {
+                "name": "scatter",
+                "size": 10,
+                "import_time": 0.1,
+                "build_time": 1.5,
+                "html_time": 0.005,
+                "peak_rss": 100,
+                "html_bytes": 200,
+            }
+        ]
+
+        assert run.compare(results, baseline, threshold=0.2) == [
+            "scatter: build_time 1.500 s > 1.000 s",
+            "scatter: html_bytes 0.0 MB > 0.0 MB",
+        ]
+
+        assert "skipped (shapely missing)" in run.format_table(
+            [{"name": "read_geojson", "size": 10, "skipped": "shapely missing"}]
+        )
+
+
+######################################################################################################################################################
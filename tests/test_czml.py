@@ -0,0 +1,324 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_czml.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from datetime import datetime
+import io
+import json
+import math
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy import czml
+
+######################################################################################################################################################
+
+
+class TestCzml:
+    def test_to_czml_success(
+        self,
+        epoch: datetime,
+        time_interval: cesiumpy.TimeInterval,
+    ):
+
+        viewer = cesiumpy.Viewer(
+            clock_view_model=cesiumpy.ClockViewModel(
+                clock=cesiumpy.Clock(
+                    start_time=time_interval.start,
+                    stop_time=time_interval.stop,
+                    clock_range=cesiumpy.Clock.Range.LOOP_STOP,
+                    multiplier=10.0,
+                )
+            )
+        )
+
+        position = cesiumpy.SampledPositionProperty()
+        position.add_samples(
+            [0.0, 60.0],
+            np.array([[0.0, 0.0, 500e3], [1.0, 0.0, 500e3]]),
+            epoch=epoch,
+            degrees=True,
+        )
+
+        orientation = cesiumpy.SampledProperty(
+            type=cesiumpy.Quaternion,
+            samples=[(epoch, cesiumpy.Quaternion.unit(), None)],
+        )
+
+        viewer.entities.add(
+            cesiumpy.Point(
+                position=position,
+                orientation=orientation,
+                availability=cesiumpy.TimeIntervalCollection(
+                    intervals=[time_interval]
+                ),
+                path=cesiumpy.PathGraphics(width=2.0),
+                color="red",
+                name="satellite",
+            )
+        )
+        viewer.entities.add(
+            cesiumpy.Polyline(
+                positions=[0.0, 0.0, 10.0, 10.0],
+                material=cesiumpy.color.BLUE.with_alpha(0.5),
+            )
+        )
+
+        packets = json.loads(viewer.to_czml())
+
+        assert packets[0] == {
+            "id": "document",
+            "version": "1.0",
+            "clock": {
+                "interval": "2022-01-01T00:00:00Z/2022-01-01T01:00:00Z",
+                "multiplier": 10.0,
+                "range": "LOOP_STOP",
+            },
+        }
+
+        assert packets[1] == {
+            "id": "satellite",
+            "name": "satellite",
+            "availability": "2022-01-01T00:00:00Z/2022-01-01T01:00:00Z",
+            "position": {
+                "epoch": "2022-01-01T00:00:00Z",
+                "cartographicDegrees": [0.0, 0.0, 0.0, 500e3, 60.0, 1.0, 0.0, 500e3],
+            },
+            "orientation": {
+                "epoch": "2022-01-01T00:00:00Z",
+                "unitQuaternion": [0.0, 0.0, 0.0, 0.0, 1.0],
+            },
+            "path": {"width": 2.0},
+            "point": {"pixelSize": 10.0, "color": {"rgbaf": [1.0, 0.0, 0.0, 1.0]}},
+        }
+
+        assert packets[2] == {
+            "id": "entity1",
+            "polyline": {
+                "positions": {"cartographicDegrees": [0.0, 0.0, 0.0, 10.0, 10.0, 0.0]},
+                "material": {"solidColor": {"color": {"rgbaf": [0.0, 0.0, 1.0, 0.5]}}},
+            },
+        }
+
+    def test_write_czml_batch_success(self, tmp_path):
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(
+            cesiumpy.PointBatch([130.0, 140.0], [30.0, 40.0], color=["red", "blue"])
+        )
+
+        path = tmp_path / "scene.czml"
+        viewer.write_czml(path)
+
+        packets = json.loads(path.read_text())
+
+        assert [p["id"] for p in packets] == ["document", "batch0-0", "batch0-1"]
+        assert packets[2] == {
+            "id": "batch0-1",
+            "position": {"cartographicDegrees": [140.0, 40.0, 0.0]},
+            "point": {"pixelSize": 10.0, "color": {"rgbaf": [0.0, 0.0, 1.0, 1.0]}},
+        }
+
+    def test_write_czml_unsupported_warning(self):
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(
+            cesiumpy.Model(
+                uri=cesiumpy.IonResource(asset_id=1),
+                position=[0.0, 0.0, 0.0],
+                orientation=cesiumpy.Quaternion.from_axis_angle(
+                    cesiumpy.Cartesian3(0.0, 0.0, 1.0), math.pi
+                ),
+            )
+        )
+
+        fileobj = io.StringIO()
+
+        with pytest.warns(UserWarning, match="gltf cannot be exported to CZML"):
+            viewer.write_czml(fileobj)
+
+        packets = json.loads(fileobj.getvalue())
+
+        assert packets[1]["orientation"]["unitQuaternion"] == pytest.approx(
+            [0.0, 0.0, 1.0, 0.0], abs=1e-12
+        )
+        assert packets[1]["model"] == {}
+
+    def test_stream_packets_success(self, epoch: datetime):
+
+        satellite = cesiumpy.Satellite(
+            position=cesiumpy.SampledPositionProperty(),
+            sensors=[
+                cesiumpy.ConicSensor(
+                    direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+                    half_angle=0.1,
+                    name="conic",
+                ),
+                cesiumpy.ConicSensor(
+                    direction=cesiumpy.Cartesian3(1.0, 0.0, 0.0),
+                    half_angle=0.1,
+                    name="side",
+                ),
+            ],
+            name="satellite",
+        )
+
+        consumed: list[int] = []
+
+        def chunks():
+            for index in range(3):
+                consumed.append(index)
+                times = np.arange(2.0) + 2.0 * index
+                yield (
+                    times,
+                    np.column_stack([times, times, np.full(2, 500e3)]),
+                    np.tile([0.0, 0.0, 0.0, 1.0], (2, 1)),
+                )
+
+        packets = czml.stream_packets(
+            [(satellite, chunks())], epoch=epoch, degrees=True
+        )
+
+        assert [next(packets)["id"] for _ in range(4)] == [
+            "document",
+            "satellite",
+            "conic",
+            "side",
+        ]
+        assert consumed == []
+
+        assert next(packets) == {
+            "id": "satellite",
+            "position": {
+                "epoch": "2022-01-01T00:00:00Z",
+                "cartographicDegrees": [
+                    0.0, 0.0, 0.0, 500e3,
+                    1.0, 1.0, 1.0, 500e3,
+                ],
+            },
+            "orientation": {
+                "epoch": "2022-01-01T00:00:00Z",
+                "unitQuaternion": [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+            },
+        }
+        assert consumed == [0]
+
+        assert next(packets)["orientation"]["unitQuaternion"][:5] == [
+            0.0, 0.0, 0.0, 0.0, 1.0
+        ]
+        assert next(packets)["orientation"]["unitQuaternion"][:5] == pytest.approx(
+            [0.0, 0.0, math.sqrt(0.5), 0.0, math.sqrt(0.5)]
+        )
+
+        assert len(list(packets)) == 6
+        assert consumed == [0, 1, 2]
+
+    def test_stream_packets_sensor_reference_success(self):
+
+        satellite = cesiumpy.Satellite(
+            position=cesiumpy.SampledPositionProperty(),
+            sensors=[
+                cesiumpy.ConicSensor(
+                    direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+                    half_angle=0.1,
+                    name="conic",
+                )
+            ],
+            name="satellite",
+        )
+
+        satellite.add_sensor(
+            cesiumpy.ConicSensor(
+                direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+                half_angle=0.1,
+                offset=cesiumpy.Cartesian3(0.0, 0.0, 2.0),
+                name="offset",
+            )
+        )
+
+        packets = list(czml.satellite_packets(satellite))
+
+        assert packets[0] == {"id": "satellite", "name": "satellite"}
+        assert packets[1]["position"] == {"reference": "satellite#position"}
+        assert packets[1]["agi_conicSensor"]["outerHalfAngle"] == 0.1
+        assert "position" not in packets[2]
+
+        packets = list(
+            czml.sample_packets(
+                satellite,
+                ([0.0], [[1.0, 2.0, 3.0]], [[0.0, 0.0, 0.0, 1.0]]),
+                epoch=datetime(2022, 1, 1),
+            )
+        )
+
+        assert "position" not in packets[1]
+        assert packets[2]["position"]["cartesian"] == [0.0, 1.0, 2.0, 5.0]
+
+    def test_write_packets_socket_success(self, epoch: datetime):
+
+        satellite = cesiumpy.Satellite(
+            position=cesiumpy.SampledPositionProperty(), name="satellite"
+        )
+
+        chunks = [([0.0], [[1.0, 2.0, 3.0]], None), ([1.0], [[4.0, 5.0, 6.0]], None)]
+
+        (writer, reader) = socket.socketpair()
+
+        def write():
+            with writer:
+                czml.write_packets(
+                    writer, czml.stream_packets([(satellite, chunks)], epoch=epoch)
+                )
+
+        thread = threading.Thread(target=write)
+        thread.start()
+
+        with reader:
+            data = b"".join(iter(lambda: reader.recv(4096), b""))
+
+        thread.join()
+
+        packets = json.loads(data)
+
+        assert [p["position"]["cartesian"] for p in packets[2:]] == [
+            [0.0, 1.0, 2.0, 3.0],
+            [1.0, 4.0, 5.0, 6.0],
+        ]
+
+    def test_stream_packets_shape_failure(self, epoch: datetime):
+
+        satellite = cesiumpy.Satellite(
+            position=cesiumpy.SampledPositionProperty(), name="satellite"
+        )
+
+        with pytest.raises(ValueError, match="values must be of shape"):
+            list(
+                czml.sample_packets(
+                    satellite, ([0.0, 1.0], [[1.0, 2.0, 3.0]], None), epoch=epoch
+                )
+            )
+
+    def test_color_rgba_success(self):
+
+        assert cesiumpy.color.ORANGE.rgba == (1.0, 165 / 255.0, 0.0, 1.0)
+        assert cesiumpy.color.RED.with_alpha(0.5).rgba == (1.0, 0.0, 0.0, 0.5)
+        assert cesiumpy.color.Color.from_string("#00f8").rgba == (
+            0.0,
+            0.0,
+            1.0,
+            0x88 / 255.0,
+        )
+
+        with pytest.raises(ValueError, match="Unable to convert CSS color"):
+            cesiumpy.color.Color.from_string("hsl(0, 100%, 50%)").rgba
+
+
+######################################################################################################################################################
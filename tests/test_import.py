@@ -0,0 +1,60 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_import.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import subprocess
+import sys
+
+import pytest
+
+import cesiumpy
+
+######################################################################################################################################################
+
+
+class TestImport:
+    def test_import_lazy_success(self):
+
+        script = (
+            "import sys; import cesiumpy; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('cesiumpy.', 'geopy', 'shapely', 'numpy', 'traitlets'))))"
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+        assert output.stdout.strip() == "['cesiumpy.version']"
+
+    def test_getattr_success(self, monkeypatch):
+
+        # instantiated on first access, then cached in the module
+        monkeypatch.delitem(vars(cesiumpy), "color", raising=False)
+
+        color = cesiumpy.color
+        assert isinstance(color, cesiumpy.entities.color.ColorFactory)
+        assert vars(cesiumpy)["color"] is color
+        assert cesiumpy.color is color
+
+        assert cesiumpy.Viewer is cesiumpy.viewer.Viewer
+        assert cesiumpy.color.RED.generate_script() == "Cesium.Color.RED"
+        assert cesiumpy.io is cesiumpy.extension.io
+
+        assert "Viewer" in dir(cesiumpy)
+        assert "countries" in cesiumpy.__all__
+
+    def test_getattr_failure(self):
+
+        with pytest.raises(AttributeError, match="has no attribute 'X'"):
+            cesiumpy.X
+
+
+######################################################################################################################################################
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import numpy as np
 import pytest
 
 
@@ -17,5 +18,70 @@ class TestMath:
         self.assertEqual(rad.script, "Cesium.Math.RADIANS_PER_DEGREE")
 
 
+class TestConverters:
+    def test_geodetic_to_cartesian_success(self):
+
+        result = cesiumpy.math.geodetic_to_cartesian([0.0, 90.0], [0.0, 0.0], [0.0, 10.0])
+
+        assert result.shape == (2, 3)
+        assert result[0].tolist() == [6378137.0, 0.0, 0.0]
+        assert result[1] == pytest.approx([0.0, 6378147.0, 0.0], abs=1e-6)
+
+
+
+class TestSimplification:
+    def test_douglas_peucker_success(self):
+
+        points = [[0.0, 0.0], [1.0, 0.001], [2.0, 0.0], [3.0, 1.0], [4.0, 0.0]]
+
+        result = cesiumpy.math.douglas_peucker(points, 0.01)
+        assert result.tolist() == [0, 2, 3, 4]
+
+        result = cesiumpy.math.douglas_peucker(points, 10.0)
+        assert result.tolist() == [0, 4]
+
+        result = cesiumpy.math.douglas_peucker(points, 0.0)
+        assert result.tolist() == [0, 1, 2, 3, 4]
+
+    def test_visvalingam_success(self):
+
+        points = [[0.0, 0.0], [1.0, 0.001], [2.0, 0.0], [3.0, 1.0], [4.0, 0.0]]
+
+        result = cesiumpy.math.visvalingam(points, 0.1)
+        assert result.tolist() == [0, 2, 3, 4]
+
+        result = cesiumpy.math.visvalingam(points, 10.0)
+        assert result.tolist() == [0, 4]
+
+    def test_simplify_ring_success(self):
+
+        square = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]
+
+        for algorithm in cesiumpy.math.SIMPLIFY_ALGORITHMS:
+            result = cesiumpy.math.simplify(square, 10.0, algorithm=algorithm)
+            assert len(result) >= 4
+            assert (result[0], result[-1]) == (0, 4)
+
+    def test_simplify_error_bound_success(self):
+
+        t = np.linspace(0.0, np.pi, 5001)
+        points = np.column_stack([t, np.sin(t)])
+
+        result = cesiumpy.math.douglas_peucker(points, 0.001)
+
+        # interpolated line stays within tolerance of every point
+        interpolated = np.interp(points[:, 0], points[result, 0], points[result, 1])
+        assert np.abs(interpolated - points[:, 1]).max() <= 0.001
+        assert len(result) < 100
+
+    def test_zoom_tolerance_success(self):
+
+        assert cesiumpy.math.zoom_tolerance(0) == 360.0 / 256.0
+        assert cesiumpy.math.zoom_tolerance("country") == cesiumpy.math.zoom_tolerance(6)
+
+        with pytest.raises(ValueError, match="zoom must be one of"):
+            cesiumpy.math.zoom_tolerance("x")
+
+
 if __name__ == "__main__":
     nose.runmodule(argv=[__file__, "-vvs", "-x", "--pdb", "--pdb-failure"], exit=False)
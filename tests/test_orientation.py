@@ -6,9 +6,15 @@
 
 ######################################################################################################################################################
 
+import math
+
+import numpy as np
+import pytest
+
 from cesiumpy import Cartesian3
 from cesiumpy import Quaternion
 from cesiumpy import HeadingPitchRoll
+from cesiumpy import orientation
 
 ######################################################################################################################################################
 
@@ -23,25 +29,36 @@ class TestQuaternion:
 
     def test_multiply_success(self):
 
-        assert (
-            Quaternion(0.0, 0.0, 0.0, 1.0) * Quaternion(0.0, 1.0, 0.0, 0.0)
-        ).generate_script() == "Cesium.Quaternion.multiply(new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0), new Cesium.Quaternion(0.0, 1.0, 0.0, 0.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0))"
+        q = Quaternion(0.0, 0.0, 0.0, 1.0) * Quaternion(0.0, 1.0, 0.0, 0.0)
 
-    def test_from_axis_angle_success(self):
+        assert q._pack() == (0.0, 1.0, 0.0, 0.0)
 
-        assert (
-            Quaternion.from_axis_angle(Cartesian3(0.0, 0.0, 1.0), 1.2).generate_script()
-            == "Cesium.Quaternion.fromAxisAngle(new Cesium.Cartesian3(0.0, 0.0, 1.0), 1.2)"
+        # quarter turn around z, then around x
+        q_x = Quaternion.from_axis_angle(Cartesian3(1.0, 0.0, 0.0), math.pi / 2.0)
+        q_z = Quaternion.from_axis_angle(Cartesian3(0.0, 0.0, 1.0), math.pi / 2.0)
+
+        q = q_z * q_x
+
+        assert q._pack() == pytest.approx((0.5, -0.5, 0.5, 0.5))
+        assert q.generate_script() == "new Cesium.Quaternion({}, {}, {}, {})".format(
+            *q._pack()
         )
 
+    def test_from_axis_angle_success(self):
+
+        assert Quaternion.from_axis_angle(
+            Cartesian3(0.0, 0.0, 2.0), 1.2
+        )._pack() == pytest.approx((0.0, 0.0, math.sin(0.6), math.cos(0.6)))
+
     def test_from_heading_pitch_roll_success(self):
 
-        assert (
-            Quaternion.from_heading_pitch_roll(
-                HeadingPitchRoll(1.0, 2.0, 3.0)
-            ).generate_script()
-            == "Cesium.Quaternion.fromHeadingPitchRoll(new Cesium.HeadingPitchRoll(1.0, 2.0, 3.0))"
-        )
+        assert Quaternion.from_heading_pitch_roll(
+            HeadingPitchRoll(0.0, math.pi, 0.0)
+        )._pack() == pytest.approx((0.0, -1.0, 0.0, 0.0), abs=1e-12)
+
+        assert Quaternion.from_heading_pitch_roll(
+            HeadingPitchRoll(math.pi / 2.0, 0.0, 0.0)
+        )._pack() == pytest.approx((0.0, 0.0, -math.sqrt(0.5), math.sqrt(0.5)))
 
 
 ######################################################################################################################################################
@@ -57,18 +74,63 @@ class TestHeadingPitchRoll:
 
     def test_from_degrees_success(self):
 
-        assert (
-            HeadingPitchRoll.from_degrees(1.0, 2.0, 3.0).generate_script()
-            == "Cesium.HeadingPitchRoll.fromDegrees(1.0, 2.0, 3.0)"
+        hpr = HeadingPitchRoll.from_degrees(90.0, 45.0, 180.0)
+
+        assert (hpr.heading, hpr.pitch, hpr.roll) == pytest.approx(
+            (math.pi / 2.0, math.pi / 4.0, math.pi)
         )
 
     def test_from_quaternion_success(self):
 
-        assert (
-            HeadingPitchRoll.from_quaternion(
-                Quaternion(0.0, 0.0, 0.0, 1.0)
-            ).generate_script()
-            == "Cesium.HeadingPitchRoll.fromQuaternion(new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0))"
+        hpr = HeadingPitchRoll.from_quaternion(
+            Quaternion.from_heading_pitch_roll(HeadingPitchRoll(0.1, 0.2, 0.3))
+        )
+
+        assert (hpr.heading, hpr.pitch, hpr.roll) == pytest.approx((0.1, 0.2, 0.3))
+
+
+######################################################################################################################################################
+
+
+class TestPacked:
+    def test_heading_pitch_roll_success(self):
+
+        angles = np.array([[0.1, 0.2, 0.3], [-1.0, 0.5, 2.0], [3.0, -1.2, -0.4]])
+
+        quaternions = orientation.heading_pitch_roll_to_packed(*angles.T)
+
+        assert quaternions.shape == (3, 4)
+        np.testing.assert_allclose(np.linalg.norm(quaternions, axis=1), 1.0)
+        np.testing.assert_allclose(
+            orientation.packed_to_heading_pitch_roll(quaternions), angles
+        )
+
+        for (row, q) in zip(angles, quaternions):
+            assert Quaternion.from_heading_pitch_roll(
+                HeadingPitchRoll(*row)
+            )._pack() == pytest.approx(tuple(q))
+
+    def test_multiply_rotate_success(self):
+
+        q = orientation.axis_angle_to_packed(
+            [[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]], [math.pi / 2.0, math.pi / 2.0]
+        )
+
+        np.testing.assert_allclose(
+            orientation.rotate_packed(q, [1.0, 0.0, 1.0]),
+            [[0.0, 1.0, 1.0], [1.0, -1.0, 0.0]],
+            atol=1e-12,
+        )
+
+        # rotating by a product is rotating by right, then by left
+        product = orientation.multiply_packed(q[0], q[1])
+
+        np.testing.assert_allclose(
+            orientation.rotate_packed(product, [0.0, 1.0, 0.0]),
+            orientation.rotate_packed(
+                q[0], orientation.rotate_packed(q[1], [0.0, 1.0, 0.0])
+            ),
+            atol=1e-12,
         )
 
 
@@ -0,0 +1,101 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_primitives.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy.util.common import to_jsfloat64array
+
+######################################################################################################################################################
+
+
+class TestPrimitiveCollection:
+    def test_point_primitive_collection_success(self):
+
+        viewer = cesiumpy.Viewer()
+
+        viewer.scene.primitives.add(
+            cesiumpy.PointPrimitiveCollection(
+                np.array([0.0, 90.0]),
+                np.array([0.0, 0.0]),
+                size=[5.0, 6.0],
+                color=cesiumpy.color.RED,
+            )
+        )
+
+        script = viewer.script[-1]
+
+        assert script.startswith(
+            "widget.scene.primitives.add((function (data, colors) { "
+            "const collection = new Cesium.PointPrimitiveCollection(); "
+        )
+        assert "pixelSize: data[i + 3], color: colors[0]" in script
+
+        data = np.column_stack(
+            [
+                cesiumpy.math.geodetic_to_cartesian(
+                    np.array([0.0, 90.0]), np.zeros(2), np.zeros(2)
+                ),
+                [5.0, 6.0],
+            ]
+        )
+
+        assert script.endswith(
+            "({data}, [Cesium.Color.RED]));".format(
+                data=to_jsfloat64array(data.ravel())
+            )
+        )
+
+    def test_label_collection_success(self):
+
+        collection = cesiumpy.LabelCollection(["a", "b"], [0.0, 1.0], [0.0, 1.0])
+
+        script = collection.generate_script()
+
+        assert "text: text[j], scale: 1.0" in script
+        assert script.endswith(', [], ["a", "b"])')
+
+    def test_billboard_collection_success(self):
+
+        collection = cesiumpy.BillboardCollection([0.0], [0.0], image="pin.png")
+
+        assert collection.generate_script().endswith(', [], "pin.png")')
+
+    def test_polyline_collection_success(self):
+
+        collection = cesiumpy.PolylineCollection(
+            [[0.0, 0.0, 10.0, 10.0], np.array([[1.0, 1.0, 5.0], [2.0, 2.0, 5.0]])],
+            width=2.0,
+            color=["red", "blue"],
+        )
+
+        assert len(collection) == 2
+        assert collection.positions[1].tolist() == [[1.0, 1.0, 5.0], [2.0, 2.0, 5.0]]
+
+        script = collection.generate_script()
+
+        assert "const collection = new Cesium.PolylineCollection(); " in script
+        assert (
+            "width: 2.0, "
+            'material: Cesium.Material.fromType("Color", {color: colors[data[i]]})'
+        ) in script
+        assert to_jsfloat64array([0.0, 2.0, 4.0]) in script
+        assert script.endswith("[Cesium.Color.RED, Cesium.Color.BLUE])")
+
+    def test_primitive_collection_failure(self):
+
+        with pytest.raises(ValueError, match="y length must be 2"):
+            cesiumpy.PointPrimitiveCollection([0.0, 1.0], [0.0])
+
+        msg = "must be a list consists from longitude"
+        with pytest.raises(ValueError, match=msg):
+            cesiumpy.PolylineCollection([[0.0, 0.0, 200.0, 0.0]])
+
+
+######################################################################################################################################################
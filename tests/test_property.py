@@ -0,0 +1,363 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_property.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from datetime import datetime, timedelta
+import math
+
+import numpy as np
+import pytest
+
+import cesiumpy
+
+######################################################################################################################################################
+
+
+class TestSampledProperty:
+    def test_constructor_success(
+        self,
+        instants: list[datetime],
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        assert len(sampled_position) == len(instants)
+        assert sampled_position.epoch == instants[0]
+
+        assert sampled_position.times.dtype == np.float64
+        assert sampled_position.times[1] == 30.0
+        assert sampled_position.values.shape == (len(instants), 3)
+        assert sampled_position.values[1].tolist() == [1.0, 0.0, 500e3]
+
+    def test_samples_success(
+        self,
+        instants: list[datetime],
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        (time, position, derivatives) = sampled_position.samples[2]
+
+        assert time == instants[2]
+        assert position == cesiumpy.Cartesian3.fromDegrees(2.0, 0.0, 500e3)
+        assert position._is_degrees
+        assert derivatives is None
+
+    def test_add_samples_success(
+        self,
+        epoch: datetime,
+    ):
+
+        sampled_position = cesiumpy.SampledPositionProperty()
+
+        sampled_position.add_samples(
+            times=np.arange(100, dtype=np.float64),
+            positions=np.column_stack(
+                [np.linspace(0.0, 99.0, 100), np.zeros(100), np.full(100, 500e3)]
+            ),
+            epoch=epoch,
+            degrees=True,
+        )
+
+        assert len(sampled_position) == 100
+        assert sampled_position.samples[99][0] == epoch + timedelta(seconds=99)
+        assert sampled_position.samples[99][1] == cesiumpy.Cartesian3.fromDegrees(
+            99.0, 0.0, 500e3
+        )
+
+    def test_add_samples_datetime64_success(self):
+
+        sampled_orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+
+        sampled_orientation.add_samples(
+            times=np.array(
+                ["2022-01-01T00:00:00", "2022-01-01T00:01:00"], dtype="datetime64[s]"
+            ),
+            values=[[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 0.0]],
+        )
+
+        assert sampled_orientation.times.tolist() == [0.0, 60.0]
+        assert sampled_orientation.samples[1][0].isoformat() == (
+            "2022-01-01T00:01:00+00:00"
+        )
+
+    def test_add_samples_mixed_times_success(
+        self,
+        epoch: datetime,
+    ):
+
+        sampled_position = cesiumpy.SampledPositionProperty()
+
+        # naive datetimes are regarded as UTC, as numpy datetimes are
+        sampled_position.add_sample(
+            time=datetime(2022, 1, 1), position=cesiumpy.Cartesian3(1.0, 2.0, 3.0)
+        )
+        sampled_position.add_samples(
+            times=np.array(["2022-01-01T00:01:00"], dtype="datetime64[s]"),
+            positions=[[4.0, 5.0, 6.0]],
+        )
+        sampled_position.add_samples(
+            times=[datetime(2022, 1, 1, 0, 2)], positions=[[7.0, 8.0, 9.0]]
+        )
+
+        assert sampled_position.epoch == epoch
+        assert sampled_position.times.tolist() == [0.0, 60.0, 120.0]
+        assert sampled_position.get_value(datetime(2022, 1, 1, 0, 0, 30)).x == 2.5
+
+    def test_add_samples_failure(
+        self,
+        epoch: datetime,
+    ):
+
+        sampled_position = cesiumpy.SampledPositionProperty()
+
+        with pytest.raises(ValueError, match="values must be of shape"):
+            sampled_position.add_samples(
+                times=[0.0, 1.0],
+                positions=[[0.0, 0.0], [1.0, 0.0]],
+                epoch=epoch,
+            )
+
+    def test_heading_pitch_roll_values_success(
+        self,
+        instants: list[datetime],
+        sampled_orientation: cesiumpy.SampledProperty,
+    ):
+
+        assert len(sampled_orientation) == len(instants)
+
+        # pitch of 180 degrees
+        np.testing.assert_allclose(
+            sampled_orientation.values,
+            np.tile([0.0, -1.0, 0.0, 0.0], (len(instants), 1)),
+            atol=1e-12,
+        )
+
+    def test_generate_script_success(
+        self,
+        epoch: datetime,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        sampled_position = cesiumpy.SampledPositionProperty(
+            name="position",
+            samples=[
+                (epoch, cesiumpy.Cartesian3.fromDegrees(1.0, 2.0, 3.0), None),
+            ],
+            packed=False,
+        )
+
+        assert sampled_position.generate_script(widget=viewer) == "widget.position"
+        assert viewer._property_map["position"] == [
+            "widget.position = new Cesium.SampledProperty(Cesium.Cartesian3);",
+            'widget.position.addSample("2022-01-01T00:00:00+00:00", Cesium.Cartesian3.fromDegrees(1.0, 2.0, 3.0));',
+        ]
+
+    def test_generate_script_packed_success(
+        self,
+        epoch: datetime,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        sampled_orientation = cesiumpy.SampledProperty(
+            type=cesiumpy.Quaternion,
+            name="orientation",
+        )
+
+        sampled_orientation.add_samples(
+            times=[0.0, 30.0],
+            values=[[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 0.0]],
+            epoch=epoch,
+        )
+
+        assert (
+            sampled_orientation.generate_script(widget=viewer) == "widget.orientation"
+        )
+
+        scripts = viewer._property_map["orientation"]
+
+        assert len(scripts) == 2
+        assert scripts[1] == (
+            "widget.orientation.addSamplesPackedArray({samples}, {epoch});".format(
+                samples=cesiumpy.util.common.to_jsfloat64array(
+                    [0.0, 0.0, 0.0, 0.0, 1.0, 30.0, 0.0, 0.0, 1.0, 0.0]
+                ),
+                epoch='Cesium.JulianDate.fromIso8601("2022-01-01T00:00:00+00:00")',
+            )
+        )
+
+    def test_generate_script_packed_degrees_success(
+        self,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        sampled_position.generate_script(widget=viewer)
+
+        scripts = viewer._property_map[sampled_position.name]
+
+        assert len(scripts) == 2
+        assert ".addSamplesPackedArray(new Float64Array(" in scripts[1]
+
+
+    def test_get_value_linear_success(
+        self,
+        epoch: datetime,
+    ):
+
+        sampled_position = cesiumpy.SampledPositionProperty()
+        sampled_position.add_samples(
+            times=[0.0, 10.0, 20.0],
+            positions=[[0.0, 0.0, 0.0], [10.0, 20.0, 30.0], [0.0, 0.0, 0.0]],
+            epoch=epoch,
+        )
+
+        value = sampled_position.get_value(epoch + timedelta(seconds=15.0))
+
+        assert (value.x, value.y, value.z) == (5.0, 10.0, 15.0)
+
+        assert sampled_position.get_value(epoch + timedelta(seconds=10.0)).y == 20.0
+        assert sampled_position.get_value(epoch + timedelta(seconds=21.0)) is None
+        assert sampled_position.get_value(epoch - timedelta(seconds=1.0)) is None
+
+    def test_get_values_lagrange_success(
+        self,
+        epoch: datetime,
+    ):
+
+        times = np.arange(0.0, 100.0, 10.0)
+
+        # cubic polynomials are reproduced by a polynomial of degree 5
+        sampled_position = cesiumpy.SampledPositionProperty(
+            interpolation_algorithm=cesiumpy.InterpolationAlgorithm.LAGRANGE,
+            interpolation_degree=5,
+        )
+        sampled_position.add_samples(
+            times=times[::-1],
+            positions=np.column_stack([times, times**2, times**3])[::-1],
+            epoch=epoch,
+        )
+
+        queries = np.array([1.0, 25.0, 55.5, 89.0])
+
+        np.testing.assert_allclose(
+            sampled_position.get_values(queries, epoch=epoch),
+            np.column_stack([queries, queries**2, queries**3]),
+        )
+
+        sampled_position.set_interpolation_options(
+            interpolation_algorithm=cesiumpy.InterpolationAlgorithm.LINEAR
+        )
+
+        assert sampled_position.get_values([25.0], epoch=epoch)[0, 1] == 650.0
+
+    def test_get_value_quaternion_success(
+        self,
+        epoch: datetime,
+    ):
+
+        sampled_orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+        sampled_orientation.add_samples(
+            times=[0.0, 10.0],
+            values=[[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, math.sin(0.5), math.cos(0.5)]],
+            epoch=epoch,
+        )
+
+        value = sampled_orientation.get_value(epoch + timedelta(seconds=5.0))
+
+        # half of the rotation around z
+        assert value._pack() == pytest.approx(
+            (0.0, 0.0, math.sin(0.25), math.cos(0.25))
+        )
+
+    def test_generate_script_interpolation_success(
+        self,
+        epoch: datetime,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        sampled_position = cesiumpy.SampledPositionProperty(
+            name="position",
+            interpolation_algorithm=cesiumpy.InterpolationAlgorithm.HERMITE,
+            interpolation_degree=3,
+        )
+
+        sampled_position.generate_script(widget=viewer)
+
+        assert viewer._property_map["position"] == [
+            "widget.position = new Cesium.SampledProperty(Cesium.Cartesian3);",
+            "widget.position.setInterpolationOptions({interpolationAlgorithm: Cesium.HermitePolynomialApproximation, interpolationDegree: 3});",
+        ]
+
+        # cached scripts are replaced once the options change
+        sampled_position.set_interpolation_options(
+            interpolation_algorithm=cesiumpy.InterpolationAlgorithm.LAGRANGE,
+            interpolation_degree=5,
+        )
+
+        viewer = cesiumpy.Viewer()
+        sampled_position.generate_script(widget=viewer)
+
+        assert viewer._property_map["position"][1] == (
+            "widget.position.setInterpolationOptions({interpolationAlgorithm: Cesium.LagrangePolynomialApproximation, interpolationDegree: 5});"
+        )
+
+    def test_decimate_success(
+        self,
+        epoch: datetime,
+    ):
+
+        times = np.arange(0.0, 600.0)
+
+        # 1 Hz circle of 7000 km radius, one turn in 6000 s
+        angles = 2.0 * np.pi * times / 6000.0
+        positions = 7000e3 * np.column_stack(
+            [np.cos(angles), np.sin(angles), np.zeros_like(times)]
+        )
+
+        for (algorithm, interpolation_algorithm) in [
+            ("douglas_peucker", None),
+            ("refine", None),
+            ("refine", cesiumpy.InterpolationAlgorithm.LAGRANGE),
+        ]:
+
+            sampled_position = cesiumpy.SampledPositionProperty(
+                interpolation_algorithm=interpolation_algorithm,
+                interpolation_degree=5,
+            )
+            sampled_position.add_samples(times, positions, epoch=epoch)
+
+            decimation = sampled_position.decimate(
+                tolerance_m=100.0, algorithm=algorithm
+            )
+
+            assert decimation.size_before == 600
+            assert decimation.size_after == len(sampled_position)
+            assert decimation.compression_ratio > 5.0
+            assert decimation.max_error <= 100.0
+
+            # first and last samples are kept
+            assert sampled_position.times[[0, -1]].tolist() == [0.0, 599.0]
+
+            np.testing.assert_array_less(
+                np.linalg.norm(
+                    sampled_position.get_values(times, epoch=epoch) - positions, axis=1
+                ),
+                100.0 + 1e-6,
+            )
+
+    def test_decimate_failure(self):
+
+        sampled_position = cesiumpy.SampledPositionProperty()
+
+        with pytest.raises(ValueError, match="algorithm must be one of"):
+            sampled_position.decimate(tolerance_m=1.0, algorithm="unknown")
+
+
+######################################################################################################################################################
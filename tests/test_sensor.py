@@ -0,0 +1,205 @@
+######################################################################################################################################################
+
+# @project        CesiumPy
+# @file           tests/test_sensor.py
+# @license        Apache 2.0
+
+######################################################################################################################################################
+
+from datetime import datetime
+import math
+
+import numpy as np
+import pytest
+
+import cesiumpy
+
+######################################################################################################################################################
+
+
+@pytest.fixture
+def satellite(epoch: datetime) -> cesiumpy.Satellite:
+
+    position = cesiumpy.SampledPositionProperty()
+    position.add_samples(
+        [0.0, 60.0], [[0.0, 0.0, 500e3], [1.0, 0.0, 500e3]], epoch=epoch, degrees=True
+    )
+
+    # identity, then a quarter turn around z
+    orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+    orientation.add_samples(
+        [0.0, 60.0],
+        [[0.0, 0.0, 0.0, 1.0], [0.0, 0.0, math.sqrt(0.5), math.sqrt(0.5)]],
+        epoch=epoch,
+    )
+
+    return cesiumpy.Satellite(position=position, orientation=orientation)
+
+
+class TestSensor:
+    def test_generate_orientation_success(self, satellite: cesiumpy.Satellite):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(1.0, 0.0, 0.0), half_angle=0.1
+        )
+
+        orientation = sensor._generate_orientation(satellite)
+
+        assert orientation.epoch == satellite.orientation.epoch
+        assert orientation.times.tolist() == [0.0, 60.0]
+
+        # body z rotated onto body x, then the body attitude
+        np.testing.assert_allclose(
+            orientation.values,
+            [[0.0, math.sqrt(0.5), 0.0, math.sqrt(0.5)], [-0.5, 0.5, 0.5, 0.5]],
+            atol=1e-12,
+        )
+
+    def test_generate_orientation_boresight_success(
+        self, satellite: cesiumpy.Satellite
+    ):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, 2.0), half_angle=0.1
+        )
+
+        orientation = sensor._generate_orientation(satellite)
+
+        np.testing.assert_array_equal(orientation.values, satellite.orientation.values)
+
+    def test_render_success(self, satellite: cesiumpy.Satellite):
+
+        satellite.add_sensor(
+            cesiumpy.ConicSensor(
+                direction=cesiumpy.Cartesian3(0.0, 0.0, -1.0), half_angle=0.1
+            )
+        )
+        satellite.add_sensor(
+            cesiumpy.RectangularSensor(
+                direction=cesiumpy.Cartesian3(0.0, 1.0, 0.0),
+                radius=1e3,
+                x_half_angle=0.1,
+                y_half_angle=0.1,
+            )
+        )
+
+        viewer = cesiumpy.Viewer()
+
+        for sensor in satellite.sensors:
+            sensor.render(viewer, satellite)
+
+        html = viewer.to_html()
+
+        assert "Cesium.Quaternion.multiply" not in html
+        assert "Cesium.Quaternion.fromAxisAngle" not in html
+        # one shared position, one orientation per sensor
+        assert html.count("addSamplesPackedArray") == 3
+        assert html.count(f"{satellite.position.name} = new Cesium.SampledProperty") == 1
+
+    def test_generate_position_success(self, satellite: cesiumpy.Satellite):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0), half_angle=0.1
+        )
+
+        assert sensor._generate_position(satellite) is satellite.position
+
+    def test_generate_position_offset_success(self, satellite: cesiumpy.Satellite):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+            half_angle=0.1,
+            offset=cesiumpy.Cartesian3(1.0, 0.0, 0.0),
+        )
+
+        position = sensor._generate_position(satellite)
+
+        assert position is not satellite.position
+        assert position.times.tolist() == [0.0, 60.0]
+
+        track = cesiumpy.math.geodetic_to_cartesian(
+            [0.0, 1.0], [0.0, 0.0], [500e3, 500e3]
+        )
+
+        # body x is fixed x, then fixed y after the quarter turn
+        np.testing.assert_allclose(
+            position.values - track, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], atol=1e-6
+        )
+
+    def test_generate_position_offset_interpolation_success(
+        self, satellite: cesiumpy.Satellite
+    ):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+            half_angle=0.1,
+            offset=cesiumpy.Cartesian3(1.0, 0.0, 0.0),
+        )
+
+        # attitude samples at other times than the position samples
+        satellite.orientation.add_samples(
+            [-30.0, 30.0],
+            [
+                [0.0, 0.0, 0.0, 1.0],
+                [0.0, 0.0, math.sin(math.pi / 8.0), math.cos(math.pi / 8.0)],
+            ],
+            epoch=satellite.orientation.epoch,
+        )
+
+        position = sensor._generate_position(satellite)
+
+        track = cesiumpy.math.geodetic_to_cartesian(
+            [0.0, 1.0], [0.0, 0.0], [500e3, 500e3]
+        )
+
+        np.testing.assert_allclose(
+            position.values - track, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], atol=1e-6
+        )
+
+    def test_generate_position_offset_failure(self, satellite: cesiumpy.Satellite):
+
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(0.0, 0.0, 1.0),
+            half_angle=0.1,
+            offset=cesiumpy.Cartesian3(1.0, 0.0, 0.0),
+        )
+
+        satellite.position.add_samples(
+            [120.0], [[2.0, 0.0, 500e3]], epoch=satellite.position.epoch, degrees=True
+        )
+
+        with pytest.raises(ValueError, match="Sensor offset requires"):
+            sensor._generate_position(satellite)
+
+
+
+class TestSatellite:
+    def test_render_decimation_success(self, epoch: datetime):
+
+        times = np.arange(0.0, 100.0)
+
+        position = cesiumpy.SampledPositionProperty()
+        position.add_samples(
+            times,
+            np.column_stack(
+                [times * 1e-3, np.zeros_like(times), np.full_like(times, 500e3)]
+            ),
+            epoch=epoch,
+            degrees=True,
+        )
+
+        satellite = cesiumpy.Satellite(
+            position=position,
+            model=cesiumpy.IonResource(asset_id=1),
+            decimation_tolerance_m=1.0,
+        )
+
+        viewer = cesiumpy.Viewer()
+        satellite.render(viewer)
+        satellite.render(viewer)
+
+        assert satellite.decimation.size_before == 100
+        assert satellite.decimation.size_after == len(position) < 100
+
+
+######################################################################################################################################################
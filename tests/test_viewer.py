@@ -6,6 +6,7 @@
 
 ######################################################################################################################################################
 
+import io
 from typing import Optional
 
 import cesiumpy
@@ -138,4 +139,154 @@ class TestViewer:
             f.write(viewer.to_html())
 
 
+class TestViewerHTML:
+    def test_write_html_success(
+        self,
+        tmp_path,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+
+        html = viewer.to_html()
+
+        # shared property is defined once, before the first entity using it
+        assert html.count(f"widget.{sampled_position.name} = ") == 1
+        assert html.index(f"widget.{sampled_position.name} = ") < html.index(
+            "widget.entities.add("
+        )
+
+        fileobj = io.StringIO()
+        viewer.write_html(fileobj)
+
+        assert fileobj.getvalue() == html
+
+        path = tmp_path / "viewer.html"
+        viewer.write_html(path)
+
+        with open(path) as f:
+            assert f.read() == html
+
+        # lines end with a single os.linesep
+        with open(path, newline="") as f:
+            assert "\r\r\n" not in f.read()
+
+        assert "\r" not in html
+
+    def test_write_html_cache_success(self, tmp_path):
+
+        viewer = cesiumpy.Viewer()
+
+        points = [cesiumpy.Point(position=(i, 2.0, 3.0)) for i in range(10)]
+        viewer.entities.add(points)
+
+        # streaming writes do not keep the scripts they generate
+        viewer.write_html(tmp_path / "viewer.html")
+        assert viewer.entities._script_cache == {}
+
+        # but reuse the ones cached by to_html
+        viewer.to_html()
+        assert len(viewer.entities._script_cache) == 10
+
+        viewer.entities.add(cesiumpy.Point(position=(0.0, 0.0, 0.0)))
+        points[0].position.x = 4.0
+
+        fileobj = io.StringIO()
+        viewer.write_html(fileobj)
+
+        assert fileobj.getvalue() == viewer.to_html()
+        assert len(viewer.entities._script_cache) == 11
+
+        viewer.entities.add(cesiumpy.Point(position=(1.0, 1.0, 0.0)))
+        points[1].position.x = 5.0
+        viewer.write_html(io.StringIO())
+
+        # stale scripts are released
+        assert len(viewer.entities._script_cache) == 10
+
+    def test_write_html_property_cache_success(
+        self,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+
+        # streaming writes do not keep the property scripts either
+        viewer.write_html(io.StringIO())
+        assert sampled_position._scripts_cache is None
+
+        # properties are not watched, their changes are rendered nonetheless
+        sampled_position.interpolation_degree = 5
+
+        fileobj = io.StringIO()
+        viewer.write_html(fileobj)
+
+        assert "interpolationDegree: 5" in fileobj.getvalue()
+        assert "interpolationDegree: 5" in viewer.to_html()
+        assert sampled_position._scripts_cache is not None
+
+        sampled_position.interpolation_degree = 7
+
+        assert "interpolationDegree: 7" in viewer.to_html()
+
+    def test_script_cache_success(
+        self,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+
+        viewer = cesiumpy.Viewer()
+
+        point = cesiumpy.Point(position=(1.0, 2.0, 3.0))
+        tracked_point = cesiumpy.Point(position=sampled_position)
+
+        viewer.entities.add(point)
+        viewer.entities.add(tracked_point)
+
+        html = viewer.to_html()
+        script = viewer.entities._script_cache[id(point)][2]
+
+        # unchanged entities are reused, with the properties they use
+        assert viewer.to_html() == html
+        assert viewer.entities._script_cache[id(point)][2] is script
+
+        # nested change invalidates holder
+        point.position.x = 4.0
+
+        assert "Cesium.Cartesian3.fromDegrees(4.0, 2.0, 3.0)" in viewer.to_html()
+
+        point.color = cesiumpy.color.RED
+
+        html = viewer.to_html()
+
+        assert "color: Cesium.Color.RED" in html
+
+        # in place changes of sampled properties too
+        sampled_position.add_sample(
+            time=sampled_position.samples[-1][0],
+            position=cesiumpy.Cartesian3.fromDegrees(0.0, 0.0, 0.0),
+        )
+
+        assert viewer.to_html() != html
+
+    def test_add_generator_success(self):
+
+        viewer = cesiumpy.Viewer()
+
+        chunks = (
+            [cesiumpy.Point(position=(float(i), float(j), 0.0)) for j in range(3)]
+            for i in range(4)
+        )
+
+        # generators of entities or of lists of entities are consumed
+        viewer.entities.add(chunks)
+        viewer.entities.add(cesiumpy.Point(position=(i, 0.0, 0.0)) for i in range(2))
+
+        assert len(viewer.entities) == 14
+        assert "Cesium.Cartesian3.fromDegrees(3.0, 2.0, 0.0)" in viewer.to_html()
+
+
 ######################################################################################################################################################
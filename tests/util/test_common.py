@@ -64,6 +64,33 @@ class TestConverter:
         self.assertEqual("false", com.to_jsscalar(False))
         self.assertEqual("[false, true]", com.to_jsscalar([False, True]))
 
+    def test_to_jsobject_success(self):
+        assert com.to_jsobject({}) == [""]
+        assert com.to_jsobject({"a": None}) == [""]
+        assert "".join(
+            com.to_jsobject({"pixel_size": 1.0, "show": True, "name": None})
+        ) == "{pixelSize: 1.0, show: true}"
+
+    def test_generate_script_emitter_success(self):
+        import cesiumpy
+
+        point = cesiumpy.Point(
+            position=(1.0, 2.0, 0.0), color=cesiumpy.color.RED, pixel_size=5
+        )
+        point.name = "p"
+
+        # compiled emitter follows _property_dict
+        assert point.generate_script() == "".join(
+            com.to_jsobject(point._property_dict)
+        )
+        assert point.generate_script() == (
+            '{name: "p", position: Cesium.Cartesian3.fromDegrees(1.0, 2.0, 0.0), '
+            "point: {pixelSize: 5.0, color: Cesium.Color.RED}}"
+        )
+
+        color = cesiumpy.color.Color(0.1, 0.2, 0.3)
+        assert color.generate_script() == "new Cesium.Color(0.1, 0.2, 0.3)"
+
 
 if __name__ == "__main__":
     nose.runmodule(argv=[__file__, "-vvs", "-x", "--pdb", "--pdb-failure"], exit=False)